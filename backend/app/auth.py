@@ -1,11 +1,17 @@
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Hashable
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError, jwt
 from sqlalchemy.orm import Session, joinedload
 
 from .audit_context import set_current_changed_by_id
+from .data_versions import get_table_versions
 from .database import get_db
-from .models import AccessPermission, Code, User
+from .models import AccessPermission, Code, Person, User
 
 # TODO: move to environment variable
 SECRET_KEY = "tpl-app-dev-secret-key-change-in-production"
@@ -18,6 +24,65 @@ PERMISSION_ALIASES: dict[str, str] = {
 }
 
 
+# Users and role permissions are cached per process. Entries expire after a short TTL, whenever one of
+# the underlying tables changes (see data_versions), or explicitly via invalidate_auth_caches().
+AUTH_CACHE_TTL_SECONDS = 60.0
+_USER_CACHE_TABLES = (User.__tablename__, Person.__tablename__, Code.__tablename__)
+_PERMISSION_CACHE_TABLES = (Code.__tablename__, AccessPermission.__tablename__)
+
+
+class _AuthCache:
+    def __init__(self, *, max_entries: int = 1024, ttl_seconds: float = AUTH_CACHE_TTL_SECONDS) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[Hashable, tuple[tuple[int, ...], float, Any]] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable, versions: tuple[int, ...]) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            entry_versions, expires_at, value = entry
+            if entry_versions != versions or expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, versions: tuple[int, ...], value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (versions, time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_USER_CACHE = _AuthCache()
+_PERMISSION_CACHE = _AuthCache()
+
+
+def invalidate_auth_caches() -> None:
+    """Drop cached users and permission sets, e.g. after roles or permissions were edited."""
+    _USER_CACHE.clear()
+    _PERMISSION_CACHE.clear()
+
+
+def _load_detached_user(db: Session, ext_id: str) -> User | None:
+    # Loaded in a separate session so the cached graph is fully detached and never expired by a request commit.
+    with Session(bind=db.get_bind()) as cache_db:
+        return (
+            cache_db.query(User)
+            .options(joinedload(User.role), joinedload(User.roles), joinedload(User.person))
+            .filter(User.ext_id == ext_id)
+            .first()
+        )
+
+
 def create_token(ext_id: str) -> str:
     return jwt.encode({"sub": ext_id}, SECRET_KEY, algorithm=ALGORITHM)
 
@@ -37,17 +102,18 @@ def get_current_user(
             detail="Invalid or expired token",
         )
 
-    user = (
-        db.query(User)
-        .options(joinedload(User.role), joinedload(User.roles), joinedload(User.person))
-        .filter(User.ext_id == ext_id)
-        .first()
-    )
-    if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
-        )
+    versions = get_table_versions(_USER_CACHE_TABLES)
+    cached_user = _USER_CACHE.get(ext_id, versions)
+    if cached_user is None:
+        cached_user = _load_detached_user(db, ext_id)
+        if cached_user is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found",
+            )
+        _USER_CACHE.put(ext_id, versions, cached_user)
+    # merge(load=False) attaches a request-local copy of the cached state without querying.
+    user = db.merge(cached_user, load=False)
     set_current_changed_by_id(user.id)
     return user
 
@@ -56,6 +122,11 @@ def get_user_permission_keys(db: Session, user: User) -> list[str]:
     role_ids = set(user.role_ids)
     if not role_ids:
         return []
+    cache_key = (user.id, frozenset(role_ids))
+    versions = get_table_versions(_PERMISSION_CACHE_TABLES)
+    cached_keys = _PERMISSION_CACHE.get(cache_key, versions)
+    if cached_keys is not None:
+        return list(cached_keys)
     keys = (
         db.query(AccessPermission.key)
         .join(AccessPermission.roles)
@@ -68,7 +139,9 @@ def get_user_permission_keys(db: Session, user: User) -> list[str]:
     for legacy_key, canonical_key in PERMISSION_ALIASES.items():
         if legacy_key in permission_keys:
             permission_keys.add(canonical_key)
-    return sorted(permission_keys)
+    sorted_keys = sorted(permission_keys)
+    _PERMISSION_CACHE.put(cache_key, versions, tuple(sorted_keys))
+    return sorted_keys
 
 
 def require_permission(permission_key: str):
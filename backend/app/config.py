@@ -19,6 +19,8 @@ class AppConfig:
     database_url: str
     cors_origins: list[str]
     seed_profile: str | None
+    query_metrics_enabled: bool = False
+    scheduler_max_workers: int = 2
 
 
 @lru_cache(maxsize=1)
@@ -29,4 +31,6 @@ def get_config() -> AppConfig:
         database_url=os.getenv("TPL_DATABASE_URL", f"sqlite:///{default_db_path}"),
         cors_origins=_parse_list(os.getenv("TPL_CORS_ORIGINS"), ["http://localhost:5173"]),
         seed_profile=os.getenv("TPL_SEED_PROFILE"),
+        query_metrics_enabled=os.getenv("TPL_QUERY_METRICS", "").strip().lower() in {"1", "true", "yes", "on"},
+        scheduler_max_workers=max(1, int(os.getenv("TPL_SCHEDULER_WORKERS", "2"))),
     )
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from threading import Lock
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from .database import SessionLocal
+
+_PENDING_TABLES_KEY = "data_version_pending_tables"
+
+_lock = Lock()
+_table_versions: dict[str, int] = {}
+_hooks_registered = False
+
+
+def bump_table_versions(table_names: Iterable[str]) -> None:
+    """Mark tables as changed; use for writes that bypass ORM flush events (e.g. bulk mappings)."""
+    with _lock:
+        for name in table_names:
+            _table_versions[name] = _table_versions.get(name, 0) + 1
+
+
+def get_table_versions(table_names: Iterable[str]) -> tuple[int, ...]:
+    with _lock:
+        return tuple(_table_versions.get(name, 0) for name in table_names)
+
+
+def _flushed_table_names(session: Session) -> set[str]:
+    names: set[str] = set()
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        for table in inspect(instance).mapper.tables:
+            names.add(table.name)
+    return names
+
+
+def _remember_pending(session: Session, names: set[str]) -> None:
+    session.info.setdefault(_PENDING_TABLES_KEY, set()).update(names)
+
+
+def register_data_version_hooks() -> None:
+    global _hooks_registered
+    if _hooks_registered:
+        return
+
+    @event.listens_for(SessionLocal, "after_flush")
+    def _bump_flushed_tables(session: Session, flush_context) -> None:  # noqa: ANN001
+        names = _flushed_table_names(session)
+        if not names:
+            return
+        bump_table_versions(names)
+        _remember_pending(session, names)
+
+    @event.listens_for(SessionLocal, "do_orm_execute")
+    def _bump_bulk_statement_tables(orm_execute_state: ORMExecuteState) -> None:
+        if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+            return
+        table = getattr(orm_execute_state.statement, "table", None)
+        if table is None:
+            return
+        bump_table_versions([table.name])
+        _remember_pending(orm_execute_state.session, {table.name})
+
+    # Readers may snapshot versions between flush and commit while still seeing old rows,
+    # so tables are bumped again once the writing transaction is committed.
+    @event.listens_for(SessionLocal, "after_commit")
+    def _bump_committed_tables(session: Session) -> None:
+        names = session.info.pop(_PENDING_TABLES_KEY, None)
+        if names:
+            bump_table_versions(names)
+
+    @event.listens_for(SessionLocal, "after_rollback")
+    def _discard_pending_tables(session: Session) -> None:
+        session.info.pop(_PENDING_TABLES_KEY, None)
+
+    _hooks_registered = True
@@ -36,9 +36,12 @@ def main() -> int:
             "migrate-procurement-typed",
             "clear-translation-bundles",
             "normalize-legacy-dev-forum-capture-label",
+            "rebuild-patient-list-projection",
+            "instantiate-medical-value-templates",
+            "migrate-scheduler-leases",
         ),
         default="refresh",
-        help="recreate=drop/create+seed, migrate=schema only, refresh=migrate+clean+seed, clean=data only, migrate-audit-fields=add/backfill CREATED_BY from CHANGED_BY, migrate-medical-value-units=add/backfill LOINC+UCUM medical value columns, verify-medical-value-units=read-only LOINC+UCUM coverage verification, migrate-procurement-runtime=legacy->unified procurement backfill, migrate-procurement-typed=unified->typed procurement backfill, clear-translation-bundles=delete DB translation overrides, normalize-legacy-dev-forum-capture-label=normalize stale Dev-Forum capture label overrides",
+        help="recreate=drop/create+seed, migrate=schema only, refresh=migrate+clean+seed, clean=data only, migrate-audit-fields=add/backfill CREATED_BY from CHANGED_BY, migrate-medical-value-units=add/backfill LOINC+UCUM medical value columns, verify-medical-value-units=read-only LOINC+UCUM coverage verification, migrate-procurement-runtime=legacy->unified procurement backfill, migrate-procurement-typed=unified->typed procurement backfill, clear-translation-bundles=delete DB translation overrides, normalize-legacy-dev-forum-capture-label=normalize stale Dev-Forum capture label overrides, rebuild-patient-list-projection=recompute patient overview projection rows, instantiate-medical-value-templates=create missing template-based medical values for all patients, migrate-scheduler-leases=add scheduler job lease columns",
     )
     parser.add_argument("--env", default=os.getenv("TPL_ENV", "DEV"), help="Application env (DEV/TEST/PROD)")
     parser.add_argument("--seed-profile", default=os.getenv("TPL_SEED_PROFILE"), help="Optional seed profile override")
@@ -136,6 +139,12 @@ def main() -> int:
             ["--mode", "migrate-medical-value-units", "--env", args.env, *migration_check_args, *db_url_args],
         )
 
+    if args.mode == "migrate-scheduler-leases":
+        return run(
+            "app.db_data",
+            ["--mode", "migrate-scheduler-leases", "--env", args.env, *migration_check_args, *db_url_args],
+        )
+
     if args.mode == "verify-medical-value-units":
         return run(
             "app.db_data",
@@ -151,6 +160,12 @@ def main() -> int:
             ["--mode", "normalize-legacy-dev-forum-capture-label", "--env", args.env, *db_url_args],
         )
 
+    if args.mode == "rebuild-patient-list-projection":
+        return run("app.db_data", ["--mode", "rebuild-patient-list-projection", "--env", args.env, *db_url_args])
+
+    if args.mode == "instantiate-medical-value-templates":
+        return run("app.db_data", ["--mode", "instantiate-medical-value-templates", "--env", args.env, *db_url_args])
+
     # Default refresh with automatic Dev-Forum backup/restore.
     return run_with_dev_forum_backup(
         schema_mode="migrate",
@@ -489,6 +489,35 @@ def _seed(*, app_env: str | None, seed_profile: str | None) -> dict[str, object]
         db.close()
 
 
+def _rebuild_patient_list_projection() -> int:
+    from .database import SessionLocal
+    from .features.patients import rebuild_patient_list_projection
+
+    db = SessionLocal()
+    try:
+        return rebuild_patient_list_projection(db=db)
+    finally:
+        db.close()
+
+
+def _instantiate_medical_value_templates() -> dict[str, int]:
+    from .database import SessionLocal
+    from .features.medical_values import instantiate_templates_for_patients
+
+    db = SessionLocal()
+    try:
+        result = instantiate_templates_for_patients(db)
+    finally:
+        db.close()
+    for patient_id, created in sorted(result.created_values_by_patient.items()):
+        print(f"  patient_id={patient_id} created_values={created}")
+    return {
+        "patients": result.patients,
+        "created_groups": result.created_groups,
+        "created_values": result.created_values,
+    }
+
+
 def _migrate_procurement_runtime() -> dict[str, int]:
     from .database import engine
 
@@ -1044,6 +1073,9 @@ def main() -> int:
             "export-translations-json",
             "clear-translation-bundles",
             "normalize-legacy-dev-forum-capture-label",
+            "rebuild-patient-list-projection",
+            "instantiate-medical-value-templates",
+            "migrate-scheduler-leases",
         ),
         default="refresh",
         help=(
@@ -1057,7 +1089,10 @@ def main() -> int:
             "migrate-procurement-typed=backfill typed procurement model from generic runtime rows, "
             "export-translations-json=write DB translations to frontend/src/i18n/translations.json, "
             "clear-translation-bundles=delete translation override rows from DB only, "
-            "normalize-legacy-dev-forum-capture-label=normalize stale devForum.capture.captureContext override labels"
+            "normalize-legacy-dev-forum-capture-label=normalize stale devForum.capture.captureContext override labels, "
+            "rebuild-patient-list-projection=recompute PATIENT_LIST_PROJECTION for all patients, "
+            "instantiate-medical-value-templates=create missing template-based medical values for all patients, "
+            "migrate-scheduler-leases=add SCHEDULED_JOB lease columns and clear stale leases"
         ),
     )
     parser.add_argument("--env", default=os.getenv("TPL_ENV", "DEV"), help="Application env (DEV/TEST/PROD)")
@@ -1122,6 +1157,20 @@ def main() -> int:
             + f"jobs={','.join(result['executed_jobs'])}"
         )
 
+    if args.mode in {"seed", "refresh", "rebuild-patient-list-projection"}:
+        # Seed jobs run without the app's flush hooks, so the projection is rebuilt in one pass afterwards.
+        rebuilt_rows = _rebuild_patient_list_projection()
+        print(f"Patient list projection rebuilt: rows={rebuilt_rows}")
+
+    if args.mode == "instantiate-medical-value-templates":
+        result = _instantiate_medical_value_templates()
+        print(
+            "Medical-value template instantiation complete: "
+            + f"patients={result['patients']} "
+            + f"groups={result['created_groups']} "
+            + f"values={result['created_values']}"
+        )
+
     if args.mode == "migrate-procurement-runtime":
         result = _migrate_procurement_runtime()
         print(
@@ -1187,6 +1236,20 @@ def main() -> int:
     if args.mode == "verify-medical-value-units":
         return _verify_medical_value_unit_integrity()
 
+    if args.mode == "migrate-scheduler-leases":
+        from .database import engine
+        from .features.scheduler import migrate_scheduler_lease_fields
+
+        result = migrate_scheduler_lease_fields(engine=engine)
+        print(
+            "Scheduler lease migration complete: "
+            + f"columns_added={result.columns_added} "
+            + f"leases_cleared={result.leases_cleared}"
+        )
+        verification_exit = _verify_schema_after_migration(check_level=args.migration_check_level)
+        if verification_exit != 0:
+            return verification_exit
+
     if args.mode == "export-translations-json":
         output_path, key_count = _export_translation_json_from_db()
         print(f"Frontend translations exported: {output_path} (keys: {key_count})")
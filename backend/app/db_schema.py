@@ -176,6 +176,26 @@ def verify_schema_drift(runtime: SchemaRuntime, *, strict: bool = True) -> Schem
     )
 
 
+def create_missing_indexes(runtime: SchemaRuntime) -> list[str]:
+    """Create model indexes missing on existing tables; `create_all` only builds indexes with new tables."""
+    insp = inspect(runtime.engine)
+    db_tables = set(insp.get_table_names())
+    created: list[str] = []
+    for table_name in sorted(db_tables & set(runtime.base.metadata.tables.keys())):
+        table = runtime.base.metadata.tables[table_name]
+        db_index_names = {index.get("name") for index in insp.get_indexes(table_name)}
+        db_column_names = {column["name"] for column in insp.get_columns(table_name)}
+        for index in sorted(table.indexes, key=lambda item: item.name or ""):
+            if index.name in db_index_names:
+                continue
+            # Indexes on columns that migrate cannot add are left for verify to report.
+            if any(column.name not in db_column_names for column in index.columns):
+                continue
+            index.create(bind=runtime.engine, checkfirst=True)
+            created.append(f"{table_name}.{index.name}")
+    return created
+
+
 def _print_drift(drift: SchemaDrift) -> None:
     if drift.missing_tables:
         print("Missing tables:")
@@ -207,6 +227,22 @@ def _print_drift(drift: SchemaDrift) -> None:
             print(f"  - {item}")
 
 
+def backfill_patient_list_projection(runtime: SchemaRuntime) -> int | None:
+    """Rebuild PATIENT_LIST_PROJECTION when patients lack a row; returns the rebuilt row count, or None if complete.
+
+    The projection is derived data that migrate creates empty on existing databases; without a backfill the
+    patient list would read every patient as having no contacts, episodes or blood type.
+    """
+    from sqlalchemy.orm import Session
+
+    from .features.patients import count_patients_missing_list_projection, rebuild_patient_list_projection
+
+    with Session(bind=runtime.engine) as db:
+        if not count_patients_missing_list_projection(db=db):
+            return None
+        return rebuild_patient_list_projection(db=db)
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Schema management (DDL only).")
     parser.add_argument(
@@ -236,6 +272,8 @@ def main() -> int:
 
     if args.mode == "migrate":
         runtime.base.metadata.create_all(bind=runtime.engine)
+        for item in create_missing_indexes(runtime):
+            print(f"Created index: {item}")
         drift = verify_schema_drift(runtime, strict=args.check_level == "strict")
         if drift.has_drift:
             print(
@@ -245,6 +283,9 @@ def main() -> int:
             _print_drift(drift)
             print("Hint: run with --mode recreate for a full rebuild.")
             return 2
+        rebuilt_rows = backfill_patient_list_projection(runtime)
+        if rebuilt_rows is not None:
+            print(f"Patient list projection rebuilt: rows={rebuilt_rows}")
         print("Schema migrated successfully.")
         return 0
 
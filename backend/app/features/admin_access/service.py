@@ -3,6 +3,7 @@ from __future__ import annotations
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
 
+from ...auth import invalidate_auth_caches
 from ...models import AccessPermission, Code
 from ...schemas import AccessControlMatrixResponse, AccessPermissionResponse, CodeResponse, RolePermissionsUpdate
 
@@ -47,5 +48,6 @@ def update_role_permissions(*, role_key: str, payload: RolePermissionsUpdate, db
     role.permissions = permissions
     db.add(role)
     db.commit()
+    invalidate_auth_caches()
 
     return get_access_control_matrix(db=db)
@@ -3,8 +3,9 @@ from __future__ import annotations
 from fastapi import HTTPException
 from sqlalchemy.orm import Session, joinedload
 
-from ...models import Catalogue, Coordination, CoordinationOrigin
+from ...models import Coordination, CoordinationOrigin
 from ...schemas import CoordinationOriginCreate, CoordinationOriginUpdate
+from ..reference import CODE_REGISTRY
 
 
 def _ensure_coordination_exists(coordination_id: int, db: Session) -> None:
@@ -24,7 +25,7 @@ def _query_with_joins(db: Session):
 def _validate_catalogue(catalogue_id: int | None, expected_type: str, field_name: str, db: Session) -> None:
     if catalogue_id is None:
         return
-    entry = db.query(Catalogue).filter(Catalogue.id == catalogue_id, Catalogue.type == expected_type).first()
+    entry = CODE_REGISTRY.catalogue(db, catalogue_id, expected_type)
     if not entry:
         raise HTTPException(
             status_code=422,
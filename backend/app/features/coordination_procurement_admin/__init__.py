@@ -8,6 +8,7 @@ from .service import (
     delete_field_template,
     delete_protocol_task_group_selection,
     get_procurement_admin_config,
+    procurement_admin_config_etag,
     update_field_group_template,
     update_field_template,
     update_protocol_task_group_selection,
@@ -15,6 +16,7 @@ from .service import (
 
 __all__ = [
     "get_procurement_admin_config",
+    "procurement_admin_config_etag",
     "create_field_group_template",
     "update_field_group_template",
     "delete_field_group_template",
@@ -3,6 +3,7 @@ from __future__ import annotations
 from fastapi import HTTPException
 from sqlalchemy.orm import Session, joinedload
 
+from ...http_cache import table_version_etag
 from ...models import (
     Code,
     CoordinationProcurementFieldGroupTemplate,
@@ -11,6 +12,7 @@ from ...models import (
     CoordinationProcurementFieldTemplate,
     DatatypeDefinition,
     TaskGroupTemplate,
+    User,
 )
 from ...schemas import (
     CoordinationProcurementAdminConfigResponse,
@@ -86,6 +88,26 @@ def _resolve_protocol_task_group_template_or_422(*, task_group_template_id: int,
     return item
 
 
+# Every table the admin config response is built from, including joined organs, scopes and editors.
+_ADMIN_CONFIG_TABLES = tuple(
+    model.__tablename__
+    for model in (
+        CoordinationProcurementFieldGroupTemplate,
+        CoordinationProcurementFieldTemplate,
+        CoordinationProcurementFieldScopeTemplate,
+        CoordinationProcurementProtocolTaskGroupSelection,
+        DatatypeDefinition,
+        TaskGroupTemplate,
+        Code,
+        User,
+    )
+)
+
+
+def procurement_admin_config_etag() -> str:
+    return table_version_etag("procurement-admin-config", _ADMIN_CONFIG_TABLES)
+
+
 def get_procurement_admin_config(*, db: Session) -> CoordinationProcurementAdminConfigResponse:
     field_group_templates = (
         db.query(CoordinationProcurementFieldGroupTemplate)
@@ -1,3 +1,4 @@
+from .completeness_service import check_explantation_completeness
 from .service import (
     clear_rejected_organ_workflow,
     get_procurement_flex,
@@ -5,11 +6,20 @@ from .service import (
     upsert_procurement_organ,
     upsert_procurement_value,
 )
+from .template_catalog import (
+    PROCUREMENT_TEMPLATE_CATALOG,
+    ProcurementTemplateCatalog,
+    invalidate_procurement_template_catalog,
+)
 
 __all__ = [
+    "check_explantation_completeness",
     "clear_rejected_organ_workflow",
     "get_procurement_flex",
     "upsert_procurement_organ",
     "update_procurement_organ",
     "upsert_procurement_value",
+    "PROCUREMENT_TEMPLATE_CATALOG",
+    "ProcurementTemplateCatalog",
+    "invalidate_procurement_template_catalog",
 ]
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session, joinedload, selectinload
+
+from ...models import (
+    Coordination,
+    CoordinationEpisode,
+    CoordinationProcurementFieldScopeTemplate,
+    CoordinationProcurementFieldTemplate,
+    CoordinationProcurementOrganRejection,
+    CoordinationProcurementTypedData,
+)
+from ..tasks import CoordinationFollowUp, create_coordination_follow_up_tasks
+from .catalog import PERSON_LIST_KEY_BY_FIELD, PROCUREMENT_TYPED_SPEC_BY_KEY, TEAM_LIST_KEY_BY_FIELD, get_typed_column_value
+from .shared import enum_value
+
+EXPLANTATION_FOLLOW_UP_HOURS = 24
+EXPLANTATION_FOLLOW_UP_BATCH_SIZE = 200
+EXPLANTATION_FOLLOW_UP_TASK_GROUP_NAME = "Procurement data incomplete 24h after explantation"
+
+
+@dataclass(frozen=True)
+class _RequiredField:
+    id: int
+    key: str
+    label: str
+
+
+@dataclass
+class ExplantationCompletenessResult:
+    checked_coordinations: int = 0
+    rows_scanned: int = 0
+    incomplete_organs: int = 0
+    created_task_groups: int = 0
+    created_tasks: int = 0
+
+    def metrics(self) -> dict[str, int]:
+        return dict(vars(self))
+
+
+def _required_fields_by_scope(db: Session) -> dict[tuple[int | None, str], list[_RequiredField]]:
+    """Active catalog fields per (organ id or None for all organs, slot key)."""
+    scopes = (
+        db.query(CoordinationProcurementFieldScopeTemplate)
+        .join(CoordinationProcurementFieldScopeTemplate.field_template)
+        .options(joinedload(CoordinationProcurementFieldScopeTemplate.field_template))
+        .filter(CoordinationProcurementFieldTemplate.is_active.is_(True))
+        .order_by(CoordinationProcurementFieldTemplate.pos.asc(), CoordinationProcurementFieldTemplate.id.asc())
+        .all()
+    )
+    # Plain values, so the committed task batches do not expire them.
+    required: dict[tuple[int | None, str], list[_RequiredField]] = defaultdict(list)
+    for scope in scopes:
+        field_template = scope.field_template
+        if field_template.key in PROCUREMENT_TYPED_SPEC_BY_KEY:
+            required[(scope.organ_id, enum_value(scope.slot_key))].append(
+                _RequiredField(id=field_template.id, key=field_template.key, label=field_template.name_default or field_template.key)
+            )
+    return required
+
+
+def _is_filled(row: CoordinationProcurementTypedData, key: str) -> bool:
+    spec = PROCUREMENT_TYPED_SPEC_BY_KEY[key]
+    if spec.kind == "person_list":
+        return any(enum_value(entry.list_key) == PERSON_LIST_KEY_BY_FIELD.get(key) for entry in row.person_lists)
+    if spec.kind == "team_list":
+        return any(enum_value(entry.list_key) == TEAM_LIST_KEY_BY_FIELD.get(key) for entry in row.team_lists)
+    return get_typed_column_value(row, key) not in (None, "")
+
+
+def _missing_field_descriptions(
+    row: CoordinationProcurementTypedData,
+    required: dict[tuple[int | None, str], list[_RequiredField]],
+) -> list[str]:
+    slot_key = enum_value(row.slot_key)
+    seen: set[int] = set()
+    descriptions: list[str] = []
+    for field in required.get((None, slot_key), []) + required.get((row.organ_id, slot_key), []):
+        if field.id in seen or _is_filled(row, field.key):
+            continue
+        seen.add(field.id)
+        descriptions.append(f"Complete {field.label}" if slot_key == "MAIN" else f"Complete {field.label} ({slot_key})")
+    return descriptions
+
+
+def _explanted_coordination_ids(*, cutoff: datetime, db: Session) -> list[int]:
+    # The earliest cross-clamp time of a coordination is its explantation time.
+    return [
+        coordination_id
+        for (coordination_id,) in db.query(CoordinationProcurementTypedData.coordination_id)
+        .join(Coordination, Coordination.id == CoordinationProcurementTypedData.coordination_id)
+        .filter(
+            Coordination.completion_confirmed.is_(False),
+            CoordinationProcurementTypedData.cross_clamp_time.is_not(None),
+        )
+        .group_by(CoordinationProcurementTypedData.coordination_id)
+        .having(func.min(CoordinationProcurementTypedData.cross_clamp_time) <= cutoff)
+        .order_by(CoordinationProcurementTypedData.coordination_id.asc())
+    ]
+
+
+def _check_batch(
+    *,
+    coordination_ids: list[int],
+    required: dict[tuple[int | None, str], list[_RequiredField]],
+    now: datetime,
+    result: ExplantationCompletenessResult,
+    db: Session,
+) -> None:
+    rows = (
+        db.query(CoordinationProcurementTypedData)
+        .options(
+            selectinload(CoordinationProcurementTypedData.person_lists),
+            selectinload(CoordinationProcurementTypedData.team_lists),
+        )
+        .filter(CoordinationProcurementTypedData.coordination_id.in_(coordination_ids))
+        .order_by(
+            CoordinationProcurementTypedData.coordination_id.asc(),
+            CoordinationProcurementTypedData.organ_id.asc(),
+            CoordinationProcurementTypedData.slot_key.asc(),
+        )
+        .all()
+    )
+    result.rows_scanned += len(rows)
+    rejected = {
+        (coordination_id, organ_id)
+        for coordination_id, organ_id in db.query(
+            CoordinationProcurementOrganRejection.coordination_id,
+            CoordinationProcurementOrganRejection.organ_id,
+        ).filter(
+            CoordinationProcurementOrganRejection.coordination_id.in_(coordination_ids),
+            CoordinationProcurementOrganRejection.is_rejected.is_(True),
+        )
+    }
+    episode_by_organ: dict[tuple[int, int], tuple[int, int | None]] = {}
+    for entry in (
+        db.query(CoordinationEpisode)
+        .options(joinedload(CoordinationEpisode.episode))
+        .filter(CoordinationEpisode.coordination_id.in_(coordination_ids))
+        .order_by(CoordinationEpisode.id.asc())
+    ):
+        if entry.episode is not None:
+            episode_by_organ.setdefault((entry.coordination_id, entry.organ_id), (entry.episode.id, entry.episode.patient_id))
+
+    missing_by_organ: dict[tuple[int, int], list[str]] = defaultdict(list)
+    for row in rows:
+        if (row.coordination_id, row.organ_id) in rejected:
+            continue
+        missing = _missing_field_descriptions(row, required)
+        if missing:
+            missing_by_organ[(row.coordination_id, row.organ_id)].extend(missing)
+    result.incomplete_organs += len(missing_by_organ)
+
+    follow_ups = []
+    for (coordination_id, organ_id), descriptions in missing_by_organ.items():
+        episode_id, patient_id = episode_by_organ.get((coordination_id, organ_id), (None, None))
+        follow_ups.append(
+            CoordinationFollowUp(
+                coordination_id=coordination_id,
+                organ_id=organ_id,
+                descriptions=tuple(descriptions),
+                episode_id=episode_id,
+                patient_id=patient_id,
+            )
+        )
+    created = create_coordination_follow_up_tasks(
+        follow_ups=follow_ups,
+        group_name=EXPLANTATION_FOLLOW_UP_TASK_GROUP_NAME,
+        until=now,
+        db=db,
+    )
+    result.created_task_groups += created.created_groups
+    result.created_tasks += created.created_tasks
+
+
+def check_explantation_completeness(
+    *,
+    db: Session,
+    now: datetime,
+    batch_size: int = EXPLANTATION_FOLLOW_UP_BATCH_SIZE,
+) -> ExplantationCompletenessResult:
+    """Create follow-up tasks for organs whose procurement data is incomplete 24h after explantation.
+
+    Coordinations are selected with one aggregate query and checked in batches: each batch loads all
+    typed procurement rows at once and compares them in memory with the active field scopes. Organs
+    that already have a follow-up task group are not reported twice.
+    """
+    result = ExplantationCompletenessResult()
+    coordination_ids = _explanted_coordination_ids(cutoff=now - timedelta(hours=EXPLANTATION_FOLLOW_UP_HOURS), db=db)
+    result.checked_coordinations = len(coordination_ids)
+    if not coordination_ids:
+        return result
+    required = _required_fields_by_scope(db)
+    if not required:
+        return result
+    for start in range(0, len(coordination_ids), batch_size):
+        _check_batch(
+            coordination_ids=coordination_ids[start : start + batch_size],
+            required=required,
+            now=now,
+            result=result,
+            db=db,
+        )
+    return result
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from sqlalchemy.orm import Session, joinedload
+from fastapi import HTTPException
+from sqlalchemy import exists
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from ...features.coordination_procurement_flex.catalog import (
     PERSON_LIST_KEY_BY_FIELD,
@@ -10,31 +12,29 @@ from ...features.coordination_procurement_flex.catalog import (
     get_typed_column_value,
 )
 from ...models import (
+    Coordination,
     CoordinationProcurement,
-    CoordinationProcurementFieldGroupTemplate,
-    CoordinationProcurementFieldScopeTemplate,
     CoordinationProcurementFieldTemplate,
     CoordinationProcurementOrganRejection,
-    CoordinationProcurementProtocolTaskGroupSelection,
     CoordinationProcurementTypedData,
     CoordinationProcurementTypedDataPersonList,
     CoordinationProcurementTypedDataTeamList,
     CoordinationProtocolEventLog,
-    TaskGroupTemplate,
 )
 from ...schemas import (
-    CoordinationProcurementFieldGroupTemplateResponse,
-    CoordinationProcurementFieldScopeTemplateResponse,
     CoordinationProcurementFieldTemplateResponse,
     CoordinationProcurementFlexResponse,
     CoordinationProcurementOrganResponse,
     CoordinationProcurementSlotResponse,
     CoordinationProcurementValueResponse,
 )
-from .shared import ORGAN_WORKFLOW_CLEARED_EVENT, ensure_coordination_exists, enum_value, next_value_id
+from .shared import ORGAN_WORKFLOW_CLEARED_EVENT, enum_value, next_value_id
+from .template_catalog import PROCUREMENT_TEMPLATE_CATALOG, ProcurementTemplateCatalog
 
 
 def load_typed_rows(*, coordination_id: int, db: Session) -> list[CoordinationProcurementTypedData]:
+    # Scalar references are joined; the person/team lists are loaded with one IN query each instead of
+    # multiplying the joined result by the list lengths.
     return (
         db.query(CoordinationProcurementTypedData)
         .options(
@@ -43,19 +43,52 @@ def load_typed_rows(*, coordination_id: int, db: Session) -> list[CoordinationPr
             joinedload(CoordinationProcurementTypedData.chirurg_responsible_person),
             joinedload(CoordinationProcurementTypedData.procurment_team_team),
             joinedload(CoordinationProcurementTypedData.recipient_episode),
-            joinedload(CoordinationProcurementTypedData.person_lists).joinedload(CoordinationProcurementTypedDataPersonList.person),
-            joinedload(CoordinationProcurementTypedData.team_lists).joinedload(CoordinationProcurementTypedDataTeamList.team),
             joinedload(CoordinationProcurementTypedData.changed_by_user),
+            selectinload(CoordinationProcurementTypedData.person_lists).joinedload(CoordinationProcurementTypedDataPersonList.person),
+            selectinload(CoordinationProcurementTypedData.team_lists).joinedload(CoordinationProcurementTypedDataTeamList.team),
         )
         .filter(CoordinationProcurementTypedData.coordination_id == coordination_id)
         .all()
     )
 
 
+def _load_procurement_or_404(*, coordination_id: int, db: Session) -> CoordinationProcurement | None:
+    row = (
+        db.query(Coordination.id, CoordinationProcurement)
+        .outerjoin(CoordinationProcurement, CoordinationProcurement.coordination_id == Coordination.id)
+        .options(joinedload(CoordinationProcurement.changed_by_user))
+        .filter(Coordination.id == coordination_id)
+        .first()
+    )
+    if row is None:
+        raise HTTPException(status_code=404, detail="Coordination not found")
+    return row[1]
+
+
+def _load_organ_rejections(
+    *,
+    coordination_id: int,
+    db: Session,
+) -> tuple[list[CoordinationProcurementOrganRejection], set[int]]:
+    """Return the organ rejections of a coordination and the organ ids whose workflow was cleared."""
+    workflow_cleared = exists().where(
+        CoordinationProtocolEventLog.coordination_id == CoordinationProcurementOrganRejection.coordination_id,
+        CoordinationProtocolEventLog.organ_id == CoordinationProcurementOrganRejection.organ_id,
+        CoordinationProtocolEventLog.event == ORGAN_WORKFLOW_CLEARED_EVENT,
+    )
+    rows = (
+        db.query(CoordinationProcurementOrganRejection, workflow_cleared.label("workflow_cleared"))
+        .options(joinedload(CoordinationProcurementOrganRejection.changed_by_user))
+        .filter(CoordinationProcurementOrganRejection.coordination_id == coordination_id)
+        .all()
+    )
+    return [rejection for rejection, _ in rows], {rejection.organ_id for rejection, cleared in rows if cleared}
+
+
 def build_value_response(
     *,
     row: CoordinationProcurementTypedData,
-    field_template: CoordinationProcurementFieldTemplate,
+    field_template: CoordinationProcurementFieldTemplate | CoordinationProcurementFieldTemplateResponse,
 ) -> CoordinationProcurementValueResponse | None:
     spec = PROCUREMENT_TYPED_SPEC_BY_KEY.get(field_template.key)
     if not spec:
@@ -125,28 +158,16 @@ def build_flex_response_from_typed_data(
     *,
     coordination_id: int,
     procurement: CoordinationProcurement | None,
-    field_templates: list[CoordinationProcurementFieldTemplate],
-    field_scope_templates: list[CoordinationProcurementFieldScopeTemplate],
-    field_group_templates: list[CoordinationProcurementFieldGroupTemplate],
-    protocol_task_group_selections: list[CoordinationProcurementProtocolTaskGroupSelection],
+    catalog: ProcurementTemplateCatalog,
     typed_rows: list[CoordinationProcurementTypedData],
     organ_rejections: list[CoordinationProcurementOrganRejection],
-    db: Session,
+    cleared_workflow_by_organ_id: set[int],
 ) -> CoordinationProcurementFlexResponse:
+    field_templates = catalog.field_templates
     slot_rows_by_organ: dict[int, list[CoordinationProcurementTypedData]] = {}
     for row in typed_rows:
         slot_rows_by_organ.setdefault(row.organ_id, []).append(row)
     rejection_by_organ_id = {entry.organ_id: entry for entry in organ_rejections}
-    cleared_workflow_by_organ_id = {
-        int(row[0])
-        for row in db.query(CoordinationProtocolEventLog.organ_id)
-        .filter(
-            CoordinationProtocolEventLog.coordination_id == coordination_id,
-            CoordinationProtocolEventLog.event == ORGAN_WORKFLOW_CLEARED_EVENT,
-        )
-        .all()
-        if row and row[0] is not None
-    }
     organ_ids = sorted(set(slot_rows_by_organ.keys()) | set(rejection_by_organ_id.keys()))
     organs: list[CoordinationProcurementOrganResponse] = []
     for organ_id in organ_ids:
@@ -213,84 +234,28 @@ def build_flex_response_from_typed_data(
     return CoordinationProcurementFlexResponse(
         procurement=procurement,
         organs=organs,
-        field_group_templates=[
-            CoordinationProcurementFieldGroupTemplateResponse.model_validate(group, from_attributes=True)
-            for group in field_group_templates
-        ],
-        field_templates=[
-            CoordinationProcurementFieldTemplateResponse.model_validate(template, from_attributes=True)
-            for template in field_templates
-        ],
-        field_scope_templates=[
-            CoordinationProcurementFieldScopeTemplateResponse.model_validate(scope, from_attributes=True)
-            for scope in field_scope_templates
-        ],
-        protocol_task_group_selections=protocol_task_group_selections,
+        field_group_templates=list(catalog.field_group_templates),
+        field_templates=list(catalog.field_templates),
+        field_scope_templates=list(catalog.field_scope_templates),
+        protocol_task_group_selections=list(catalog.protocol_task_group_selections),
     )
 
 
 def get_procurement_flex(*, coordination_id: int, db: Session) -> CoordinationProcurementFlexResponse:
-    ensure_coordination_exists(coordination_id, db)
-    procurement = (
-        db.query(CoordinationProcurement)
-        .options(joinedload(CoordinationProcurement.changed_by_user))
-        .filter(CoordinationProcurement.coordination_id == coordination_id)
-        .first()
-    )
+    """Build the flex view of one coordination.
+
+    Templates come from the process-wide catalog; the coordination itself costs one query for the
+    procurement, one for the typed rows (plus one IN query per person/team list) and one for the organ
+    rejections including their cleared-workflow markers.
+    """
+    procurement = _load_procurement_or_404(coordination_id=coordination_id, db=db)
     typed_rows = load_typed_rows(coordination_id=coordination_id, db=db)
-    field_templates = (
-        db.query(CoordinationProcurementFieldTemplate)
-        .options(
-            joinedload(CoordinationProcurementFieldTemplate.datatype_definition),
-            joinedload(CoordinationProcurementFieldTemplate.group_template),
-        )
-        .filter(CoordinationProcurementFieldTemplate.is_active.is_(True))
-        .order_by(CoordinationProcurementFieldTemplate.pos.asc(), CoordinationProcurementFieldTemplate.id.asc())
-        .all()
-    )
-    field_group_templates = (
-        db.query(CoordinationProcurementFieldGroupTemplate)
-        .filter(CoordinationProcurementFieldGroupTemplate.is_active.is_(True))
-        .order_by(CoordinationProcurementFieldGroupTemplate.pos.asc(), CoordinationProcurementFieldGroupTemplate.id.asc())
-        .all()
-    )
-    field_scope_templates = (
-        db.query(CoordinationProcurementFieldScopeTemplate)
-        .options(
-            joinedload(CoordinationProcurementFieldScopeTemplate.organ),
-            joinedload(CoordinationProcurementFieldScopeTemplate.field_template),
-        )
-        .order_by(CoordinationProcurementFieldScopeTemplate.id.asc())
-        .all()
-    )
-    protocol_task_group_selections = (
-        db.query(CoordinationProcurementProtocolTaskGroupSelection)
-        .options(
-            joinedload(CoordinationProcurementProtocolTaskGroupSelection.task_group_template).joinedload(TaskGroupTemplate.scope),
-            joinedload(CoordinationProcurementProtocolTaskGroupSelection.task_group_template).joinedload(TaskGroupTemplate.organ),
-            joinedload(CoordinationProcurementProtocolTaskGroupSelection.organ),
-            joinedload(CoordinationProcurementProtocolTaskGroupSelection.changed_by_user),
-        )
-        .order_by(CoordinationProcurementProtocolTaskGroupSelection.pos.asc(), CoordinationProcurementProtocolTaskGroupSelection.id.asc())
-        .all()
-    )
-    organ_rejections = (
-        db.query(CoordinationProcurementOrganRejection)
-        .options(
-            joinedload(CoordinationProcurementOrganRejection.organ),
-            joinedload(CoordinationProcurementOrganRejection.changed_by_user),
-        )
-        .filter(CoordinationProcurementOrganRejection.coordination_id == coordination_id)
-        .all()
-    )
+    organ_rejections, cleared_workflow_by_organ_id = _load_organ_rejections(coordination_id=coordination_id, db=db)
     return build_flex_response_from_typed_data(
         coordination_id=coordination_id,
         procurement=procurement,
-        field_templates=field_templates,
-        field_scope_templates=field_scope_templates,
-        field_group_templates=field_group_templates,
-        protocol_task_group_selections=protocol_task_group_selections,
+        catalog=PROCUREMENT_TEMPLATE_CATALOG.get(db),
         typed_rows=typed_rows,
         organ_rejections=organ_rejections,
-        db=db,
+        cleared_workflow_by_organ_id=cleared_workflow_by_organ_id,
     )
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from threading import Lock
+
+from sqlalchemy.orm import Session, selectinload
+
+from ...data_versions import get_table_versions
+from ...models import (
+    Code,
+    CoordinationProcurementFieldGroupTemplate,
+    CoordinationProcurementFieldScopeTemplate,
+    CoordinationProcurementFieldTemplate,
+    CoordinationProcurementProtocolTaskGroupSelection,
+    TaskGroupTemplate,
+    User,
+)
+from ...schemas import (
+    CoordinationProcurementFieldGroupTemplateResponse,
+    CoordinationProcurementFieldScopeTemplateResponse,
+    CoordinationProcurementFieldTemplateResponse,
+    CoordinationProcurementProtocolTaskGroupSelectionResponse,
+)
+
+PROCUREMENT_TEMPLATE_CATALOG_TTL_SECONDS = 300.0
+
+
+@dataclass(frozen=True)
+class ProcurementTemplateCatalog:
+    """Serialized procurement templates shared by every flex response; treat the models as read-only."""
+
+    field_group_templates: tuple[CoordinationProcurementFieldGroupTemplateResponse, ...]
+    field_templates: tuple[CoordinationProcurementFieldTemplateResponse, ...]
+    field_scope_templates: tuple[CoordinationProcurementFieldScopeTemplateResponse, ...]
+    protocol_task_group_selections: tuple[CoordinationProcurementProtocolTaskGroupSelectionResponse, ...]
+
+
+@dataclass(frozen=True)
+class _CatalogSnapshot:
+    versions: tuple[int, ...]
+    expires_at: float
+    catalog: ProcurementTemplateCatalog
+
+
+def _audit_user_loads(model: type) -> tuple:
+    return (
+        selectinload(model.changed_by_user).selectinload(User.roles),
+        selectinload(model.created_by_user).selectinload(User.roles),
+    )
+
+
+def _load_catalog(db: Session) -> ProcurementTemplateCatalog:
+    group_templates = (
+        db.query(CoordinationProcurementFieldGroupTemplate)
+        .options(*_audit_user_loads(CoordinationProcurementFieldGroupTemplate))
+        .filter(CoordinationProcurementFieldGroupTemplate.is_active.is_(True))
+        .order_by(CoordinationProcurementFieldGroupTemplate.pos.asc(), CoordinationProcurementFieldGroupTemplate.id.asc())
+    )
+    field_templates = (
+        db.query(CoordinationProcurementFieldTemplate)
+        .options(*_audit_user_loads(CoordinationProcurementFieldTemplate))
+        .filter(CoordinationProcurementFieldTemplate.is_active.is_(True))
+        .order_by(CoordinationProcurementFieldTemplate.pos.asc(), CoordinationProcurementFieldTemplate.id.asc())
+    )
+    scope_templates = (
+        db.query(CoordinationProcurementFieldScopeTemplate)
+        .options(
+            selectinload(CoordinationProcurementFieldScopeTemplate.organ),
+            *_audit_user_loads(CoordinationProcurementFieldScopeTemplate),
+        )
+        .order_by(CoordinationProcurementFieldScopeTemplate.id.asc())
+    )
+    selections = (
+        db.query(CoordinationProcurementProtocolTaskGroupSelection)
+        .options(
+            selectinload(CoordinationProcurementProtocolTaskGroupSelection.task_group_template).selectinload(TaskGroupTemplate.scope),
+            selectinload(CoordinationProcurementProtocolTaskGroupSelection.task_group_template).selectinload(TaskGroupTemplate.organ),
+            selectinload(CoordinationProcurementProtocolTaskGroupSelection.organ),
+            *_audit_user_loads(CoordinationProcurementProtocolTaskGroupSelection),
+        )
+        .order_by(CoordinationProcurementProtocolTaskGroupSelection.pos.asc(), CoordinationProcurementProtocolTaskGroupSelection.id.asc())
+    )
+    return ProcurementTemplateCatalog(
+        field_group_templates=tuple(
+            CoordinationProcurementFieldGroupTemplateResponse.model_validate(row, from_attributes=True) for row in group_templates
+        ),
+        field_templates=tuple(
+            CoordinationProcurementFieldTemplateResponse.model_validate(row, from_attributes=True) for row in field_templates
+        ),
+        field_scope_templates=tuple(
+            CoordinationProcurementFieldScopeTemplateResponse.model_validate(row, from_attributes=True) for row in scope_templates
+        ),
+        protocol_task_group_selections=tuple(
+            CoordinationProcurementProtocolTaskGroupSelectionResponse.model_validate(row, from_attributes=True)
+            for row in selections
+        ),
+    )
+
+
+class ProcurementTemplateCatalogCache:
+    """Process-wide procurement template catalog, rebuilt whenever one of its tables changes (see data_versions)."""
+
+    _TABLES = tuple(
+        model.__tablename__
+        for model in (
+            CoordinationProcurementFieldGroupTemplate,
+            CoordinationProcurementFieldTemplate,
+            CoordinationProcurementFieldScopeTemplate,
+            CoordinationProcurementProtocolTaskGroupSelection,
+            TaskGroupTemplate,
+            Code,
+            User,
+        )
+    )
+
+    def __init__(self) -> None:
+        self._snapshot: _CatalogSnapshot | None = None
+        self._lock = Lock()
+
+    def _is_current(self, snapshot: _CatalogSnapshot | None, versions: tuple[int, ...]) -> bool:
+        return snapshot is not None and snapshot.versions == versions and snapshot.expires_at > time.monotonic()
+
+    def get(self, db: Session) -> ProcurementTemplateCatalog:
+        versions = get_table_versions(self._TABLES)
+        snapshot = self._snapshot
+        if self._is_current(snapshot, versions):
+            return snapshot.catalog
+        with self._lock:
+            if not self._is_current(self._snapshot, versions):
+                # Read committed rows only, so the catalog never holds templates of a transaction that rolls back.
+                with Session(bind=db.get_bind()) as catalog_db:
+                    self._snapshot = _CatalogSnapshot(
+                        versions=versions,
+                        expires_at=time.monotonic() + PROCUREMENT_TEMPLATE_CATALOG_TTL_SECONDS,
+                        catalog=_load_catalog(catalog_db),
+                    )
+            return self._snapshot.catalog
+
+    def clear(self) -> None:
+        with self._lock:
+            self._snapshot = None
+
+
+PROCUREMENT_TEMPLATE_CATALOG = ProcurementTemplateCatalogCache()
+
+
+def invalidate_procurement_template_catalog() -> None:
+    """Drop the cached procurement templates, e.g. after they were changed outside the app session."""
+    PROCUREMENT_TEMPLATE_CATALOG.clear()
@@ -3,8 +3,9 @@ from __future__ import annotations
 from fastapi import HTTPException
 from sqlalchemy.orm import Session, joinedload
 
-from ...models import Code, Coordination, CoordinationProtocolEventLog, Task
+from ...models import Coordination, CoordinationProtocolEventLog, Task
 from ...schemas import CoordinationProtocolEventLogCreate
+from ..reference import CODE_REGISTRY
 
 
 def _ensure_coordination_exists(coordination_id: int, db: Session) -> None:
@@ -14,7 +15,7 @@ def _ensure_coordination_exists(coordination_id: int, db: Session) -> None:
 
 
 def _ensure_organ_exists(organ_id: int, db: Session) -> None:
-    organ = db.query(Code).filter(Code.id == organ_id).first()
+    organ = CODE_REGISTRY.code(db, organ_id)
     if not organ:
         raise HTTPException(status_code=422, detail="organ_id must reference CODE")
     if organ.type != "ORGAN":
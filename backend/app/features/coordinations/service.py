@@ -5,8 +5,9 @@ from sqlalchemy.orm import Session, joinedload
 
 from ...enums import CoordinationStatusKey
 from ...features.tasks import ensure_coordination_protocol_task_groups
-from ...models import Code, Coordination
+from ...models import Coordination
 from ...schemas import CoordinationCreate, CoordinationUpdate
+from ..reference import CODE_REGISTRY, ReferenceEntry
 
 DEFAULT_COORDINATION_STATUS_KEY = CoordinationStatusKey.OPEN.value
 COORDINATION_STATUS_TYPE = "COORDINATION_STATUS"
@@ -28,11 +29,7 @@ def get_coordination_or_404(coordination_id: int, db: Session) -> Coordination:
 
 
 def _resolve_default_status_id(db: Session) -> int:
-    status = (
-        db.query(Code)
-        .filter(Code.type == COORDINATION_STATUS_TYPE, Code.key == DEFAULT_COORDINATION_STATUS_KEY)
-        .first()
-    )
+    status = CODE_REGISTRY.code_by_key(db, COORDINATION_STATUS_TYPE, DEFAULT_COORDINATION_STATUS_KEY)
     if not status:
         raise HTTPException(
             status_code=500,
@@ -41,12 +38,8 @@ def _resolve_default_status_id(db: Session) -> int:
     return status.id
 
 
-def _ensure_status_exists(status_id: int, db: Session) -> Code:
-    status = (
-        db.query(Code)
-        .filter(Code.id == status_id, Code.type == COORDINATION_STATUS_TYPE)
-        .first()
-    )
+def _ensure_status_exists(status_id: int, db: Session) -> ReferenceEntry:
+    status = CODE_REGISTRY.code(db, status_id, COORDINATION_STATUS_TYPE)
     if not status:
         raise HTTPException(
             status_code=422,
@@ -76,13 +69,7 @@ def create_coordination(*, payload: CoordinationCreate, changed_by_id: int, db:
     db.add(item)
     db.commit()
     db.refresh(item)
-    organ_ids = [
-        row.id
-        for row in db.query(Code)
-        .filter(Code.type == "ORGAN")
-        .order_by(Code.pos.asc(), Code.id.asc())
-        .all()
-    ]
+    organ_ids = [entry.id for entry in CODE_REGISTRY.codes_of_type(db, "ORGAN")]
     if organ_ids:
         for organ_id in organ_ids:
             ensure_coordination_protocol_task_groups(
@@ -5,8 +5,9 @@ from datetime import date
 from fastapi import HTTPException
 from sqlalchemy.orm import Session, joinedload, selectinload
 
-from ...models import Code, Episode, EpisodeOrgan, Patient
+from ...models import Episode, EpisodeOrgan, Patient
 from ...schemas import EpisodeCreate, EpisodeOrganCreate, EpisodeOrganUpdate, EpisodeUpdate
+from ..reference import CODE_REGISTRY
 from .workflow_service import (
     cancel_episode,
     close_episode,
@@ -30,13 +31,7 @@ def _validated_organ_ids(db: Session, organ_ids: list[int]) -> list[int]:
     if not organ_ids:
         raise HTTPException(status_code=422, detail="At least one organ is required")
     unique_ids = list(dict.fromkeys(organ_ids))
-    rows = (
-        db.query(Code.id)
-        .filter(Code.type == "ORGAN", Code.id.in_(unique_ids))
-        .all()
-    )
-    found_ids = {row[0] for row in rows}
-    missing = [organ_id for organ_id in unique_ids if organ_id not in found_ids]
+    missing = [organ_id for organ_id in unique_ids if CODE_REGISTRY.code(db, organ_id, "ORGAN") is None]
     if missing:
         raise HTTPException(status_code=422, detail=f"Unknown organ ids: {missing}")
     return unique_ids
@@ -5,7 +5,8 @@ from datetime import UTC, date, datetime
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
 
-from ...models import Code, CoordinationEpisode, Episode
+from ...models import CoordinationEpisode, Episode
+from ..reference import CODE_REGISTRY, ReferenceEntry
 
 PHASE_CODE_TYPE = "TPL_PHASE"
 STATUS_CODE_TYPE = "TPL_STATUS"
@@ -79,8 +80,8 @@ _ALLOWED_PHASES_BY_ACTION: dict[str, set[str]] = {
 }
 
 
-def _code_or_500(*, db: Session, code_type: str, code_key: str) -> Code:
-    code = db.query(Code).filter(Code.type == code_type, Code.key == code_key).first()
+def _code_or_500(*, db: Session, code_type: str, code_key: str) -> ReferenceEntry:
+    code = CODE_REGISTRY.code_by_key(db, code_type, code_key)
     if code is None:
         raise HTTPException(status_code=500, detail=f"Missing code {code_type}.{code_key}")
     return code
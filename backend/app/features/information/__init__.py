@@ -1,3 +1,21 @@
-from .service import create_information, delete_information, list_information, mark_information_read, update_information
+from .contexts import resolve_information_context_ids
+from .service import (
+    count_unread_information,
+    create_information,
+    delete_information,
+    list_information,
+    list_information_feed,
+    mark_information_read,
+    update_information,
+)
 
-__all__ = ["list_information", "create_information", "update_information", "delete_information", "mark_information_read"]
+__all__ = [
+    "list_information",
+    "list_information_feed",
+    "count_unread_information",
+    "create_information",
+    "update_information",
+    "delete_information",
+    "mark_information_read",
+    "resolve_information_context_ids",
+]
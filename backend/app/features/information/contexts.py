@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from ...models import Code
+from ..reference import CODE_REGISTRY, ReferenceEntry
+
+INFORMATION_CONTEXT_CODE_TYPES = {"ORGAN", "INFORMATION_AREA"}
+
+
+def _normalize_context_ids(*, context_id: int | None, context_ids: list[int] | None) -> list[int]:
+    raw = list(context_ids or [])
+    if context_id is not None and context_id not in raw:
+        raw.insert(0, context_id)
+    return list(dict.fromkeys(raw))
+
+
+def resolve_information_context_ids(
+    *,
+    db: Session,
+    context_id: int | None,
+    context_ids: list[int] | None,
+) -> list[int]:
+    """Validate the requested contexts and apply the INFORMATION_AREA rules.
+
+    Codes are resolved from the process-wide code registry; ids it does not know yet are fetched with
+    one `IN` query. Returns the ordered context ids to store, with the GENERAL area added when no area
+    is given.
+    """
+    requested = _normalize_context_ids(context_id=context_id, context_ids=context_ids)
+    snapshot = CODE_REGISTRY.snapshot(db).codes
+    codes_by_id: dict[int, ReferenceEntry] = {value: snapshot.by_id[value] for value in requested if value in snapshot.by_id}
+    unknown_ids = [value for value in requested if value not in codes_by_id]
+    if unknown_ids:
+        codes_by_id.update(
+            (row.id, ReferenceEntry.from_row(row)) for row in db.query(Code).filter(Code.id.in_(unknown_ids)).all()
+        )
+    for value in requested:
+        if value not in codes_by_id:
+            raise HTTPException(status_code=422, detail="context_id references unknown CODE")
+        if codes_by_id[value].type not in INFORMATION_CONTEXT_CODE_TYPES:
+            raise HTTPException(status_code=422, detail="context_id must reference CODE type ORGAN or INFORMATION_AREA")
+
+    areas = snapshot.by_type.get("INFORMATION_AREA", ())
+    general_id = next((entry.id for entry in areas if entry.key == "GENERAL"), None)
+    if not areas:
+        return requested
+    if not requested:
+        return [general_id] if general_id is not None else requested
+    area_keys = [codes_by_id[value].key for value in requested if codes_by_id[value].type == "INFORMATION_AREA"]
+    organ_count = sum(1 for value in requested if codes_by_id[value].type == "ORGAN")
+    if len(area_keys) > 1:
+        raise HTTPException(status_code=422, detail="Only one INFORMATION_AREA context can be set")
+    area_key = area_keys[0] if area_keys else "GENERAL"
+    if area_key == "ORGAN" and organ_count == 0:
+        raise HTTPException(status_code=422, detail="At least one ORGAN context is required for INFORMATION_AREA.ORGAN")
+    if area_key != "ORGAN" and organ_count > 0:
+        raise HTTPException(status_code=422, detail="ORGAN contexts are only allowed for INFORMATION_AREA.ORGAN")
+    if not area_keys and general_id is not None:
+        return [general_id, *requested]
+    return requested
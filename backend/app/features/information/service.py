@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import base64
+import binascii
 import datetime as dt
+import json
 
 from fastapi import HTTPException
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import and_, exists, func, or_, tuple_
+from sqlalchemy.orm import Session, aliased, joinedload, selectinload
 
-from ...models import Code, Information, InformationContext, InformationUser, User
-from ...schemas import InformationCreate, InformationUpdate
+from ...models import Information, InformationContext, InformationUser, User
+from ...schemas import InformationCreate, InformationFeedPageResponse, InformationResponse, InformationUpdate
 from .access import can_manage_information, resolve_current_user_read_at
+from .contexts import resolve_information_context_ids
 
 
 def _information_query(db: Session):
@@ -23,74 +28,6 @@ def _ensure_author_exists(*, db: Session, author_id: int) -> None:
         raise HTTPException(status_code=422, detail="author_id references unknown USER")
 
 
-def _ensure_context_valid(*, db: Session, context_id: int | None) -> None:
-    if context_id is None:
-        return
-    context = db.query(Code).filter(Code.id == context_id).first()
-    if not context:
-        raise HTTPException(status_code=422, detail="context_id references unknown CODE")
-    if context.type not in {"ORGAN", "INFORMATION_AREA"}:
-        raise HTTPException(status_code=422, detail="context_id must reference CODE type ORGAN or INFORMATION_AREA")
-
-
-def _normalize_context_ids(*, context_id: int | None, context_ids: list[int] | None) -> list[int]:
-    raw = list(context_ids or [])
-    if context_id is not None and context_id not in raw:
-        raw.insert(0, context_id)
-    normalized: list[int] = []
-    seen: set[int] = set()
-    for value in raw:
-        if value in seen:
-            continue
-        seen.add(value)
-        normalized.append(value)
-    return normalized
-
-
-def _ensure_contexts_valid(*, db: Session, context_ids: list[int]) -> None:
-    for context_id in context_ids:
-        _ensure_context_valid(db=db, context_id=context_id)
-
-
-def _enforce_area_context_rules(*, db: Session, context_ids: list[int]) -> list[int]:
-    has_information_area_codes = (
-        db.query(Code).filter(Code.type == "INFORMATION_AREA").first() is not None
-    )
-    if not has_information_area_codes:
-        return context_ids
-    if not context_ids:
-        general = db.query(Code).filter(Code.type == "INFORMATION_AREA", Code.key == "GENERAL").first()
-        return [general.id] if general is not None else context_ids
-    codes_by_id = {
-        code.id: code
-        for code in db.query(Code).filter(Code.id.in_(context_ids)).all()
-    }
-    area_codes = [
-        code
-        for context_id in context_ids
-        for code in [codes_by_id.get(context_id)]
-        if code is not None and code.type == "INFORMATION_AREA"
-    ]
-    organ_codes = [
-        code
-        for context_id in context_ids
-        for code in [codes_by_id.get(context_id)]
-        if code is not None and code.type == "ORGAN"
-    ]
-    if len(area_codes) > 1:
-        raise HTTPException(status_code=422, detail="Only one INFORMATION_AREA context can be set")
-    area_key = area_codes[0].key if area_codes else "GENERAL"
-    if area_key == "ORGAN" and len(organ_codes) == 0:
-        raise HTTPException(status_code=422, detail="At least one ORGAN context is required for INFORMATION_AREA.ORGAN")
-    if area_key != "ORGAN" and len(organ_codes) > 0:
-        raise HTTPException(status_code=422, detail="ORGAN contexts are only allowed for INFORMATION_AREA.ORGAN")
-    if not area_codes:
-        general = db.query(Code).filter(Code.type == "INFORMATION_AREA", Code.key == "GENERAL").first()
-        if general is not None:
-            return [general.id, *context_ids]
-    return context_ids
-
-
 def _sync_information_context_links(*, item: Information, context_ids: list[int]) -> None:
     item.context_id = context_ids[0] if context_ids else None
     item.context_links = [
@@ -99,8 +36,13 @@ def _sync_information_context_links(*, item: Information, context_ids: list[int]
     ]
 
 
+def _today() -> dt.date:
+    """Calendar day that valid_from is compared against, for validation and feed visibility alike."""
+    return dt.date.today()
+
+
 def _next_working_day(today: dt.date | None = None) -> dt.date:
-    base = today or dt.date.today()
+    base = today or _today()
     candidate = base + dt.timedelta(days=1)
     while candidate.weekday() >= 5:
         candidate += dt.timedelta(days=1)
@@ -125,11 +67,6 @@ def _read_map_for_user(*, db: Session, current_user_id: int) -> dict[int, object
     return {row.information_id: row.seen_at for row in rows}
 
 
-def _read_information_ids(*, db: Session) -> set[int]:
-    rows = db.query(InformationUser.information_id).distinct().all()
-    return {information_id for (information_id,) in rows}
-
-
 def _ensure_read_marker(*, db: Session, information_id: int, user_id: int) -> InformationUser:
     marker = (
         db.query(InformationUser)
@@ -175,29 +112,135 @@ def _to_response_row(*, row: Information, current_user_read_at: object | None, h
     }
 
 
-def list_information(*, db: Session, current_user_id: int) -> list[dict]:
-    rows = _information_query(db).order_by(Information.date.desc(), Information.id.desc()).all()
-    read_map = _read_map_for_user(db=db, current_user_id=current_user_id)
-    read_information_ids = _read_information_ids(db=db)
+_FEED_ORDER = (Information.date, Information.id)
+
+
+def _encode_feed_cursor(row: Information) -> str:
+    raw = json.dumps([row.date.isoformat(), row.id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_feed_cursor(cursor: str) -> list[object]:
+    try:
+        values = json.loads(base64.urlsafe_b64decode((cursor + "=" * (-len(cursor) % 4)).encode("ascii")))
+        if not isinstance(values, list) or len(values) != len(_FEED_ORDER) or not isinstance(values[1], int):
+            raise ValueError("unexpected cursor shape")
+        return [dt.date.fromisoformat(values[0]), values[1]]
+    except (ValueError, TypeError, binascii.Error) as exc:
+        raise HTTPException(status_code=422, detail="Invalid information feed cursor") from exc
+
+
+def _feed_filters(*, include_future: bool, include_withdrawn: bool, today: dt.date | None) -> list:
+    filters = []
+    if not include_future:
+        filters.append(Information.valid_from <= (today or _today()))
+    if not include_withdrawn:
+        filters.append(Information.withdrawn.is_(False))
+    return filters
+
+
+def _feed_query(*, db: Session, current_user_id: int):
+    """Rows with the current user's read marker and whether anyone has read them, in one statement."""
+    own_read = aliased(InformationUser)
+    # Correlated EXISTS per row; the primary key (INFORMATION_ID, USER_ID) answers it with one index probe.
+    has_reads = exists().where(InformationUser.information_id == Information.id).correlate(Information)
+    return (
+        db.query(Information, own_read.seen_at, has_reads.label("has_reads"))
+        .outerjoin(own_read, and_(own_read.information_id == Information.id, own_read.user_id == current_user_id))
+        .options(
+            selectinload(Information.context),
+            selectinload(Information.author),
+            selectinload(Information.context_links).selectinload(InformationContext.context),
+        )
+    )
+
+
+def _feed_rows_to_response(*, rows: list, current_user_id: int) -> list[dict]:
     now_utc = dt.datetime.now(dt.timezone.utc)
     response: list[dict] = []
-    for row in rows:
+    for row, seen_at, has_persisted_reads in rows:
         read_at = resolve_current_user_read_at(
-            explicit_read_at=read_map.get(row.id),
+            explicit_read_at=seen_at,
             current_user_id=current_user_id,
             author_id=row.author_id,
             withdrawn=bool(row.withdrawn),
             now_utc=now_utc,
         )
-        has_reads = row.id in read_information_ids or not row.withdrawn
+        has_reads = bool(has_persisted_reads) or not row.withdrawn
         response.append(_to_response_row(row=row, current_user_read_at=read_at, has_reads=has_reads))
     return response
 
 
+def list_information(*, db: Session, current_user_id: int) -> list[dict]:
+    rows = _feed_query(db=db, current_user_id=current_user_id).order_by(Information.date.desc(), Information.id.desc()).all()
+    return _feed_rows_to_response(rows=rows, current_user_id=current_user_id)
+
+
+def count_unread_information(
+    *,
+    db: Session,
+    current_user_id: int,
+    include_future: bool = True,
+    include_withdrawn: bool = True,
+    today: dt.date | None = None,
+) -> int:
+    """Count rows without a read marker of the user; authors have implicitly read their active rows."""
+    read_by_user = exists().where(
+        InformationUser.information_id == Information.id,
+        InformationUser.user_id == current_user_id,
+    )
+    return (
+        db.query(func.count(Information.id))
+        .filter(
+            ~read_by_user,
+            or_(Information.author_id != current_user_id, Information.withdrawn.is_(True)),
+            *_feed_filters(include_future=include_future, include_withdrawn=include_withdrawn, today=today),
+        )
+        .scalar()
+    )
+
+
+def list_information_feed(
+    *,
+    db: Session,
+    current_user_id: int,
+    cursor: str | None = None,
+    limit: int,
+    include_future: bool = False,
+    include_withdrawn: bool = False,
+    today: dt.date | None = None,
+) -> InformationFeedPageResponse:
+    """Return one page of the information feed, newest first, with the user's unread count.
+
+    By default the feed only contains rows that are valid today and not withdrawn. The unread count
+    uses the same filters, including the same `today`, and does not depend on the page.
+    """
+    today = today or _today()
+    query = _feed_query(db=db, current_user_id=current_user_id).filter(
+        *_feed_filters(include_future=include_future, include_withdrawn=include_withdrawn, today=today)
+    )
+    if cursor:
+        query = query.filter(tuple_(*_FEED_ORDER) < tuple_(*_decode_feed_cursor(cursor)))
+    rows = query.order_by(Information.date.desc(), Information.id.desc()).limit(limit + 1).all()
+    next_cursor = _encode_feed_cursor(rows[limit - 1][0]) if len(rows) > limit else None
+    return InformationFeedPageResponse(
+        items=[
+            InformationResponse.model_validate(item, from_attributes=True)
+            for item in _feed_rows_to_response(rows=rows[:limit], current_user_id=current_user_id)
+        ],
+        next_cursor=next_cursor,
+        unread_count=count_unread_information(
+            db=db,
+            current_user_id=current_user_id,
+            include_future=include_future,
+            include_withdrawn=include_withdrawn,
+            today=today,
+        ),
+    )
+
+
 def create_information(*, payload: InformationCreate, db: Session, current_user_id: int) -> dict:
-    context_ids = _normalize_context_ids(context_id=payload.context_id, context_ids=payload.context_ids)
-    _ensure_contexts_valid(db=db, context_ids=context_ids)
-    context_ids = _enforce_area_context_rules(db=db, context_ids=context_ids)
+    context_ids = resolve_information_context_ids(db=db, context_id=payload.context_id, context_ids=payload.context_ids)
     _ensure_author_exists(db=db, author_id=current_user_id)
     _validate_valid_from(valid_from=payload.valid_from)
     data = payload.model_dump(exclude={"context_ids"})
@@ -231,12 +274,11 @@ def update_information(
         raise HTTPException(status_code=403, detail="Only the author or an admin user can edit this information")
     data = payload.model_dump(exclude_unset=True)
     if "context_ids" in data or "context_id" in data:
-        merged_context_ids = _normalize_context_ids(
+        merged_context_ids = resolve_information_context_ids(
+            db=db,
             context_id=data.get("context_id", item.context_id),
             context_ids=data.get("context_ids"),
         )
-        _ensure_contexts_valid(db=db, context_ids=merged_context_ids)
-        merged_context_ids = _enforce_area_context_rules(db=db, context_ids=merged_context_ids)
         _sync_information_context_links(item=item, context_ids=merged_context_ids)
         data["context_id"] = merged_context_ids[0] if merged_context_ids else None
     if "context_ids" in data:
@@ -4,16 +4,29 @@ from .service import (
     delete_medical_value_for_patient,
     ensure_group_instance,
     get_medical_value_template_or_404,
-    instantiate_templates_for_patient,
     list_medical_value_templates,
     list_medical_values_for_patient,
     update_medical_value_for_patient,
 )
+from .instantiation import (
+    MedicalValueInstantiationResult,
+    instantiate_templates_for_patient,
+    instantiate_templates_for_patients,
+)
+from .normalization import (
+    MedicalValueNormalizationInput,
+    NormalizationRule,
+    invalidate_normalization_rules,
+    normalize_many,
+)
+from .renormalization import MedicalValueRenormalizationResult, renormalize_medical_values
 from .migration import migrate_medical_value_unit_fields
 from .verification import verify_medical_value_unit_coverage
 
 __all__ = [
     "instantiate_templates_for_patient",
+    "instantiate_templates_for_patients",
+    "MedicalValueInstantiationResult",
     "ensure_group_instance",
     "build_context_key",
     "list_medical_values_for_patient",
@@ -22,6 +35,12 @@ __all__ = [
     "delete_medical_value_for_patient",
     "list_medical_value_templates",
     "get_medical_value_template_or_404",
+    "normalize_many",
+    "MedicalValueNormalizationInput",
+    "NormalizationRule",
+    "invalidate_normalization_rules",
+    "renormalize_medical_values",
+    "MedicalValueRenormalizationResult",
     "migrate_medical_value_unit_fields",
     "verify_medical_value_unit_coverage",
 ]
@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session, selectinload
+
+from ...audit_context import get_current_changed_by_id
+from ...models import (
+    Episode,
+    MedicalValue,
+    MedicalValueGroup,
+    MedicalValueGroupTemplate,
+    MedicalValueTemplate,
+    Patient,
+)
+from .service import _iter_episode_organs, build_context_key
+
+_INSTANTIATION_BATCH_SIZE = 500
+_STATIC_TOKEN = ("STATIC", None)
+_DONOR_TOKEN = ("DONOR", None)
+
+
+@dataclass(frozen=True)
+class _CatalogEntry:
+    template_id: int
+    group_id: int
+    datatype_id: int | None
+    name: str
+    pos: int
+    allowed_tokens: frozenset[tuple[str, int | None]]
+
+
+@dataclass
+class MedicalValueInstantiationResult:
+    patients: int = 0
+    created_groups: int = 0
+    created_values: int = 0
+    created_values_by_patient: dict[int, int] = field(default_factory=dict)
+
+
+def _load_template_catalog(db: Session) -> list[_CatalogEntry]:
+    """Load group and value templates once, reduced to the context tokens both of them allow."""
+    groups = (
+        db.query(MedicalValueGroupTemplate)
+        .options(selectinload(MedicalValueGroupTemplate.context_templates))
+        .all()
+    )
+    group_tokens = {
+        group.id: {(entry.context_kind, entry.organ_id) for entry in group.context_templates} for group in groups
+    }
+    templates = (
+        db.query(MedicalValueTemplate)
+        .options(selectinload(MedicalValueTemplate.context_templates))
+        .filter(MedicalValueTemplate.medical_value_group_id.isnot(None))
+        .order_by(MedicalValueTemplate.pos.asc(), MedicalValueTemplate.id.asc())
+        .all()
+    )
+    catalog: list[_CatalogEntry] = []
+    for template in templates:
+        tokens = group_tokens.get(template.medical_value_group_id or -1)
+        if tokens is None:
+            continue
+        template_tokens = {(entry.context_kind, entry.organ_id) for entry in template.context_templates}
+        catalog.append(
+            _CatalogEntry(
+                template_id=template.id,
+                group_id=template.medical_value_group_id,
+                datatype_id=template.datatype_id,
+                name=template.name_default or "",
+                pos=template.pos or 0,
+                allowed_tokens=frozenset(tokens & template_tokens),
+            )
+        )
+    return catalog
+
+
+def _missing_contexts(
+    catalog: list[_CatalogEntry],
+    available_tokens: set[tuple[str, int | None]],
+    existing: set[tuple[int, bool]],
+    *,
+    include_donor_context: bool,
+) -> Iterator[tuple[_CatalogEntry, bool]]:
+    """Yield `(template, is_donor_context)` pairs a patient should have but does not have yet."""
+    for entry in catalog:
+        if (entry.template_id, False) not in existing and not available_tokens.isdisjoint(entry.allowed_tokens):
+            yield entry, False
+        if include_donor_context and (entry.template_id, True) not in existing and _DONOR_TOKEN in entry.allowed_tokens:
+            yield entry, True
+
+
+def _value_row(
+    entry: _CatalogEntry,
+    *,
+    patient_id: int,
+    group_instance_id: int,
+    is_donor_context: bool,
+    changed_by_id: int | None,
+) -> dict[str, object]:
+    return {
+        "patient_id": patient_id,
+        "medical_value_template_id": entry.template_id,
+        "datatype_id": entry.datatype_id,
+        "medical_value_group_id": entry.group_id,
+        "medical_value_group_instance_id": group_instance_id,
+        "name": entry.name,
+        "pos": entry.pos,
+        "value": "",
+        "value_input": "",
+        "unit_input_ucum": None,
+        "value_canonical": "",
+        "unit_canonical_ucum": None,
+        "normalization_status": "UNSPECIFIED",
+        "normalization_error": "",
+        "renew_date": None,
+        "organ_id": None,
+        "is_donor_context": is_donor_context,
+        "context_key": build_context_key(organ_id=None, is_donor_context=is_donor_context),
+        "changed_by_id": changed_by_id,
+        "created_by_id": changed_by_id,
+    }
+
+
+def _instantiate_batch(
+    db: Session,
+    catalog: list[_CatalogEntry],
+    patient_ids: list[int],
+    *,
+    include_donor_context: bool,
+    changed_by_id: int | None,
+    result: MedicalValueInstantiationResult,
+) -> None:
+    available_tokens: dict[int, set[tuple[str, int | None]]] = {patient_id: {_STATIC_TOKEN} for patient_id in patient_ids}
+    open_episodes = (
+        db.query(Episode)
+        .options(selectinload(Episode.organs))
+        .filter(Episode.patient_id.in_(patient_ids), Episode.closed.is_(False))
+        .all()
+    )
+    for episode in open_episodes:
+        available_tokens[episode.patient_id].update(("ORGAN", organ_id) for organ_id in _iter_episode_organs(episode))
+
+    existing: dict[int, set[tuple[int, bool]]] = {patient_id: set() for patient_id in patient_ids}
+    for patient_id, template_id, is_donor_context in db.query(
+        MedicalValue.patient_id, MedicalValue.medical_value_template_id, MedicalValue.is_donor_context
+    ).filter(MedicalValue.patient_id.in_(patient_ids), MedicalValue.medical_value_template_id.isnot(None)):
+        existing[patient_id].add((template_id, bool(is_donor_context)))
+
+    planned = [
+        (patient_id, entry, is_donor_context)
+        for patient_id in patient_ids
+        for entry, is_donor_context in _missing_contexts(
+            catalog,
+            available_tokens[patient_id],
+            existing[patient_id],
+            include_donor_context=include_donor_context,
+        )
+    ]
+    if not planned:
+        return
+
+    def _group_instance_ids() -> dict[tuple[int, int, str], int]:
+        return {
+            (patient_id, group_id, context_key): instance_id
+            for patient_id, group_id, context_key, instance_id in db.query(
+                MedicalValueGroup.patient_id,
+                MedicalValueGroup.medical_value_group_id,
+                MedicalValueGroup.context_key,
+                MedicalValueGroup.id,
+            ).filter(MedicalValueGroup.patient_id.in_(patient_ids))
+        }
+
+    def _group_key(patient_id: int, entry: _CatalogEntry, is_donor_context: bool) -> tuple[int, int, str]:
+        return patient_id, entry.group_id, build_context_key(organ_id=None, is_donor_context=is_donor_context)
+
+    group_ids = _group_instance_ids()
+    missing_groups = list(
+        dict.fromkeys(
+            key for key in (_group_key(*item) for item in planned) if key not in group_ids
+        )
+    )
+    if missing_groups:
+        db.execute(
+            insert(MedicalValueGroup),
+            [
+                {
+                    "patient_id": patient_id,
+                    "medical_value_group_id": group_id,
+                    "context_key": context_key,
+                    "organ_id": None,
+                    "is_donor_context": context_key == build_context_key(is_donor_context=True),
+                    "changed_by_id": changed_by_id,
+                    "created_by_id": changed_by_id,
+                }
+                for patient_id, group_id, context_key in missing_groups
+            ],
+        )
+        group_ids = _group_instance_ids()
+        result.created_groups += len(missing_groups)
+
+    # New values are empty, so the patient list projection (which only shows filled static values) is unaffected.
+    db.execute(
+        insert(MedicalValue),
+        [
+            _value_row(
+                entry,
+                patient_id=patient_id,
+                group_instance_id=group_ids[_group_key(patient_id, entry, is_donor_context)],
+                is_donor_context=is_donor_context,
+                changed_by_id=changed_by_id,
+            )
+            for patient_id, entry, is_donor_context in planned
+        ],
+    )
+    for patient_id, _, _ in planned:
+        result.created_values_by_patient[patient_id] = result.created_values_by_patient.get(patient_id, 0) + 1
+    result.created_values += len(planned)
+
+
+def instantiate_templates_for_patients(
+    db: Session,
+    patient_ids: Iterable[int] | None = None,
+    *,
+    include_donor_context: bool = False,
+    changed_by_id: int | None = None,
+    batch_size: int = _INSTANTIATION_BATCH_SIZE,
+) -> MedicalValueInstantiationResult:
+    """Create the template-based medical values missing for the given patients (all patients by default).
+
+    The template catalog is loaded once; existing values and group instances are prefetched per batch of
+    patients and the missing rows are written with one multi-row insert per table and batch.
+    """
+    if changed_by_id is None:
+        changed_by_id = get_current_changed_by_id()
+    query = db.query(Patient.id)
+    if patient_ids is not None:
+        query = query.filter(Patient.id.in_(list(patient_ids)))
+    target_ids = [patient_id for (patient_id,) in query.order_by(Patient.id).all()]
+    result = MedicalValueInstantiationResult(patients=len(target_ids))
+    if not target_ids:
+        return result
+    catalog = _load_template_catalog(db)
+    for start in range(0, len(target_ids), batch_size):
+        _instantiate_batch(
+            db,
+            catalog,
+            target_ids[start : start + batch_size],
+            include_donor_context=include_donor_context,
+            changed_by_id=changed_by_id,
+            result=result,
+        )
+    db.commit()
+    return result
+
+
+def instantiate_templates_for_patient(
+    db: Session,
+    patient_id: int,
+    *,
+    include_donor_context: bool = False,
+    changed_by_id: int | None = None,
+) -> dict[str, int]:
+    result = instantiate_templates_for_patients(
+        db,
+        [patient_id],
+        include_donor_context=include_donor_context,
+        changed_by_id=changed_by_id,
+    )
+    return {"created_values": result.created_values}
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
 import json
+import time
+from collections.abc import Iterable
 from dataclasses import dataclass
 from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+from threading import Lock
 
 from fastapi import HTTPException
+from sqlalchemy.orm import Session
 
-from ...models import DatatypeDefinition
+from ...data_versions import get_table_versions
+from ...models import DatatypeDefinition, MedicalValueTemplate
 
 
 @dataclass
@@ -45,25 +50,89 @@ def _parse_allowed_units(raw_json: str | None) -> list[str]:
     return result
 
 
-def _quantize_decimal(value: Decimal, precision: int | None) -> Decimal:
+def _quantizer(precision: int | None) -> Decimal | None:
     if precision is None or precision < 0:
-        return value
+        return None
     if precision == 0:
-        return value.quantize(Decimal("1"), rounding=ROUND_HALF_UP)
-    quant = Decimal("1").scaleb(-precision)
-    return value.quantize(quant, rounding=ROUND_HALF_UP)
+        return Decimal("1")
+    return Decimal("1").scaleb(-precision)
+
+
+def _quantize_decimal(value: Decimal, quantizer: Decimal | None) -> Decimal:
+    if quantizer is None:
+        return value
+    return value.quantize(quantizer, rounding=ROUND_HALF_UP)
+
+
+def _decimal_text(value: Decimal) -> str:
+    text = format(value, "f")
+    return text.rstrip("0").rstrip(".") if "." in text else text
+
+
+@dataclass(frozen=True)
+class NormalizationRule:
+    """Datatype definition compiled for normalization: parsed units, conversion factors and quantizer."""
+
+    primitive: str
+    canonical_unit: str | None
+    allowed_units: frozenset[str]
+    expected_group: str | None
+    quantizer: Decimal | None
+    # Input unit -> (source factor, target factor), or the 422 detail when the unit cannot be converted.
+    conversions: dict[str, tuple[Decimal, Decimal] | str]
+
+
+def _conversion(input_unit: str, canonical_unit: str, expected_group: str | None) -> tuple[Decimal, Decimal] | str:
+    source = _UNIT_FACTORS.get(input_unit)
+    target = _UNIT_FACTORS.get(canonical_unit)
+    if source is None or target is None:
+        return f"Unsupported unit conversion: {input_unit} -> {canonical_unit}"
+    if source[0] != target[0]:
+        return "Incompatible unit dimensions for conversion"
+    if expected_group and source[0] != expected_group:
+        return "Configured conversion_group does not match unit dimensions"
+    return source[1], target[1]
+
+
+def compile_normalization_rule(datatype_definition: DatatypeDefinition) -> NormalizationRule:
+    canonical_unit = (
+        (datatype_definition.canonical_unit_ucum or "").strip()
+        or (datatype_definition.unit or "").strip()
+        or None
+    )
+    allowed_units = _parse_allowed_units(datatype_definition.allowed_units_ucum_json)
+    if not allowed_units and canonical_unit:
+        allowed_units = [canonical_unit]
+    expected_group = (datatype_definition.conversion_group or "").strip() or None
+    conversions: dict[str, tuple[Decimal, Decimal] | str] = {}
+    if canonical_unit:
+        for unit in allowed_units:
+            if unit != canonical_unit:
+                conversions[unit] = _conversion(unit, canonical_unit, expected_group)
+    return NormalizationRule(
+        primitive=(datatype_definition.primitive_kind or "text").strip().lower(),
+        canonical_unit=canonical_unit,
+        allowed_units=frozenset(allowed_units),
+        expected_group=expected_group,
+        quantizer=_quantizer(datatype_definition.precision),
+        conversions=conversions,
+    )
 
 
 def normalize_medical_value(
     *,
     raw_value: str,
     unit_input_ucum: str | None,
-    datatype_definition: DatatypeDefinition | None,
+    datatype_definition: DatatypeDefinition | None = None,
+    rule: NormalizationRule | None = None,
 ) -> NormalizedMedicalValue:
+    """Normalize one value with `rule`, or with a rule compiled ad hoc from `datatype_definition`."""
     value_input = raw_value or ""
     input_unit = (unit_input_ucum or "").strip() or None
 
-    if datatype_definition is None:
+    if rule is None and datatype_definition is not None:
+        rule = compile_normalization_rule(datatype_definition)
+    if rule is None:
         return NormalizedMedicalValue(
             value_input=value_input,
             unit_input_ucum=input_unit,
@@ -74,20 +143,11 @@ def normalize_medical_value(
             value_legacy=value_input,
         )
 
-    primitive = (datatype_definition.primitive_kind or "text").strip().lower()
-    canonical_unit = (
-        (datatype_definition.canonical_unit_ucum or "").strip()
-        or (datatype_definition.unit or "").strip()
-        or None
-    )
-    allowed_units = _parse_allowed_units(datatype_definition.allowed_units_ucum_json)
-    if not allowed_units and canonical_unit:
-        allowed_units = [canonical_unit]
-
-    if input_unit and allowed_units and input_unit not in allowed_units:
+    canonical_unit = rule.canonical_unit
+    if input_unit and rule.allowed_units and input_unit not in rule.allowed_units:
         raise HTTPException(status_code=422, detail=f"unit_input_ucum '{input_unit}' is not allowed for this datatype")
 
-    if primitive != "number":
+    if rule.primitive != "number":
         # Non-numeric values are not converted; canonical mirrors input.
         return NormalizedMedicalValue(
             value_input=value_input,
@@ -116,8 +176,7 @@ def normalize_medical_value(
         raise HTTPException(status_code=422, detail="Value must be numeric for this datatype") from exc
 
     if not canonical_unit:
-        normalized = _quantize_decimal(numeric_value, datatype_definition.precision)
-        normalized_text = format(normalized, "f").rstrip("0").rstrip(".") if "." in format(normalized, "f") else format(normalized, "f")
+        normalized_text = _decimal_text(_quantize_decimal(numeric_value, rule.quantizer))
         return NormalizedMedicalValue(
             value_input=value_input,
             unit_input_ucum=input_unit,
@@ -130,24 +189,17 @@ def normalize_medical_value(
 
     effective_input_unit = input_unit or canonical_unit
     if effective_input_unit == canonical_unit:
-        normalized = _quantize_decimal(numeric_value, datatype_definition.precision)
+        normalized = _quantize_decimal(numeric_value, rule.quantizer)
     else:
-        source = _UNIT_FACTORS.get(effective_input_unit)
-        target = _UNIT_FACTORS.get(canonical_unit)
-        expected_group = (datatype_definition.conversion_group or "").strip() or None
-        if source is None or target is None:
-            raise HTTPException(
-                status_code=422,
-                detail=f"Unsupported unit conversion: {effective_input_unit} -> {canonical_unit}",
-            )
-        if source[0] != target[0]:
-            raise HTTPException(status_code=422, detail="Incompatible unit dimensions for conversion")
-        if expected_group and source[0] != expected_group:
-            raise HTTPException(status_code=422, detail="Configured conversion_group does not match unit dimensions")
-        normalized_base = numeric_value * source[1]
-        normalized = _quantize_decimal(normalized_base / target[1], datatype_definition.precision)
-
-    normalized_text = format(normalized, "f").rstrip("0").rstrip(".") if "." in format(normalized, "f") else format(normalized, "f")
+        conversion = rule.conversions.get(effective_input_unit)
+        if conversion is None:
+            conversion = _conversion(effective_input_unit, canonical_unit, rule.expected_group)
+        if isinstance(conversion, str):
+            raise HTTPException(status_code=422, detail=conversion)
+        source_factor, target_factor = conversion
+        normalized = _quantize_decimal(numeric_value * source_factor / target_factor, rule.quantizer)
+
+    normalized_text = _decimal_text(normalized)
     return NormalizedMedicalValue(
         value_input=value_input,
         unit_input_ucum=effective_input_unit,
@@ -157,3 +209,155 @@ def normalize_medical_value(
         normalization_error="",
         value_legacy=normalized_text,
     )
+
+
+# Changes written by other processes (CLI migrations, seeding) do not bump the in-process table versions.
+NORMALIZATION_RULES_TTL_SECONDS = 60.0
+
+
+@dataclass(frozen=True)
+class _RuleSnapshot:
+    versions: tuple[int, ...]
+    expires_at: float
+    rules_by_definition_id: dict[int, NormalizationRule]
+    rules_by_code_id: dict[int, NormalizationRule]
+    # Template id -> (DATATYPE_DEF_ID, DATATYPE_ID).
+    template_refs: dict[int, tuple[int | None, int | None]]
+
+
+def _rule_key(definition: DatatypeDefinition) -> tuple:
+    # Keyed by the columns the rule is compiled from: raw SQL edits do not bump ROW_VERSION.
+    return (
+        definition.id,
+        definition.primitive_kind,
+        definition.unit,
+        definition.canonical_unit_ucum,
+        definition.allowed_units_ucum_json,
+        definition.conversion_group,
+        definition.precision,
+    )
+
+
+class NormalizationRuleRegistry:
+    """Process-wide compiled rules, reloaded whenever datatype definitions or templates change (or after the TTL).
+
+    Rules are compiled per definition id and rule columns, so a reload only recompiles edited definitions.
+    """
+
+    _TABLES = (DatatypeDefinition.__tablename__, MedicalValueTemplate.__tablename__)
+
+    def __init__(self) -> None:
+        self._snapshot: _RuleSnapshot | None = None
+        self._compiled: dict[tuple, NormalizationRule] = {}
+        self._lock = Lock()
+
+    def _load(self, db: Session, versions: tuple[int, ...]) -> _RuleSnapshot:
+        compiled: dict[tuple, NormalizationRule] = {}
+        rules_by_definition_id: dict[int, NormalizationRule] = {}
+        rules_by_code_id: dict[int, NormalizationRule] = {}
+        for definition in db.query(DatatypeDefinition).all():
+            key = _rule_key(definition)
+            rule = self._compiled.get(key) or compile_normalization_rule(definition)
+            compiled[key] = rule
+            rules_by_definition_id[definition.id] = rule
+            rules_by_code_id[definition.code_id] = rule
+        template_refs = {
+            template_id: (datatype_def_id, datatype_id)
+            for template_id, datatype_def_id, datatype_id in db.query(
+                MedicalValueTemplate.id, MedicalValueTemplate.datatype_def_id, MedicalValueTemplate.datatype_id
+            )
+        }
+        self._compiled = compiled
+        return _RuleSnapshot(
+            versions,
+            time.monotonic() + NORMALIZATION_RULES_TTL_SECONDS,
+            rules_by_definition_id,
+            rules_by_code_id,
+            template_refs,
+        )
+
+    def _is_current(self, snapshot: _RuleSnapshot | None, versions: tuple[int, ...]) -> bool:
+        return snapshot is not None and snapshot.versions == versions and snapshot.expires_at > time.monotonic()
+
+    def snapshot(self, db: Session) -> _RuleSnapshot:
+        versions = get_table_versions(self._TABLES)
+        snapshot = self._snapshot
+        if self._is_current(snapshot, versions):
+            return snapshot
+        with self._lock:
+            if not self._is_current(self._snapshot, versions):
+                # Read committed rows only, so a snapshot never caches changes of a transaction that rolls back.
+                with Session(bind=db.get_bind()) as rules_db:
+                    self._snapshot = self._load(rules_db, versions)
+            return self._snapshot
+
+    def rule_for(self, *, template_id: int | None, datatype_id: int | None, db: Session) -> NormalizationRule | None:
+        return _rule_from_snapshot(self.snapshot(db), template_id=template_id, datatype_id=datatype_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._snapshot = None
+            self._compiled = {}
+
+
+def _rule_from_snapshot(
+    snapshot: _RuleSnapshot,
+    *,
+    template_id: int | None,
+    datatype_id: int | None,
+) -> NormalizationRule | None:
+    # Template definition first, then the template datatype, then the value's own datatype.
+    refs = snapshot.template_refs.get(template_id) if template_id is not None else None
+    if refs is not None:
+        datatype_def_id, template_datatype_id = refs
+        if datatype_def_id is not None and datatype_def_id in snapshot.rules_by_definition_id:
+            return snapshot.rules_by_definition_id[datatype_def_id]
+        if template_datatype_id is not None:
+            return snapshot.rules_by_code_id.get(template_datatype_id)
+    if datatype_id is not None:
+        return snapshot.rules_by_code_id.get(datatype_id)
+    return None
+
+
+NORMALIZATION_RULES = NormalizationRuleRegistry()
+
+
+def invalidate_normalization_rules() -> None:
+    """Drop compiled rules, e.g. after datatype definitions were changed outside the app session."""
+    NORMALIZATION_RULES.clear()
+
+
+@dataclass(frozen=True)
+class MedicalValueNormalizationInput:
+    raw_value: str
+    unit_input_ucum: str | None = None
+    template_id: int | None = None
+    datatype_id: int | None = None
+
+
+def normalize_many(items: Iterable[MedicalValueNormalizationInput], *, db: Session) -> list[NormalizedMedicalValue]:
+    """Normalize a batch of values against one rule snapshot, e.g. for imports and migrations.
+
+    Values that would be rejected with 422 on the API are returned with status `ERROR` and the reason in
+    `normalization_error` instead of aborting the batch.
+    """
+    snapshot = NORMALIZATION_RULES.snapshot(db)
+    results: list[NormalizedMedicalValue] = []
+    for item in items:
+        rule = _rule_from_snapshot(snapshot, template_id=item.template_id, datatype_id=item.datatype_id)
+        try:
+            results.append(normalize_medical_value(raw_value=item.raw_value, unit_input_ucum=item.unit_input_ucum, rule=rule))
+        except HTTPException as exc:
+            value_input = item.raw_value or ""
+            results.append(
+                NormalizedMedicalValue(
+                    value_input=value_input,
+                    unit_input_ucum=(item.unit_input_ucum or "").strip() or None,
+                    value_canonical="",
+                    unit_canonical_ucum=rule.canonical_unit if rule else None,
+                    normalization_status="ERROR",
+                    normalization_error=str(exc.detail),
+                    value_legacy=value_input,
+                )
+            )
+    return results
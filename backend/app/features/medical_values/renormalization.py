@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from ...data_versions import bump_table_versions
+from ...models import DatatypeDefinition, MedicalValue, MedicalValueRenormalizationState, MedicalValueTemplate
+from .normalization import MedicalValueNormalizationInput, invalidate_normalization_rules, normalize_many
+
+RENORMALIZATION_BATCH_SIZE = 500
+RENORMALIZATION_MAX_ROWS_PER_RUN = 5000
+_NORMALIZED_FIELDS = (
+    "value",
+    "unit_input_ucum",
+    "value_canonical",
+    "unit_canonical_ucum",
+    "normalization_status",
+    "normalization_error",
+)
+
+
+@dataclass
+class MedicalValueRenormalizationResult:
+    definitions_checked: int = 0
+    definitions_pending: int = 0
+    definitions_completed: int = 0
+    batches: int = 0
+    rows_scanned: int = 0
+    rows_updated: int = 0
+    rows_failed: int = 0
+
+    def metrics(self) -> dict[str, int]:
+        return dict(vars(self))
+
+
+def _rule_signature(definition: DatatypeDefinition) -> str:
+    # Only normalization inputs count; ROW_VERSION also moves on edits that leave stored values valid.
+    return json.dumps(
+        [
+            definition.primitive_kind,
+            definition.unit,
+            definition.canonical_unit_ucum,
+            definition.allowed_units_ucum_json,
+            definition.conversion_group,
+            definition.precision,
+        ],
+        ensure_ascii=True,
+    )
+
+
+def sync_renormalization_states(*, db: Session, now: datetime) -> int:
+    """Start a new pass for every datatype whose rule changed since its values were last normalized.
+
+    A definition seen for the first time is taken as the baseline: its values were normalized on save.
+    Returns the number of definitions with a pass pending.
+    """
+    states = {state.datatype_def_id: state for state in db.query(MedicalValueRenormalizationState).all()}
+    for definition in db.query(DatatypeDefinition).all():
+        signature = _rule_signature(definition)
+        state = states.get(definition.id)
+        if state is None:
+            db.add(
+                MedicalValueRenormalizationState(
+                    datatype_def_id=definition.id,
+                    rule_signature=signature,
+                    status="DONE",
+                    last_medical_value_id=0,
+                    rows_scanned=0,
+                    rows_updated=0,
+                    rows_failed=0,
+                )
+            )
+            continue
+        if state.rule_signature == signature:
+            continue
+        # A rule edited mid-pass restarts the pass, since already visited rows used the old rule.
+        state.rule_signature = signature
+        state.status = "PENDING"
+        state.last_medical_value_id = 0
+        state.rows_scanned = 0
+        state.rows_updated = 0
+        state.rows_failed = 0
+        state.started_at = now
+        state.completed_at = None
+    db.commit()
+    return db.query(MedicalValueRenormalizationState).filter(MedicalValueRenormalizationState.status == "PENDING").count()
+
+
+def _affected_rows_query(db: Session, definition: DatatypeDefinition):
+    # Rows whose rule may resolve to this definition: via template definition, template datatype or own datatype.
+    return (
+        db.query(
+            MedicalValue.id,
+            MedicalValue.row_version,
+            MedicalValue.patient_id,
+            MedicalValue.medical_value_template_id,
+            MedicalValue.datatype_id,
+            MedicalValue.value_input,
+            *(getattr(MedicalValue, name) for name in _NORMALIZED_FIELDS),
+        )
+        .outerjoin(MedicalValueTemplate, MedicalValueTemplate.id == MedicalValue.medical_value_template_id)
+        .filter(
+            or_(
+                MedicalValueTemplate.datatype_def_id == definition.id,
+                MedicalValueTemplate.datatype_id == definition.code_id,
+                MedicalValue.datatype_id == definition.code_id,
+            ),
+            # Template placeholders that were never captured keep their marker.
+            MedicalValue.normalization_status != "UNSPECIFIED",
+        )
+        .order_by(MedicalValue.id.asc())
+    )
+
+
+def _renormalize_batch(db: Session, rows: list) -> tuple[list[dict[str, object]], set[int], int]:  # noqa: ANN001
+    normalized_rows = normalize_many(
+        [
+            MedicalValueNormalizationInput(
+                raw_value=row.value_input if row.value_input not in (None, "") else (row.value or ""),
+                unit_input_ucum=row.unit_input_ucum,
+                template_id=row.medical_value_template_id,
+                datatype_id=row.datatype_id,
+            )
+            for row in rows
+        ],
+        db=db,
+    )
+    mappings: list[dict[str, object]] = []
+    patient_ids: set[int] = set()
+    failed = 0
+    for row, normalized in zip(rows, normalized_rows):
+        if normalized.normalization_status == "ERROR":
+            failed += 1
+        values = {
+            "value": normalized.value_legacy,
+            "unit_input_ucum": normalized.unit_input_ucum,
+            "value_canonical": normalized.value_canonical,
+            "unit_canonical_ucum": normalized.unit_canonical_ucum,
+            "normalization_status": normalized.normalization_status,
+            "normalization_error": normalized.normalization_error,
+        }
+        if all(getattr(row, name) == values[name] for name in _NORMALIZED_FIELDS):
+            continue
+        mappings.append({"id": row.id, "row_version": row.row_version, **values})
+        patient_ids.add(row.patient_id)
+    return mappings, patient_ids, failed
+
+
+def renormalize_medical_values(
+    *,
+    db: Session,
+    now: datetime | None = None,
+    batch_size: int = RENORMALIZATION_BATCH_SIZE,
+    max_rows: int = RENORMALIZATION_MAX_ROWS_PER_RUN,
+) -> MedicalValueRenormalizationResult:
+    """Re-normalize medical values of changed datatypes in committed batches, resuming from the checkpoints.
+
+    At most `max_rows` rows are scanned per call, so large passes are spread over several scheduler runs.
+    """
+    from ..patients import refresh_patient_list_projection
+
+    now = now or datetime.now(UTC)
+    result = MedicalValueRenormalizationResult(definitions_checked=db.query(DatatypeDefinition).count())
+    result.definitions_pending = sync_renormalization_states(db=db, now=now)
+    if not result.definitions_pending:
+        return result
+    # Rules may have been edited by another process within the registry TTL.
+    invalidate_normalization_rules()
+
+    pending = (
+        db.query(MedicalValueRenormalizationState, DatatypeDefinition)
+        .join(DatatypeDefinition, DatatypeDefinition.id == MedicalValueRenormalizationState.datatype_def_id)
+        .filter(MedicalValueRenormalizationState.status == "PENDING")
+        .order_by(MedicalValueRenormalizationState.datatype_def_id.asc())
+        .all()
+    )
+    budget = max_rows
+    for state, definition in pending:
+        while budget > 0:
+            limit = min(batch_size, budget)
+            rows = list(
+                _affected_rows_query(db, definition)
+                .filter(MedicalValue.id > state.last_medical_value_id)
+                .limit(limit)
+                .yield_per(limit)
+            )
+            if not rows:
+                state.status = "DONE"
+                state.completed_at = datetime.now(UTC)
+                db.commit()
+                result.definitions_completed += 1
+                break
+            mappings, patient_ids, failed = _renormalize_batch(db, rows)
+            if mappings:
+                db.bulk_update_mappings(MedicalValue, mappings)
+                # Bulk mappings bypass the flush hooks that keep the patient overview current.
+                refresh_patient_list_projection(db.connection(), patient_ids=patient_ids)
+            state.last_medical_value_id = rows[-1].id
+            state.rows_scanned += len(rows)
+            state.rows_updated += len(mappings)
+            state.rows_failed += failed
+            db.commit()
+            if mappings:
+                bump_table_versions([MedicalValue.__tablename__])
+            result.batches += 1
+            result.rows_scanned += len(rows)
+            result.rows_updated += len(mappings)
+            result.rows_failed += failed
+            budget -= len(rows)
+        if budget <= 0:
+            break
+    return result
@@ -4,7 +4,7 @@ from collections.abc import Iterable
 
 from fastapi import HTTPException
 from sqlalchemy import func
-from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy.orm import Session, joinedload
 
 from ...models import (
     DatatypeDefinition,
@@ -17,7 +17,7 @@ from ...models import (
     Patient,
 )
 from ...schemas import MedicalValueCreate, MedicalValueUpdate
-from .normalization import normalize_medical_value
+from .normalization import NORMALIZATION_RULES, normalize_medical_value
 
 
 def build_context_key(
@@ -76,147 +76,6 @@ def ensure_group_instance(
     return instance
 
 
-def instantiate_templates_for_patient(
-    db: Session,
-    patient_id: int,
-    *,
-    include_donor_context: bool = False,
-    changed_by_id: int | None = None,
-) -> dict[str, int]:
-    patient = db.query(Patient).filter(Patient.id == patient_id).first()
-    if not patient:
-        return {"created_values": 0}
-
-    groups = (
-        db.query(MedicalValueGroupTemplate)
-        .options(selectinload(MedicalValueGroupTemplate.context_templates))
-        .all()
-    )
-    group_by_id = {group.id: group for group in groups}
-    templates = (
-        db.query(MedicalValueTemplate)
-        .options(selectinload(MedicalValueTemplate.context_templates))
-        .filter(MedicalValueTemplate.medical_value_group_id.isnot(None))
-        .order_by(MedicalValueTemplate.pos.asc(), MedicalValueTemplate.id.asc())
-        .all()
-    )
-
-    available_non_donor_tokens: set[tuple[str, int | None]] = {("STATIC", None)}
-    open_episodes = db.query(Episode).filter(Episode.patient_id == patient_id, Episode.closed.is_(False)).all()
-    seen_organ_ids: set[int] = set()
-    for episode in open_episodes:
-        for organ_id in _iter_episode_organs(episode):
-            if organ_id in seen_organ_ids:
-                continue
-            seen_organ_ids.add(organ_id)
-            available_non_donor_tokens.add(("ORGAN", organ_id))
-
-    existing = {
-        (
-            row.medical_value_template_id,
-            bool(row.is_donor_context),
-        )
-        for row in db.query(MedicalValue).filter(MedicalValue.patient_id == patient_id).all()
-        if row.medical_value_template_id is not None
-    }
-
-    created = 0
-    donor_token = ("DONOR", None)
-    non_donor_context_key = build_context_key(organ_id=None, is_donor_context=False)
-    donor_context_key = build_context_key(organ_id=None, is_donor_context=True)
-
-    for template in templates:
-        group = group_by_id.get(template.medical_value_group_id or -1)
-        if not group:
-            continue
-
-        group_tokens = {(entry.context_kind, entry.organ_id) for entry in group.context_templates}
-        template_tokens = {(entry.context_kind, entry.organ_id) for entry in template.context_templates}
-        allowed_tokens = group_tokens & template_tokens
-
-        non_donor_applicable = any(token in available_non_donor_tokens for token in allowed_tokens)
-        donor_applicable = include_donor_context and donor_token in allowed_tokens
-
-        if non_donor_applicable:
-            key = (template.id, False)
-            if key not in existing:
-                group_instance = ensure_group_instance(
-                    db,
-                    patient_id=patient_id,
-                    medical_value_group_id=template.medical_value_group_id,
-                    context_key=non_donor_context_key,
-                    organ_id=None,
-                    is_donor_context=False,
-                    changed_by_id=changed_by_id,
-                )
-                db.add(
-                    MedicalValue(
-                        patient_id=patient_id,
-                        medical_value_template_id=template.id,
-                        datatype_id=template.datatype_id,
-                        medical_value_group_id=template.medical_value_group_id,
-                        medical_value_group_instance_id=group_instance.id,
-                        name=template.name_default or "",
-                        pos=template.pos or 0,
-                        value="",
-                        value_input="",
-                        unit_input_ucum=None,
-                        value_canonical="",
-                        unit_canonical_ucum=None,
-                        normalization_status="UNSPECIFIED",
-                        normalization_error="",
-                        renew_date=None,
-                        organ_id=None,
-                        is_donor_context=False,
-                        context_key=non_donor_context_key,
-                        changed_by_id=changed_by_id,
-                    )
-                )
-                existing.add(key)
-                created += 1
-
-        if donor_applicable:
-            key = (template.id, True)
-            if key not in existing:
-                group_instance = ensure_group_instance(
-                    db,
-                    patient_id=patient_id,
-                    medical_value_group_id=template.medical_value_group_id,
-                    context_key=donor_context_key,
-                    organ_id=None,
-                    is_donor_context=True,
-                    changed_by_id=changed_by_id,
-                )
-                db.add(
-                    MedicalValue(
-                        patient_id=patient_id,
-                        medical_value_template_id=template.id,
-                        datatype_id=template.datatype_id,
-                        medical_value_group_id=template.medical_value_group_id,
-                        medical_value_group_instance_id=group_instance.id,
-                        name=template.name_default or "",
-                        pos=template.pos or 0,
-                        value="",
-                        value_input="",
-                        unit_input_ucum=None,
-                        value_canonical="",
-                        unit_canonical_ucum=None,
-                        normalization_status="UNSPECIFIED",
-                        normalization_error="",
-                        renew_date=None,
-                        organ_id=None,
-                        is_donor_context=True,
-                        context_key=donor_context_key,
-                        changed_by_id=changed_by_id,
-                    )
-                )
-                existing.add(key)
-                created += 1
-
-    db.commit()
-    return {"created_values": created}
-
-
 def _get_patient_or_404(patient_id: int, db: Session) -> Patient:
     patient = db.query(Patient).filter(Patient.id == patient_id).first()
     if not patient:
@@ -233,28 +92,6 @@ def _get_default_group_id(db: Session) -> int | None:
     return group.id if group else None
 
 
-def _resolve_datatype_definition_for_value(
-    *,
-    template_id: int | None,
-    datatype_id: int | None,
-    db: Session,
-) -> DatatypeDefinition | None:
-    if template_id is not None:
-        template = (
-            db.query(MedicalValueTemplate)
-            .options(joinedload(MedicalValueTemplate.datatype_definition))
-            .filter(MedicalValueTemplate.id == template_id)
-            .first()
-        )
-        if template and template.datatype_definition is not None:
-            return template.datatype_definition
-        if template and template.datatype_id is not None:
-            return db.query(DatatypeDefinition).filter(DatatypeDefinition.code_id == template.datatype_id).first()
-    if datatype_id is not None:
-        return db.query(DatatypeDefinition).filter(DatatypeDefinition.code_id == datatype_id).first()
-    return None
-
-
 def _group_key_for_id(db: Session, group_id: int | None) -> str | None:
     if group_id is None:
         return None
@@ -334,7 +171,7 @@ def create_medical_value_for_patient(
             data["medical_value_group_id"] = template.medical_value_group_id
         else:
             data["medical_value_group_id"] = _get_default_group_id(db)
-    datatype_definition = _resolve_datatype_definition_for_value(
+    rule = NORMALIZATION_RULES.rule_for(
         template_id=data.get("medical_value_template_id"),
         datatype_id=data.get("datatype_id"),
         db=db,
@@ -346,7 +183,7 @@ def create_medical_value_for_patient(
             else (data.get("value") or "")
         ),
         unit_input_ucum=data.get("unit_input_ucum"),
-        datatype_definition=datatype_definition,
+        rule=rule,
     )
     data["value"] = normalized.value_legacy
     data["value_input"] = normalized.value_input
@@ -422,7 +259,7 @@ def update_medical_value_for_patient(
             else _get_default_group_id(db)
         )
     if any(key in update_data for key in ("value", "value_input", "unit_input_ucum", "medical_value_template_id", "datatype_id")):
-        datatype_definition = _resolve_datatype_definition_for_value(
+        rule = NORMALIZATION_RULES.rule_for(
             template_id=mv.medical_value_template_id,
             datatype_id=mv.datatype_id,
             db=db,
@@ -438,7 +275,7 @@ def update_medical_value_for_patient(
                 if "unit_input_ucum" in update_data
                 else mv.unit_input_ucum
             ),
-            datatype_definition=datatype_definition,
+            rule=rule,
         )
         mv.value = normalized.value_legacy
         mv.value_input = normalized.value_input
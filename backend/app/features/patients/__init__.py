@@ -3,13 +3,25 @@ from .service import (
     delete_patient,
     get_patient_or_404,
     list_patients,
+    search_patients,
     update_patient,
 )
+from .projection import (
+    count_patients_missing_list_projection,
+    rebuild_patient_list_projection,
+    refresh_patient_list_projection,
+    register_patient_list_projection_hooks,
+)
 
 __all__ = [
     "list_patients",
+    "search_patients",
     "get_patient_or_404",
     "create_patient",
     "update_patient",
     "delete_patient",
+    "count_patients_missing_list_projection",
+    "rebuild_patient_list_projection",
+    "refresh_patient_list_projection",
+    "register_patient_list_projection_hooks",
 ]
@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable
+from typing import Any
+
+from sqlalchemy import delete, event, func, inspect, insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session, joinedload, selectinload
+
+from ...database import SessionLocal
+from ...models import (
+    ContactInfo,
+    Episode,
+    EpisodeOrgan,
+    MedicalValue,
+    MedicalValueGroup,
+    MedicalValueTemplate,
+    Patient,
+    PatientListProjection,
+)
+
+_PENDING_KEY = "patient_list_projection_pending"
+_REBUILD_BATCH_SIZE = 500
+_hooks_registered = False
+
+
+def _episode_organ_ids(episode: Episode) -> list[int]:
+    organ_ids = [organ.id for organ in (episode.organs or []) if organ and organ.id is not None]
+    if organ_ids:
+        return list(dict.fromkeys(organ_ids))
+    if episode.organ_id is not None:
+        return [episode.organ_id]
+    return []
+
+
+def _static_medical_values(patient: Patient) -> list[dict[str, str]]:
+    rows: list[MedicalValue] = []
+    for mv in patient.medical_values or []:
+        if bool(mv.is_donor_context):
+            continue
+        group_key = None
+        if mv.medical_value_group and mv.medical_value_group.medical_value_group_template:
+            group_key = mv.medical_value_group.medical_value_group_template.key
+        elif mv.medical_value_group_template:
+            group_key = mv.medical_value_group_template.key
+        elif mv.medical_value_template and mv.medical_value_template.medical_value_group_template:
+            group_key = mv.medical_value_template.medical_value_group_template.key
+
+        # Prefer semantic grouping; fall back to legacy STATIC context records.
+        if group_key != "STATIC_PATIENT":
+            if mv.organ_id is not None:
+                continue
+            if mv.context_key and mv.context_key != "STATIC":
+                continue
+        # Patients overview should show only static values marked as main.
+        if not bool(mv.medical_value_template and mv.medical_value_template.is_main):
+            continue
+        datatype_key = (mv.datatype.key if mv.datatype else "") or (
+            mv.medical_value_template.datatype.key
+            if mv.medical_value_template and mv.medical_value_template.datatype
+            else ""
+        )
+        if datatype_key != "BLOOD_TYPE":
+            continue
+        rows.append(mv)
+    rows.sort(key=lambda mv: ((mv.pos or 0), mv.id))
+    for mv in rows:
+        value = (mv.value or "").strip()
+        if not value:
+            continue
+        return [
+            {
+                "name": (mv.name or (mv.medical_value_template.name_default if mv.medical_value_template else "") or "Blood type"),
+                "value": value,
+            }
+        ]
+    return []
+
+
+def _projection_values(patient: Patient) -> dict[str, Any]:
+    episodes = patient.episodes or []
+    open_episodes = sorted(
+        [ep for ep in episodes if not ep.closed],
+        key=lambda ep: ep.status.pos if ep.status else 999,
+    )
+    open_episode_indicators = [
+        (
+            "/".join(
+                (organ.name_default[:2] if organ and organ.name_default else "??")
+                for organ in (ep.organs or ([ep.organ] if ep.organ else []))
+            )
+            or "??"
+        )
+        for ep in open_episodes
+    ]
+    return {
+        "patient_id": patient.id,
+        "contact_info_count": len(patient.contact_infos or []),
+        "open_episode_count": len(open_episodes),
+        "open_episode_indicators_json": json.dumps(open_episode_indicators),
+        "episode_organ_ids_json": json.dumps([organ_id for ep in episodes for organ_id in _episode_organ_ids(ep)]),
+        "open_episode_organ_ids_json": json.dumps([organ_id for ep in open_episodes for organ_id in _episode_organ_ids(ep)]),
+        "static_medical_values_json": json.dumps(_static_medical_values(patient)),
+    }
+
+
+def _projection_source_query(db: Session):
+    return db.query(Patient).options(
+        selectinload(Patient.contact_infos),
+        selectinload(Patient.medical_values).joinedload(MedicalValue.medical_value_template).joinedload(MedicalValueTemplate.medical_value_group_template),
+        selectinload(Patient.medical_values).joinedload(MedicalValue.medical_value_template).joinedload(MedicalValueTemplate.datatype),
+        selectinload(Patient.medical_values).joinedload(MedicalValue.medical_value_group_template),
+        selectinload(Patient.medical_values)
+        .joinedload(MedicalValue.medical_value_group)
+        .joinedload(MedicalValueGroup.medical_value_group_template),
+        selectinload(Patient.medical_values).joinedload(MedicalValue.datatype),
+        selectinload(Patient.episodes).joinedload(Episode.organ),
+        selectinload(Patient.episodes).selectinload(Episode.organs),
+        selectinload(Patient.episodes).joinedload(Episode.status),
+    )
+
+
+def refresh_patient_list_projection(
+    connection: Connection,
+    *,
+    patient_ids: Iterable[int] = (),
+    episode_ids: Iterable[int] = (),
+) -> int:
+    """Recompute the projection rows of the given patients (and of the patients owning `episode_ids`).
+
+    Runs on `connection`, so it joins the caller's transaction. A separate session is used for reading to
+    avoid stale relationship collections in the caller's identity map.
+    """
+    target_ids = {patient_id for patient_id in patient_ids if patient_id is not None}
+    with Session(bind=connection) as db:
+        episode_ids = [episode_id for episode_id in episode_ids if episode_id is not None]
+        if episode_ids:
+            target_ids.update(
+                patient_id for (patient_id,) in db.query(Episode.patient_id).filter(Episode.id.in_(episode_ids)).all()
+            )
+        if not target_ids:
+            return 0
+        rows = [_projection_values(patient) for patient in _projection_source_query(db).filter(Patient.id.in_(target_ids)).all()]
+        db.execute(delete(PatientListProjection).where(PatientListProjection.patient_id.in_(target_ids)))
+        if rows:
+            db.execute(insert(PatientListProjection), rows)
+    return len(rows)
+
+
+def rebuild_patient_list_projection(*, db: Session) -> int:
+    """Recompute the projection for all patients, e.g. after seeding or bulk SQL maintenance."""
+    connection = db.connection()
+    connection.execute(delete(PatientListProjection))
+    patient_ids = [patient_id for (patient_id,) in db.query(Patient.id).order_by(Patient.id).all()]
+    written = 0
+    for start in range(0, len(patient_ids), _REBUILD_BATCH_SIZE):
+        written += refresh_patient_list_projection(connection, patient_ids=patient_ids[start : start + _REBUILD_BATCH_SIZE])
+    db.commit()
+    return written
+
+
+def count_patients_missing_list_projection(*, db: Session) -> int:
+    """Count patients without a projection row, e.g. after the table was added to an existing database."""
+    return (
+        db.query(func.count(Patient.id))
+        .outerjoin(PatientListProjection, PatientListProjection.patient_id == Patient.id)
+        .filter(PatientListProjection.patient_id.is_(None))
+        .scalar()
+    )
+
+
+def _attribute_values(instance: object, key: str) -> set[int]:
+    history = inspect(instance).attrs[key].history
+    return {value for value in (*history.added, *history.unchanged, *history.deleted) if value is not None}
+
+
+def _remember_touched(session: Session) -> None:
+    patient_ids: set[int] = set()
+    episode_ids: set[int] = set()
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(instance, Patient):
+            patient_ids.update(_attribute_values(instance, "id"))
+        elif isinstance(instance, (Episode, ContactInfo, MedicalValue)):
+            patient_ids.update(_attribute_values(instance, "patient_id"))
+        elif isinstance(instance, EpisodeOrgan):
+            episode_ids.update(_attribute_values(instance, "episode_id"))
+    if patient_ids or episode_ids:
+        pending = session.info.setdefault(_PENDING_KEY, (set(), set()))
+        pending[0].update(patient_ids)
+        pending[1].update(episode_ids)
+
+
+def register_patient_list_projection_hooks() -> None:
+    global _hooks_registered
+    if _hooks_registered:
+        return
+
+    @event.listens_for(SessionLocal, "after_flush")
+    def _collect_touched_patients(session: Session, flush_context) -> None:  # noqa: ANN001
+        _remember_touched(session)
+
+    # Projection rows are written once per transaction, right before it commits.
+    @event.listens_for(SessionLocal, "before_commit")
+    def _refresh_touched_patients(session: Session) -> None:
+        session.flush()
+        pending = session.info.pop(_PENDING_KEY, None)
+        if pending:
+            patient_ids, episode_ids = pending
+            refresh_patient_list_projection(session.connection(), patient_ids=patient_ids, episode_ids=episode_ids)
+
+    @event.listens_for(SessionLocal, "after_rollback")
+    def _discard_touched_patients(session: Session) -> None:
+        session.info.pop(_PENDING_KEY, None)
+
+    _hooks_registered = True
+
+
+def load_patient_list_projection(projection: PatientListProjection | None) -> dict[str, Any]:
+    """Decode a projection row into `PatientListResponse` fields; a missing row reads as empty aggregates."""
+    if projection is None:
+        return {
+            "contact_info_count": 0,
+            "open_episode_count": 0,
+            "open_episode_indicators": [],
+            "episode_organ_ids": [],
+            "open_episode_organ_ids": [],
+            "static_medical_values": [],
+        }
+    return {
+        "contact_info_count": projection.contact_info_count,
+        "open_episode_count": projection.open_episode_count,
+        "open_episode_indicators": json.loads(projection.open_episode_indicators_json),
+        "episode_organ_ids": json.loads(projection.episode_organ_ids_json),
+        "open_episode_organ_ids": json.loads(projection.open_episode_organ_ids_json),
+        "static_medical_values": json.loads(projection.static_medical_values_json),
+    }
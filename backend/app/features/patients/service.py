@@ -1,6 +1,11 @@
 from __future__ import annotations
 
+import base64
+import binascii
+import json
+
 from fastapi import HTTPException
+from sqlalchemy import and_, exists, or_, tuple_
 from sqlalchemy.orm import Session, joinedload, subqueryload
 
 from ...features.medical_values import instantiate_templates_for_patient
@@ -9,65 +14,16 @@ from ...models import (
     ContactInfo,
     Diagnosis,
     Episode,
+    EpisodeOrgan,
     MedicalValue,
     MedicalValueGroup,
     MedicalValueTemplate,
     Patient,
+    PatientListProjection,
+    User,
 )
-from ...schemas import PatientCreate, PatientListResponse, PatientResponse, PatientUpdate
-
-
-def _episode_organ_ids(episode: Episode) -> list[int]:
-    organ_ids = [organ.id for organ in (episode.organs or []) if organ and organ.id is not None]
-    if organ_ids:
-        return list(dict.fromkeys(organ_ids))
-    if episode.organ_id is not None:
-        return [episode.organ_id]
-    return []
-
-
-def _static_medical_values(patient: Patient) -> list[dict[str, str]]:
-    rows: list[MedicalValue] = []
-    for mv in patient.medical_values or []:
-        if bool(mv.is_donor_context):
-            continue
-        group_key = None
-        if mv.medical_value_group and mv.medical_value_group.medical_value_group_template:
-            group_key = mv.medical_value_group.medical_value_group_template.key
-        elif mv.medical_value_group_template:
-            group_key = mv.medical_value_group_template.key
-        elif mv.medical_value_template and mv.medical_value_template.medical_value_group_template:
-            group_key = mv.medical_value_template.medical_value_group_template.key
-
-        # Prefer semantic grouping; fall back to legacy STATIC context records.
-        if group_key != "STATIC_PATIENT":
-            if mv.organ_id is not None:
-                continue
-            if mv.context_key and mv.context_key != "STATIC":
-                continue
-        # Patients overview should show only static values marked as main.
-        if not bool(mv.medical_value_template and mv.medical_value_template.is_main):
-            continue
-        datatype_key = (mv.datatype.key if mv.datatype else "") or (
-            mv.medical_value_template.datatype.key
-            if mv.medical_value_template and mv.medical_value_template.datatype
-            else ""
-        )
-        if datatype_key != "BLOOD_TYPE":
-            continue
-        rows.append(mv)
-    rows.sort(key=lambda mv: ((mv.pos or 0), mv.id))
-    for mv in rows:
-        value = (mv.value or "").strip()
-        if not value:
-            continue
-        return [
-            {
-                "name": (mv.name or (mv.medical_value_template.name_default if mv.medical_value_template else "") or "Blood type"),
-                "value": value,
-            }
-        ]
-    return []
+from ...schemas import PatientCreate, PatientListPageResponse, PatientListResponse, PatientResponse, PatientUpdate
+from .projection import load_patient_list_projection
 
 
 def _patient_detail_query(db: Session):
@@ -95,75 +51,121 @@ def _patient_detail_query(db: Session):
     )
 
 
-def list_patients(*, skip: int, limit: int, db: Session) -> list[PatientListResponse]:
-    patients = (
-        db.query(Patient)
+def _patient_list_query(db: Session):
+    return (
+        db.query(Patient, PatientListProjection)
+        .outerjoin(PatientListProjection, PatientListProjection.patient_id == Patient.id)
         .options(
-            joinedload(Patient.changed_by_user),
             joinedload(Patient.sex),
-            joinedload(Patient.resp_coord),
-            subqueryload(Patient.contact_infos),
-            subqueryload(Patient.medical_values).joinedload(MedicalValue.medical_value_template).joinedload(MedicalValueTemplate.medical_value_group_template),
-            subqueryload(Patient.medical_values).joinedload(MedicalValue.medical_value_group_template),
-            subqueryload(Patient.medical_values)
-            .joinedload(MedicalValue.medical_value_group)
-            .joinedload(MedicalValueGroup.medical_value_group_template),
-            subqueryload(Patient.episodes).joinedload(Episode.organ),
-            subqueryload(Patient.episodes).subqueryload(Episode.organs),
-            subqueryload(Patient.episodes).joinedload(Episode.status),
+            joinedload(Patient.resp_coord).joinedload(User.role),
+            joinedload(Patient.resp_coord).joinedload(User.roles),
         )
-        .offset(skip)
-        .limit(limit)
-        .all()
     )
-    result: list[PatientListResponse] = []
-    for p in patients:
-        episodes = p.episodes or []
-        open_episodes = sorted(
-            [ep for ep in episodes if not ep.closed],
-            key=lambda ep: ep.status.pos if ep.status else 999,
-        )
-        result.append(
-            PatientListResponse(
-                id=p.id,
-                pid=p.pid,
-                first_name=p.first_name,
-                name=p.name,
-                date_of_birth=p.date_of_birth,
-                date_of_death=p.date_of_death,
-                ahv_nr=p.ahv_nr,
-                lang=p.lang,
-                sex_id=p.sex_id,
-                sex=p.sex,
-                resp_coord_id=p.resp_coord_id,
-                resp_coord=p.resp_coord,
-                translate=p.translate,
-                contact_info_count=len(p.contact_infos or []),
-                open_episode_count=len(open_episodes),
-                open_episode_indicators=[
-                    (
-                        "/".join(
-                            (organ.name_default[:2] if organ and organ.name_default else "??")
-                            for organ in (ep.organs or ([ep.organ] if ep.organ else []))
-                        )
-                        or "??"
-                    )
-                    for ep in open_episodes
-                ],
-                episode_organ_ids=[
-                    organ_id
-                    for ep in episodes
-                    for organ_id in _episode_organ_ids(ep)
-                ],
-                open_episode_organ_ids=[
-                    organ_id
-                    for ep in open_episodes
-                    for organ_id in _episode_organ_ids(ep)
-                ],
-                static_medical_values=_static_medical_values(p),
-            )
-        )
-    return result
+
+
+def _patient_list_response(patient: Patient, projection: PatientListProjection | None) -> PatientListResponse:
+    return PatientListResponse(
+        id=patient.id,
+        pid=patient.pid,
+        first_name=patient.first_name,
+        name=patient.name,
+        date_of_birth=patient.date_of_birth,
+        date_of_death=patient.date_of_death,
+        ahv_nr=patient.ahv_nr,
+        lang=patient.lang,
+        sex_id=patient.sex_id,
+        sex=patient.sex,
+        resp_coord_id=patient.resp_coord_id,
+        resp_coord=patient.resp_coord,
+        translate=patient.translate,
+        **load_patient_list_projection(projection),
+    )
+
+
+def list_patients(*, skip: int, limit: int, db: Session) -> list[PatientListResponse]:
+    rows = _patient_list_query(db).order_by(Patient.id.asc()).offset(skip).limit(limit).all()
+    return [_patient_list_response(p, projection) for p, projection in rows]
+
+
+_LIST_ORDER = (Patient.name, Patient.first_name, Patient.id)
+_SEARCH_COLUMNS = (Patient.pid, Patient.name, Patient.first_name)
+_MAX_CHAR = "\U0010ffff"
+
+
+def _encode_list_cursor(patient: Patient) -> str:
+    raw = json.dumps([patient.name, patient.first_name, patient.id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_list_cursor(cursor: str) -> list[object]:
+    try:
+        values = json.loads(base64.urlsafe_b64decode((cursor + "=" * (-len(cursor) % 4)).encode("ascii")))
+    except (ValueError, TypeError, binascii.Error) as exc:
+        raise HTTPException(status_code=422, detail="Invalid patient list cursor") from exc
+    if (
+        not isinstance(values, list)
+        or len(values) != len(_LIST_ORDER)
+        or not all(isinstance(value, str) for value in values[:2])
+        or not isinstance(values[2], int)
+    ):
+        raise HTTPException(status_code=422, detail="Invalid patient list cursor")
+    return values
+
+
+def _nocase_prefix(column, term: str):
+    # A NOCASE range instead of LIKE lets SQLite seek in the ix_patient_*_nocase indexes; NOCASE folds
+    # ASCII letters only, like the LIKE matching it replaces. U+10FFFF sorts after every other character.
+    folded = column.collate("NOCASE")
+    return and_(folded >= term, folded < term + _MAX_CHAR)
+
+
+def _organ_match(organ_id: int):
+    # Same rule as the projection: active organ links win over the legacy single organ column.
+    active_link = EpisodeOrgan.episode_id == Episode.id, EpisodeOrgan.is_active.is_(True)
+    return or_(
+        exists().where(*active_link, EpisodeOrgan.organ_id == organ_id),
+        and_(Episode.organ_id == organ_id, ~exists().where(*active_link)),
+    )
+
+
+def search_patients(
+    *,
+    q: str | None = None,
+    organ_id: int | None = None,
+    has_open_episode: bool | None = None,
+    resp_coord_id: int | None = None,
+    cursor: str | None = None,
+    limit: int,
+    db: Session,
+) -> PatientListPageResponse:
+    """Return one page of the patient overview ordered by name, first name and id.
+
+    Each whitespace-separated term of `q` must be a case-insensitive prefix of the PID, name or first name.
+    With `has_open_episode`, `organ_id` only matches organs of open episodes, as in the overview filter.
+    """
+    query = _patient_list_query(db)
+    for term in (q or "").split():
+        query = query.filter(or_(*(_nocase_prefix(column, term) for column in _SEARCH_COLUMNS)))
+    if resp_coord_id is not None:
+        query = query.filter(Patient.resp_coord_id == resp_coord_id)
+    open_episode = Episode.closed.is_not(True)
+    if organ_id is not None:
+        episode_filters = [Episode.patient_id == Patient.id, _organ_match(organ_id)]
+        if has_open_episode:
+            episode_filters.append(open_episode)
+        query = query.filter(exists().where(*episode_filters))
+    if has_open_episode is not None:
+        has_open = exists().where(Episode.patient_id == Patient.id, open_episode)
+        query = query.filter(has_open if has_open_episode else ~has_open)
+    if cursor:
+        # A row-value comparison lets SQLite seek in ix_patient_name_first_name instead of skipping OFFSET rows.
+        query = query.filter(tuple_(*_LIST_ORDER) > tuple_(*_decode_list_cursor(cursor)))
+    rows = query.order_by(*_LIST_ORDER).limit(limit + 1).all()
+    next_cursor = _encode_list_cursor(rows[limit - 1][0]) if len(rows) > limit else None
+    return PatientListPageResponse(
+        items=[_patient_list_response(p, projection) for p, projection in rows[:limit]],
+        next_cursor=next_cursor,
+    )
 
 
 def get_patient_or_404(*, patient_id: int, db: Session) -> PatientResponse:
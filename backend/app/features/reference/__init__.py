@@ -1,3 +1,16 @@
-from .service import list_catalogue_types, list_catalogues, list_codes, update_catalogue
+from .registry import CODE_REGISTRY, CodeRegistry, ReferenceEntry, invalidate_code_registry, warm_code_registry
+from .service import catalogues_etag, codes_etag, list_catalogue_types, list_catalogues, list_codes, update_catalogue
 
-__all__ = ["list_codes", "list_catalogues", "list_catalogue_types", "update_catalogue"]
+__all__ = [
+    "list_codes",
+    "codes_etag",
+    "list_catalogues",
+    "catalogues_etag",
+    "list_catalogue_types",
+    "update_catalogue",
+    "CODE_REGISTRY",
+    "CodeRegistry",
+    "ReferenceEntry",
+    "invalidate_code_registry",
+    "warm_code_registry",
+]
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from threading import Lock
+from types import MappingProxyType
+from typing import Mapping
+
+from sqlalchemy.orm import Session
+
+from ...data_versions import get_table_versions
+from ...models import Catalogue, Code
+
+CODE_REGISTRY_TTL_SECONDS = 300.0
+
+
+@dataclass(frozen=True)
+class ReferenceEntry:
+    """Immutable copy of one CODE or CATALOGUE row."""
+
+    id: int
+    type: str
+    key: str
+    pos: int
+    ext_sys: str
+    ext_key: str
+    name_default: str
+
+    @classmethod
+    def from_row(cls, row: Code | Catalogue) -> ReferenceEntry:
+        return cls(
+            id=row.id,
+            type=row.type,
+            key=row.key,
+            pos=row.pos,
+            ext_sys=row.ext_sys or "",
+            ext_key=row.ext_key or "",
+            name_default=row.name_default or "",
+        )
+
+
+@dataclass(frozen=True)
+class _ReferenceTable:
+    by_id: Mapping[int, ReferenceEntry]
+    by_type_key: Mapping[tuple[str, str], ReferenceEntry]
+    by_type: Mapping[str, tuple[ReferenceEntry, ...]]
+
+    @classmethod
+    def build(cls, entries: list[ReferenceEntry]) -> _ReferenceTable:
+        by_type: dict[str, list[ReferenceEntry]] = {}
+        for entry in sorted(entries, key=lambda item: (item.type, item.pos, item.id)):
+            by_type.setdefault(entry.type, []).append(entry)
+        return cls(
+            by_id=MappingProxyType({entry.id: entry for entry in entries}),
+            by_type_key=MappingProxyType({(entry.type, entry.key): entry for entry in entries}),
+            by_type=MappingProxyType({code_type: tuple(items) for code_type, items in by_type.items()}),
+        )
+
+
+@dataclass(frozen=True)
+class _ReferenceSnapshot:
+    versions: tuple[int, ...]
+    expires_at: float
+    codes: _ReferenceTable
+    catalogues: _ReferenceTable
+
+
+class CodeRegistry:
+    """Process-wide CODE and CATALOGUE rows, reloaded whenever one of the tables changes (see data_versions).
+
+    Id and key lookups that miss the snapshot fall through to the caller's session, so rows created
+    earlier in the same transaction still resolve and unknown ids are answered by the database as before.
+    """
+
+    _TABLES = (Code.__tablename__, Catalogue.__tablename__)
+
+    def __init__(self) -> None:
+        self._snapshot: _ReferenceSnapshot | None = None
+        self._lock = Lock()
+
+    def _is_current(self, snapshot: _ReferenceSnapshot | None, versions: tuple[int, ...]) -> bool:
+        return snapshot is not None and snapshot.versions == versions and snapshot.expires_at > time.monotonic()
+
+    def snapshot(self, db: Session) -> _ReferenceSnapshot:
+        versions = get_table_versions(self._TABLES)
+        snapshot = self._snapshot
+        if self._is_current(snapshot, versions):
+            return snapshot
+        with self._lock:
+            if not self._is_current(self._snapshot, versions):
+                # Read committed rows only, so the registry never holds rows of a transaction that rolls back.
+                with Session(bind=db.get_bind()) as reference_db:
+                    self._snapshot = _ReferenceSnapshot(
+                        versions=versions,
+                        expires_at=time.monotonic() + CODE_REGISTRY_TTL_SECONDS,
+                        codes=_ReferenceTable.build([ReferenceEntry.from_row(row) for row in reference_db.query(Code)]),
+                        catalogues=_ReferenceTable.build(
+                            [ReferenceEntry.from_row(row) for row in reference_db.query(Catalogue)]
+                        ),
+                    )
+            return self._snapshot
+
+    def clear(self) -> None:
+        with self._lock:
+            self._snapshot = None
+
+    def code(self, db: Session, code_id: int, code_type: str | None = None) -> ReferenceEntry | None:
+        entry = self.snapshot(db).codes.by_id.get(code_id)
+        if entry is None:
+            row = db.query(Code).filter(Code.id == code_id).first()
+            entry = ReferenceEntry.from_row(row) if row is not None else None
+        if entry is None or (code_type is not None and entry.type != code_type):
+            return None
+        return entry
+
+    def code_by_key(self, db: Session, code_type: str, code_key: str) -> ReferenceEntry | None:
+        entry = self.snapshot(db).codes.by_type_key.get((code_type, code_key))
+        if entry is None:
+            row = db.query(Code).filter(Code.type == code_type, Code.key == code_key).first()
+            entry = ReferenceEntry.from_row(row) if row is not None else None
+        return entry
+
+    def codes_of_type(self, db: Session, code_type: str) -> tuple[ReferenceEntry, ...]:
+        return self.snapshot(db).codes.by_type.get(code_type, ())
+
+    def catalogue(self, db: Session, catalogue_id: int, catalogue_type: str | None = None) -> ReferenceEntry | None:
+        entry = self.snapshot(db).catalogues.by_id.get(catalogue_id)
+        if entry is None:
+            row = db.query(Catalogue).filter(Catalogue.id == catalogue_id).first()
+            entry = ReferenceEntry.from_row(row) if row is not None else None
+        if entry is None or (catalogue_type is not None and entry.type != catalogue_type):
+            return None
+        return entry
+
+
+CODE_REGISTRY = CodeRegistry()
+
+
+def invalidate_code_registry() -> None:
+    """Drop cached codes and catalogues, e.g. after they were changed outside the app session."""
+    CODE_REGISTRY.clear()
+
+
+def warm_code_registry(db: Session) -> None:
+    """Load the registry up front, so the first requests do not pay for it."""
+    CODE_REGISTRY.snapshot(db)
@@ -4,6 +4,7 @@ from fastapi import HTTPException
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
+from ...http_cache import table_version_etag
 from ...models import Catalogue, Code
 from ...schemas import CatalogueUpdate
 
@@ -15,6 +16,10 @@ def list_codes(*, code_type: str | None, db: Session) -> list[Code]:
     return query.order_by(Code.type, Code.pos).all()
 
 
+def codes_etag(*, code_type: str | None) -> str:
+    return table_version_etag("codes", [Code.__tablename__], code_type)
+
+
 def list_catalogues(*, catalogue_type: str | None, db: Session) -> list[Catalogue]:
     query = db.query(Catalogue)
     if catalogue_type:
@@ -22,6 +27,10 @@ def list_catalogues(*, catalogue_type: str | None, db: Session) -> list[Catalogu
     return query.order_by(Catalogue.type, Catalogue.pos).all()
 
 
+def catalogues_etag(*, catalogue_type: str | None) -> str:
+    return table_version_etag("catalogues", [Catalogue.__tablename__], catalogue_type)
+
+
 def list_catalogue_types(*, db: Session) -> list[dict[str, int | str]]:
     rows = (
         db.query(
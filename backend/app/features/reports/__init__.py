@@ -1,5 +1,12 @@
 from .engine import active_field_map, build_metadata_response, execute_report_request
-from .service import execute_report, get_report_metadata
+from .service import (
+    clear_report_cache,
+    execute_report,
+    export_report,
+    get_report_cache_stats,
+    get_report_metadata,
+    report_metadata_etag,
+)
 from .sources import build_sources
 from .types import FieldDef, JoinDef, SourceDef
 
@@ -12,5 +19,9 @@ __all__ = [
     "execute_report_request",
     "build_sources",
     "get_report_metadata",
+    "report_metadata_etag",
     "execute_report",
+    "export_report",
+    "get_report_cache_stats",
+    "clear_report_cache",
 ]
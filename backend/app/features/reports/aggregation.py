@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from fastapi import HTTPException
+from sqlalchemy import distinct, func
+
+from ...schemas import ReportAggregateInput, ReportColumnResponse, ReportExecuteRequest, ReportExecuteResponse
+from .engine import (
+    ReportPlan,
+    getter_filter_fields,
+    iter_report_rows,
+    loader_options,
+    serialize_value,
+    split_filters,
+)
+from .types import FieldDef, SourceDef
+
+_FUNCTION_LABELS = {
+    "count": "Count",
+    "min": "Min",
+    "max": "Max",
+    "avg": "Average",
+    "count_distinct": "Distinct",
+}
+_ORDERABLE_TYPES = {"string", "number", "date", "datetime"}
+
+
+@dataclass(frozen=True)
+class AggregateSpec:
+    key: str
+    label: str
+    function: str
+    field: FieldDef | None
+
+
+class _Accumulator:
+    """Single-pass state for one aggregate within one group."""
+
+    __slots__ = ("function", "count", "total", "extreme", "seen")
+
+    def __init__(self, function: str) -> None:
+        self.function = function
+        self.count = 0
+        self.total = 0.0
+        self.extreme: Any = None
+        self.seen: set[Any] = set()
+
+    def add(self, value: Any) -> None:
+        if value is None:
+            return
+        if self.function == "count_distinct":
+            self.seen.add(value)
+            return
+        self.count += 1
+        if self.function == "avg":
+            self.total += float(value)
+        elif self.function == "min" and (self.extreme is None or value < self.extreme):
+            self.extreme = value
+        elif self.function == "max" and (self.extreme is None or value > self.extreme):
+            self.extreme = value
+
+    def result(self) -> Any:
+        if self.function == "count":
+            return self.count
+        if self.function == "count_distinct":
+            return len(self.seen)
+        if self.function == "avg":
+            return self.total / self.count if self.count else None
+        return self.extreme
+
+
+def _resolve_aggregate(item: ReportAggregateInput, field_map: dict[str, FieldDef]) -> AggregateSpec:
+    if item.field is None:
+        if item.function != "count":
+            raise HTTPException(status_code=422, detail=f"Aggregate '{item.function}' requires a field")
+        return AggregateSpec(key="count", label="Count", function="count", field=None)
+
+    field = field_map.get(item.field)
+    if not field:
+        raise HTTPException(status_code=422, detail=f"Unknown aggregate field '{item.field}'")
+    if item.function == "avg" and field.value_type != "number":
+        raise HTTPException(status_code=422, detail=f"Aggregate 'avg' requires a numeric field, got '{field.key}'")
+    if item.function in {"min", "max"} and field.value_type not in _ORDERABLE_TYPES:
+        raise HTTPException(status_code=422, detail=f"Aggregate '{item.function}' not supported for field '{field.key}'")
+    return AggregateSpec(
+        key=f"{item.function}_{field.key}",
+        label=f"{_FUNCTION_LABELS[item.function]} {field.label}",
+        function=item.function,
+        field=field,
+    )
+
+
+def _sql_aggregate(spec: AggregateSpec) -> Any:
+    if spec.field is None:
+        return func.count()
+    column = spec.field.column
+    if spec.function == "count":
+        return func.count(column)
+    if spec.function == "count_distinct":
+        return func.count(distinct(column))
+    if spec.function == "avg":
+        return func.avg(column)
+    if spec.function == "min":
+        return func.min(column)
+    return func.max(column)
+
+
+def _sql_groups(
+    source: SourceDef,
+    db: Any,
+    group_fields: list[FieldDef],
+    specs: list[AggregateSpec],
+    sql_clauses: list[Any],
+) -> list[tuple[Any, ...]]:
+    entity = source.query(db).column_descriptions[0]["entity"]
+    group_columns = [field.column for field in group_fields]
+    query = db.query(*group_columns, *(_sql_aggregate(spec) for spec in specs)).select_from(entity)
+    if sql_clauses:
+        query = query.filter(*sql_clauses)
+    if group_columns:
+        query = query.group_by(*group_columns)
+    return [tuple(row) for row in query.all()]
+
+
+def _streamed_groups(
+    source: SourceDef,
+    field_map: dict[str, FieldDef],
+    db: Any,
+    group_fields: list[FieldDef],
+    specs: list[AggregateSpec],
+    plan: ReportPlan,
+) -> list[tuple[Any, ...]]:
+    groups: dict[tuple[Any, ...], list[_Accumulator]] = {}
+    group_getters = [field.getter for field in group_fields]
+    value_getters = [spec.field.getter if spec.field else None for spec in specs]
+    for row in iter_report_rows(plan, source, field_map, db, limit=None):
+        group_key = tuple(getter(row) for getter in group_getters)
+        accumulators = groups.get(group_key)
+        if accumulators is None:
+            accumulators = [_Accumulator(spec.function) for spec in specs]
+            groups[group_key] = accumulators
+        for accumulator, getter in zip(accumulators, value_getters):
+            # A field-less count counts rows, so feed a non-null marker.
+            accumulator.add(getter(row) if getter else True)
+    if not group_fields and not groups:
+        groups[()] = [_Accumulator(spec.function) for spec in specs]
+    return [key + tuple(accumulator.result() for accumulator in accumulators) for key, accumulators in groups.items()]
+
+
+def execute_report_aggregation(
+    payload: ReportExecuteRequest,
+    source: SourceDef,
+    field_map: dict[str, FieldDef],
+    db: Any,
+) -> ReportExecuteResponse:
+    """Group and aggregate source rows, in SQL when every involved field has a column expression."""
+    if payload.cursor is not None:
+        raise HTTPException(status_code=422, detail="Paging is not supported for aggregated reports")
+
+    group_fields: list[FieldDef] = []
+    for key in payload.group_by:
+        field = field_map.get(key)
+        if not field:
+            raise HTTPException(status_code=422, detail=f"Unknown group_by field '{key}'")
+        group_fields.append(field)
+    specs = [_resolve_aggregate(item, field_map) for item in payload.aggregates]
+    if not group_fields and not specs:
+        raise HTTPException(status_code=422, detail="group_by or aggregates must contain at least one entry")
+
+    columns = [ReportColumnResponse(key=field.key, label=field.label) for field in group_fields]
+    columns += [ReportColumnResponse(key=spec.key, label=spec.label) for spec in specs]
+    column_keys = [column.key for column in columns]
+    if len(set(column_keys)) != len(column_keys):
+        raise HTTPException(status_code=422, detail="Duplicate group_by or aggregate column")
+
+    sql_clauses, row_filters = split_filters(field_map, payload.filters)
+    involved = group_fields + [spec.field for spec in specs if spec.field is not None]
+    if not row_filters and all(field.column is not None for field in involved):
+        results = _sql_groups(source, db, group_fields, specs, sql_clauses)
+    else:
+        getter_fields = involved + getter_filter_fields(field_map, payload.filters)
+        plan = ReportPlan(
+            selected_fields=[],
+            sql_clauses=sql_clauses,
+            row_filters=row_filters,
+            order_by=[],
+            sort=[],
+            load_options=loader_options(source, getter_fields),
+        )
+        results = _streamed_groups(source, field_map, db, group_fields, specs, plan)
+
+    # Aggregated results are small, so ordering defaults to the group keys and is applied in memory.
+    sort = [(column_keys.index(key), False) for key in column_keys[: len(group_fields)]]
+    if payload.sort:
+        sort = []
+        for sort_key in payload.sort:
+            if sort_key.field not in column_keys:
+                raise HTTPException(status_code=422, detail=f"Unknown sort field '{sort_key.field}'")
+            sort.append((column_keys.index(sort_key.field), sort_key.direction == "desc"))
+    for index, reverse in reversed(sort):
+        results.sort(key=lambda row: (row[index] is None, row[index]), reverse=reverse)
+
+    limit = min(max(payload.limit, 1), 1000)
+    rendered_rows = [
+        {key: serialize_value(value) for key, value in zip(column_keys, row)}
+        for row in results[:limit]
+    ]
+    return ReportExecuteResponse(
+        source=payload.source,
+        columns=columns,
+        rows=rendered_rows,
+        row_count=len(rendered_rows),
+        total_count=len(results) if payload.include_total else None,
+    )
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
-from datetime import date, datetime
-from typing import Any
+from dataclasses import dataclass
+from datetime import UTC, date, datetime
+from itertools import islice
+import operator
+from typing import Any, Callable, Iterator
 
 from fastapi import HTTPException
+from sqlalchemy import String, func, type_coerce
+from sqlalchemy import inspect as sa_inspect
 
 from ...schemas import (
     ReportColumnResponse,
@@ -13,9 +18,11 @@ from ...schemas import (
     ReportFilterInput,
     ReportJoinOption,
     ReportMetadataResponse,
+    ReportQueryRequest,
     ReportSourceOption,
     ReportSortInput,
 )
+from .pagination import decode_cursor, encode_cursor, keyset_after, keyset_expr
 from .types import FieldDef, SourceDef, ValueType
 
 
@@ -85,71 +92,198 @@ def active_field_map(source: SourceDef, joins: list[str]) -> dict[str, FieldDef]
     return field_map
 
 
-def _match_filter(field: FieldDef, row_value: Any, cond: ReportFilterInput) -> bool:
-    op = cond.operator
+def _ensure_operator_allowed(field: FieldDef, op: str) -> None:
     if op not in field.operators:
         raise HTTPException(status_code=422, detail=f"Operator '{op}' not allowed for field '{field.key}'")
 
+
+RowPredicate = Callable[[Any], bool]
+
+_COMPARATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "eq": operator.eq,
+    "gte": operator.ge,
+    "lte": operator.le,
+}
+
+
+def compile_filter(field: FieldDef, cond: ReportFilterInput) -> RowPredicate:
+    """Validate one filter and return a row predicate with the parsed comparison value captured.
+
+    Operator checks, value parsing and needle lowercasing happen once per request; evaluating the
+    predicate costs one getter call per row.
+    """
+    op = cond.operator
+    _ensure_operator_allowed(field, op)
+
+    expected = parse_for_compare(field.value_type, cond.value)
+    getter = field.getter
+
+    if field.value_type == "string":
+        needle = norm_text(expected).lower()
+        if op == "eq":
+            def match_string_eq(row: Any) -> bool:
+                value = getter(row)
+                return value is not None and norm_text(value).lower() == needle
+
+            return match_string_eq
+        if op == "contains":
+            def match_string_contains(row: Any) -> bool:
+                value = getter(row)
+                return value is not None and needle in norm_text(value).lower()
+
+            return match_string_contains
+        raise HTTPException(status_code=422, detail=f"Operator '{op}' not supported for string")
+
+    if field.value_type == "boolean":
+        if op != "eq":
+            raise HTTPException(status_code=422, detail=f"Operator '{op}' not supported for boolean")
+        expected_flag = bool(expected)
+
+        def match_boolean(row: Any) -> bool:
+            value = getter(row)
+            return value is not None and bool(value) is expected_flag
+
+        return match_boolean
+
+    if field.value_type in {"number", "date", "datetime"}:
+        compare = _COMPARATORS.get(op)
+        if compare is None:
+            raise HTTPException(status_code=422, detail=f"Operator '{op}' not supported for '{field.value_type}'")
+        if field.value_type == "number":
+            def match_number(row: Any) -> bool:
+                value = getter(row)
+                return value is not None and compare(float(value), expected)
+
+            return match_number
+
+        def match_temporal(row: Any) -> bool:
+            value = getter(row)
+            return value is not None and compare(value, expected)
+
+        return match_temporal
+
+    return lambda row: False
+
+
+_DATETIME_TEXT_LENGTH = len("YYYY-MM-DD HH:MM:SS.ffffff")
+
+
+def _datetime_text(column: Any) -> Any:
+    """Stored datetime text padded to microseconds.
+
+    SQLite keeps `CURRENT_TIMESTAMP` defaults without fractional seconds, while ORM writes and bound
+    parameters carry six digits; padding both sides to one format makes text order match datetime order.
+    """
+    return func.substr(type_coerce(column, String) + ".000000", 1, _DATETIME_TEXT_LENGTH)
+
+
+def _datetime_param(value: datetime) -> str:
+    if value.tzinfo is not None:
+        value = value.astimezone(UTC).replace(tzinfo=None)
+    return value.strftime("%Y-%m-%d %H:%M:%S.%f")
+
+
+def _sql_filter_clause(field: FieldDef, cond: ReportFilterInput) -> Any:
+    """Compile one filter into a SQL condition with the same semantics as `compile_filter`."""
+    op = cond.operator
+    _ensure_operator_allowed(field, op)
+
     expected = parse_for_compare(field.value_type, cond.value)
-    if row_value is None:
-        return False
+    column = field.column
 
     if field.value_type == "string":
-        left = norm_text(row_value).lower()
-        right = norm_text(expected).lower()
+        needle = norm_text(expected).lower()
         if op == "eq":
-            return left == right
+            return func.lower(func.trim(column)) == needle
         if op == "contains":
-            return right in left
+            return func.lower(column).contains(needle, autoescape=True)
         raise HTTPException(status_code=422, detail=f"Operator '{op}' not supported for string")
 
     if field.value_type == "boolean":
         if op != "eq":
             raise HTTPException(status_code=422, detail=f"Operator '{op}' not supported for boolean")
-        return bool(row_value) is bool(expected)
+        return column == bool(expected)
+
+    if field.value_type == "datetime":
+        column = _datetime_text(column)
+        expected = _datetime_param(expected)
 
     if field.value_type in {"number", "date", "datetime"}:
-        left = float(row_value) if field.value_type == "number" else row_value
         if op == "eq":
-            return left == expected
+            return column == expected
         if op == "gte":
-            return left >= expected
+            return column >= expected
         if op == "lte":
-            return left <= expected
+            return column <= expected
         raise HTTPException(status_code=422, detail=f"Operator '{op}' not supported for '{field.value_type}'")
 
-    return False
+    raise HTTPException(status_code=422, detail=f"Unsupported value type '{field.value_type}' for field '{field.key}'")
+
+
+def split_filters(
+    field_map: dict[str, FieldDef],
+    filters: list[ReportFilterInput],
+) -> tuple[list[Any], list[RowPredicate]]:
+    """Split filters into compiled SQL conditions and row predicates for getter-only fields."""
+    sql_clauses: list[Any] = []
+    row_filters: list[RowPredicate] = []
+    for cond in filters:
+        field = field_map.get(cond.field)
+        if not field:
+            raise HTTPException(status_code=422, detail=f"Unknown filter field '{cond.field}'")
+        # SQLite lower() folds ASCII letters only, so non-ASCII needles keep Python's Unicode matching.
+        if field.column is None or (field.value_type == "string" and not cond.value.isascii()):
+            row_filters.append(compile_filter(field, cond))
+            continue
+        sql_clauses.append(_sql_filter_clause(field, cond))
+    return sql_clauses, row_filters
+
 
+def sql_order_by(field_map: dict[str, FieldDef], sort: list[ReportSortInput]) -> list[Any] | None:
+    """Compile sort keys into ORDER BY terms, or return None when any key needs a Python getter.
 
-def filter_rows(items: list[Any], field_map: dict[str, FieldDef], filters: list[ReportFilterInput]) -> list[Any]:
-    if not filters:
+    NULL placement mirrors `apply_sort`: last for ascending, first for descending keys.
+    """
+    order_by: list[Any] = []
+    for sort_key in sort:
+        field = field_map.get(sort_key.field)
+        if not field:
+            raise HTTPException(status_code=422, detail=f"Unknown sort field '{sort_key.field}'")
+        if field.column is None:
+            return None
+        if sort_key.direction == "desc":
+            order_by.append(field.column.desc().nulls_first())
+        else:
+            order_by.append(field.column.asc().nulls_last())
+    return order_by
+
+
+def _row_matches(item: Any, row_filters: list[RowPredicate]) -> bool:
+    return all(predicate(item) for predicate in row_filters)
+
+
+def filter_rows(items: list[Any], row_filters: list[RowPredicate]) -> list[Any]:
+    if not row_filters:
         return items
-    out: list[Any] = []
-    for item in items:
-        keep = True
-        for cond in filters:
-            field = field_map.get(cond.field)
-            if not field:
-                raise HTTPException(status_code=422, detail=f"Unknown filter field '{cond.field}'")
-            if not _match_filter(field, field.getter(item), cond):
-                keep = False
-                break
-        if keep:
-            out.append(item)
-    return out
+    return [item for item in items if _row_matches(item, row_filters)]
 
 
 def apply_sort(items: list[Any], field_map: dict[str, FieldDef], sort: list[ReportSortInput]) -> list[Any]:
     if not sort:
         return items
-    sorted_items = list(items)
-    for sort_key in reversed(sort):
+    getters: list[Callable[[Any], Any]] = []
+    for sort_key in sort:
         field = field_map.get(sort_key.field)
         if not field:
             raise HTTPException(status_code=422, detail=f"Unknown sort field '{sort_key.field}'")
-        reverse = sort_key.direction == "desc"
-        sorted_items.sort(key=lambda row: (field.getter(row) is None, field.getter(row)), reverse=reverse)
-    return sorted_items
+        getters.append(field.getter)
+
+    # Decorate each row with its sort keys once, then run stable per-key sorts on the cached values.
+    decorated = [(tuple(getter(row) for getter in getters), row) for row in items]
+    for index in reversed(range(len(sort))):
+        reverse = sort[index].direction == "desc"
+        decorated.sort(key=lambda item: (item[0][index] is None, item[0][index]), reverse=reverse)
+    return [row for _, row in decorated]
 
 
 def build_metadata_response(sources: dict[str, SourceDef]) -> ReportMetadataResponse:
@@ -189,7 +323,48 @@ def build_metadata_response(sources: dict[str, SourceDef]) -> ReportMetadataResp
     )
 
 
-def execute_report_request(payload: ReportExecuteRequest, source: SourceDef, field_map: dict[str, FieldDef], db: Any) -> ReportExecuteResponse:
+@dataclass(frozen=True)
+class ReportPlan:
+    """Validated report request split into SQL-compiled and Python-evaluated parts."""
+
+    selected_fields: list[FieldDef]
+    sql_clauses: list[Any]
+    row_filters: list[RowPredicate]
+    order_by: list[Any] | None
+    sort: list[ReportSortInput]
+    load_options: list[Any]
+
+
+def loader_options(source: SourceDef, fields: list[FieldDef]) -> list[Any]:
+    """Collect the loader options needed to evaluate `fields` through their getters.
+
+    Each field contributes its own `loads`; a join's shared `loads` are added once if any of its fields
+    is evaluated. Fields that are only used in SQL never pull relationships into the query.
+    """
+    join_by_field = {field.key: join for join in source.joins for field in join.fields}
+    options: list[Any] = []
+    seen_options: set[int] = set()
+    seen_joins: set[str] = set()
+    for field in fields:
+        declared = list(field.loads)
+        join = join_by_field.get(field.key)
+        if join is not None and join.key not in seen_joins:
+            seen_joins.add(join.key)
+            declared.extend(join.loads)
+        for option in declared:
+            if id(option) in seen_options:
+                continue
+            seen_options.add(id(option))
+            options.append(option)
+    return options
+
+
+def getter_filter_fields(field_map: dict[str, FieldDef], filters: list[ReportFilterInput]) -> list[FieldDef]:
+    fields = [field_map.get(cond.field) for cond in filters]
+    return [field for field in fields if field is not None and field.column is None]
+
+
+def build_report_plan(payload: ReportQueryRequest, source: SourceDef, field_map: dict[str, FieldDef]) -> ReportPlan:
     if not payload.select:
         raise HTTPException(status_code=422, detail="select must contain at least one field")
 
@@ -200,21 +375,142 @@ def execute_report_request(payload: ReportExecuteRequest, source: SourceDef, fie
             raise HTTPException(status_code=422, detail=f"Unknown selected field '{key}'")
         selected_fields.append(field)
 
+    sql_clauses, row_filters = split_filters(field_map, payload.filters)
+    order_by = sql_order_by(field_map, payload.sort)
+    getter_fields = selected_fields + getter_filter_fields(field_map, payload.filters)
+    if order_by is None:
+        getter_fields += [field_map[sort_key.field] for sort_key in payload.sort if sort_key.field in field_map]
+    return ReportPlan(
+        selected_fields=selected_fields,
+        sql_clauses=sql_clauses,
+        row_filters=row_filters,
+        order_by=order_by,
+        sort=list(payload.sort),
+        load_options=loader_options(source, getter_fields),
+    )
+
+
+def _planned_query(plan: ReportPlan, source: SourceDef, db: Any) -> Any:
+    query = source.query(db)
+    if plan.load_options:
+        query = query.options(*plan.load_options)
+    if plan.sql_clauses:
+        query = query.filter(*plan.sql_clauses)
+    return query
+
+
+def iter_report_rows(
+    plan: ReportPlan,
+    source: SourceDef,
+    field_map: dict[str, FieldDef],
+    db: Any,
+    *,
+    limit: int | None,
+    batch_size: int = 500,
+) -> Iterator[Any]:
+    """Yield matching source rows in report order.
+
+    When the sort is fully SQL-compiled, rows are streamed with `yield_per` and Python-only filters are
+    applied on the fly, so memory stays bounded by `batch_size`. A sort on a getter-only field needs all
+    matching rows in memory first.
+    """
+    query = _planned_query(plan, source, db)
+
+    if plan.order_by is None:
+        rows = apply_sort(filter_rows(query.all(), plan.row_filters), field_map, plan.sort)
+        return iter(rows if limit is None else rows[:limit])
+
+    query = query.order_by(*plan.order_by, _primary_key_column(query).asc())
+    if limit is not None and not plan.row_filters:
+        query = query.limit(limit)
+    streamed: Iterator[Any] = iter(query.yield_per(batch_size))
+    if plan.row_filters:
+        streamed = (row for row in streamed if _row_matches(row, plan.row_filters))
+    if limit is not None:
+        streamed = islice(streamed, limit)
+    return streamed
+
+
+def _primary_key_column(query: Any) -> Any:
+    entity = query.column_descriptions[0]["entity"]
+    return sa_inspect(entity).primary_key[0]
+
+
+def fetch_report_page(
+    plan: ReportPlan,
+    source: SourceDef,
+    field_map: dict[str, FieldDef],
+    db: Any,
+    *,
+    limit: int,
+    cursor: str | None,
+    batch_size: int = 500,
+) -> tuple[list[Any], str | None]:
+    """Return one keyset page of source rows plus the continuation token for the next page.
+
+    The sort keys (with the primary key as tiebreaker) are read back as extra SQL columns, so a page
+    costs the same regardless of how deep into the result it starts.
+    """
+    if plan.order_by is None:
+        raise HTTPException(status_code=422, detail="Paging requires sort fields that can be evaluated in SQL")
+
+    query = _planned_query(plan, source, db)
+    id_column = _primary_key_column(query)
+    key_fields = [field_map[sort_key.field] for sort_key in plan.sort]
+    key_exprs = [keyset_expr(field) for field in key_fields] + [id_column]
+    descending = [sort_key.direction == "desc" for sort_key in plan.sort] + [False]
+    sort_signature = [(sort_key.field, sort_key.direction) for sort_key in plan.sort]
+
+    if cursor is not None:
+        values = decode_cursor(cursor, source.key, sort_signature, key_fields)
+        query = query.filter(keyset_after(key_exprs, descending, values))
+    query = query.order_by(*plan.order_by, id_column.asc()).add_columns(*key_exprs)
+    if not plan.row_filters:
+        query = query.limit(limit + 1)
+
+    streamed: Iterator[Any] = iter(query.yield_per(batch_size))
+    if plan.row_filters:
+        streamed = (row for row in streamed if _row_matches(row[0], plan.row_filters))
+    page = list(islice(streamed, limit + 1))
+
+    next_cursor = None
+    if len(page) > limit:
+        page = page[:limit]
+        next_cursor = encode_cursor(source.key, sort_signature, list(page[-1][1:]))
+    return [row[0] for row in page], next_cursor
+
+
+def count_report_rows(plan: ReportPlan, source: SourceDef, db: Any) -> int | None:
+    """Count all matching rows with one COUNT(*); None when a filter needs Python getters."""
+    if plan.row_filters:
+        return None
+    query = source.query(db)
+    if plan.sql_clauses:
+        query = query.filter(*plan.sql_clauses)
+    return query.order_by(None).count()
+
+
+def render_row(selected_fields: list[FieldDef], row: Any) -> dict[str, str]:
+    return {field.key: serialize_value(field.getter(row)) for field in selected_fields}
+
+
+def execute_report_request(payload: ReportExecuteRequest, source: SourceDef, field_map: dict[str, FieldDef], db: Any) -> ReportExecuteResponse:
+    plan = build_report_plan(payload, source, field_map)
     limit = min(max(payload.limit, 1), 1000)
 
-    rows = source.query(db)
-    rows = filter_rows(rows, field_map, payload.filters)
-    rows = apply_sort(rows, field_map, payload.sort)
-    rows = rows[:limit]
+    if plan.order_by is None and payload.cursor is None:
+        rows = list(iter_report_rows(plan, source, field_map, db, limit=limit))
+        next_cursor = None
+    else:
+        rows, next_cursor = fetch_report_page(plan, source, field_map, db, limit=limit, cursor=payload.cursor)
 
-    rendered_rows = [
-        {field.key: serialize_value(field.getter(row)) for field in selected_fields}
-        for row in rows
-    ]
+    rendered_rows = [render_row(plan.selected_fields, row) for row in rows]
 
     return ReportExecuteResponse(
         source=payload.source,
-        columns=[ReportColumnResponse(key=field.key, label=field.label) for field in selected_fields],
+        columns=[ReportColumnResponse(key=field.key, label=field.label) for field in plan.selected_fields],
         rows=rendered_rows,
         row_count=len(rendered_rows),
+        next_cursor=next_cursor,
+        total_count=count_report_rows(plan, source, db) if payload.include_total else None,
     )
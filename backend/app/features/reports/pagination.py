@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from datetime import date
+from typing import Any
+
+from fastapi import HTTPException
+from sqlalchemy import Integer, String, and_, cast, false, or_, type_coerce
+
+from .types import FieldDef
+
+
+def keyset_expr(field: FieldDef) -> Any:
+    """Return the expression whose value is stored in the cursor for one sort key.
+
+    Datetime keys are compared on their stored text: SQLite keeps `CURRENT_TIMESTAMP` defaults without
+    fractional seconds, while bound datetime parameters carry them, so typed equality would miss ties.
+    Boolean keys are read as 0/1, because SQLAlchemy only allows equality and IS comparisons with True/False.
+    """
+    if field.value_type == "datetime":
+        return type_coerce(field.column, String)
+    if field.value_type == "boolean":
+        return cast(field.column, Integer)
+    return field.column
+
+
+def keyset_after(exprs: list[Any], descending: list[bool], values: list[Any]) -> Any:
+    """Build the predicate selecting rows strictly after `values` in the report order.
+
+    NULL placement follows `sql_order_by`: last for ascending keys, first for descending keys.
+    """
+    clauses: list[Any] = []
+    for index, (expr, desc, value) in enumerate(zip(exprs, descending, values)):
+        step = _keyset_step(expr, desc, value)
+        if step is None:
+            continue
+        equal_prefix = [
+            prefix_expr.is_(None) if prefix_value is None else prefix_expr == prefix_value
+            for prefix_expr, prefix_value in zip(exprs[:index], values[:index])
+        ]
+        clauses.append(and_(*equal_prefix, step))
+    if not clauses:
+        return false()
+    return or_(*clauses)
+
+
+def _keyset_step(expr: Any, desc: bool, value: Any) -> Any | None:
+    if desc:
+        if value is None:
+            return expr.is_not(None)
+        return expr < value
+    if value is None:
+        return None
+    return or_(expr > value, expr.is_(None))
+
+
+def _cursor_signature(source_key: str, sort: list[tuple[str, str]]) -> list[Any]:
+    return [source_key, [list(item) for item in sort]]
+
+
+def encode_cursor(source_key: str, sort: list[tuple[str, str]], values: list[Any]) -> str:
+    payload = {
+        "s": _cursor_signature(source_key, sort),
+        "k": [value.isoformat() if isinstance(value, date) else value for value in values],
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, source_key: str, sort: list[tuple[str, str]], key_fields: list[FieldDef]) -> list[Any]:
+    """Decode a continuation token issued for the same source and sort; the trailing value is the row id."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        signature = payload["s"]
+        values = list(payload["k"])
+    except (ValueError, KeyError, TypeError, binascii.Error) as exc:
+        raise HTTPException(status_code=422, detail="Invalid report cursor") from exc
+    if signature != _cursor_signature(source_key, sort) or len(values) != len(key_fields) + 1:
+        raise HTTPException(status_code=422, detail="Report cursor does not match source and sort")
+    for index, field in enumerate(key_fields):
+        if field.value_type == "date" and values[index] is not None:
+            try:
+                values[index] = date.fromisoformat(values[index])
+            except (TypeError, ValueError) as exc:
+                raise HTTPException(status_code=422, detail="Invalid report cursor") from exc
+    return values
@@ -1,24 +1,124 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+from dataclasses import dataclass
+
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
 
-from ...schemas import ReportExecuteRequest, ReportExecuteResponse, ReportMetadataResponse
-from .engine import active_field_map, build_metadata_response, execute_report_request
+from ...data_versions import get_table_versions
+from ...database import SessionLocal
+from ...http_cache import content_etag
+from ...schemas import (
+    ReportCacheStatsResponse,
+    ReportExecuteRequest,
+    ReportExecuteResponse,
+    ReportExportRequest,
+    ReportMetadataResponse,
+)
+from .aggregation import execute_report_aggregation
+from .cache import ReportResultCache, report_cache_key
+from .engine import (
+    ReportPlan,
+    active_field_map,
+    build_metadata_response,
+    build_report_plan,
+    execute_report_request,
+    iter_report_rows,
+    render_row,
+)
+from .export import EXPORT_MEDIA_TYPES, iter_csv_chunks, iter_ndjson_chunks
 from .sources import build_sources
+from .types import FieldDef, SourceDef
 
 SOURCES = build_sources()
+REPORT_CACHE = ReportResultCache()
+
+
+@dataclass(frozen=True)
+class ReportExportStream:
+    chunks: Iterator[str]
+    media_type: str
+    filename: str
+
+
+def _get_source(source_key: str) -> SourceDef:
+    source = SOURCES.get(source_key)
+    if not source:
+        raise HTTPException(status_code=422, detail=f"Unknown source '{source_key}'")
+    return source
+
+
+# Report metadata only depends on the source definitions, so it is built and hashed once per process.
+REPORT_METADATA = build_metadata_response(SOURCES)
+REPORT_METADATA_ETAG = content_etag(REPORT_METADATA.model_dump_json())
 
 
 def get_report_metadata(*, db: Session) -> ReportMetadataResponse:
     _ = db
-    return build_metadata_response(SOURCES)
+    return REPORT_METADATA
+
+
+def report_metadata_etag() -> str:
+    return REPORT_METADATA_ETAG
 
 
 def execute_report(*, payload: ReportExecuteRequest, db: Session) -> ReportExecuteResponse:
-    source = SOURCES.get(payload.source)
-    if not source:
-        raise HTTPException(status_code=422, detail=f"Unknown source '{payload.source}'")
+    source = _get_source(payload.source)
+    # Versions are read before executing, so writes committed meanwhile make this entry stale.
+    versions = get_table_versions(source.tables)
+    cache_key = report_cache_key(payload)
+    cached = REPORT_CACHE.get(cache_key, versions)
+    if cached is not None:
+        return cached.model_copy(deep=True)
+
     field_map = active_field_map(source, payload.joins)
-    return execute_report_request(payload, source, field_map, db)
+    if payload.group_by or payload.aggregates:
+        response = execute_report_aggregation(payload, source, field_map, db)
+    else:
+        response = execute_report_request(payload, source, field_map, db)
+    REPORT_CACHE.put(cache_key, versions, response.model_copy(deep=True))
+    return response
+
+
+def get_report_cache_stats() -> ReportCacheStatsResponse:
+    return ReportCacheStatsResponse(**REPORT_CACHE.stats())
+
 
+def clear_report_cache() -> ReportCacheStatsResponse:
+    REPORT_CACHE.clear()
+    return get_report_cache_stats()
+
+
+def _export_chunks(
+    payload: ReportExportRequest,
+    plan: ReportPlan,
+    source: SourceDef,
+    field_map: dict[str, FieldDef],
+) -> Iterator[str]:
+    # The body is produced after the endpoint has returned, so the stream owns its own session
+    # instead of relying on the request-scoped `get_db` session still being open.
+    db = SessionLocal()
+    try:
+        limit = max(payload.limit, 1) if payload.limit is not None else None
+        rows = (
+            render_row(plan.selected_fields, row)
+            for row in iter_report_rows(plan, source, field_map, db, limit=limit)
+        )
+        if payload.format == "ndjson":
+            yield from iter_ndjson_chunks(rows)
+        else:
+            yield from iter_csv_chunks(plan.selected_fields, rows)
+    finally:
+        db.close()
+
+
+def export_report(*, payload: ReportExportRequest) -> ReportExportStream:
+    source = _get_source(payload.source)
+    field_map = active_field_map(source, payload.joins)
+    plan = build_report_plan(payload, source, field_map)
+    return ReportExportStream(
+        chunks=_export_chunks(payload, plan, source, field_map),
+        media_type=EXPORT_MEDIA_TYPES[payload.format],
+        filename=f"report-{payload.source.lower()}.{payload.format}",
+    )
@@ -1,23 +1,32 @@
 from __future__ import annotations
 
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import func, select
+from sqlalchemy.orm import Query, Session, joinedload, selectinload
 
-from ....models import Coordination, CoordinationDonor, CoordinationEpisode, Episode
+from ....models import Code, Coordination, CoordinationDonor, CoordinationEpisode, Episode, Patient
 from ..engine import join_unique_text
 from ..types import FieldDef, JoinDef, SourceDef
 
 
 def build_coordination_source() -> SourceDef:
     fields: tuple[FieldDef, ...] = (
-        FieldDef("id", "ID", "number", ("eq", "gte", "lte"), lambda row: row.id),
-        FieldDef("start", "Start", "date", ("eq", "gte", "lte"), lambda row: row.start),
-        FieldDef("end", "End", "date", ("eq", "gte", "lte"), lambda row: row.end),
-        FieldDef("status_name", "Status", "string", ("eq", "contains"), lambda row: row.status.name_default if row.status else ""),
-        FieldDef("donor_nr", "Donor Nr", "string", ("eq", "contains"), lambda row: row.donor_nr),
-        FieldDef("swtpl_nr", "SWTPL Nr", "string", ("eq", "contains"), lambda row: row.swtpl_nr),
-        FieldDef("national_coordinator", "National Coordinator", "string", ("eq", "contains"), lambda row: row.national_coordinator),
-        FieldDef("donor_full_name", "Donor Name", "string", ("eq", "contains"), lambda row: row.donor.full_name if row.donor else ""),
-        FieldDef("created_at", "Created At", "datetime", ("gte", "lte"), lambda row: row.created_at),
+        FieldDef("id", "ID", "number", ("eq", "gte", "lte"), lambda row: row.id, column=Coordination.id),
+        FieldDef("start", "Start", "date", ("eq", "gte", "lte"), lambda row: row.start, column=Coordination.start),
+        FieldDef("end", "End", "date", ("eq", "gte", "lte"), lambda row: row.end, column=Coordination.end),
+        FieldDef(
+            "status_name",
+            "Status",
+            "string",
+            ("eq", "contains"),
+            lambda row: row.status.name_default if row.status else "",
+            column=func.coalesce(select(Code.name_default).where(Code.id == Coordination.status_id).scalar_subquery(), ""),
+            loads=(joinedload(Coordination.status),),
+        ),
+        FieldDef("donor_nr", "Donor Nr", "string", ("eq", "contains"), lambda row: row.donor_nr, column=Coordination.donor_nr),
+        FieldDef("swtpl_nr", "SWTPL Nr", "string", ("eq", "contains"), lambda row: row.swtpl_nr, column=Coordination.swtpl_nr),
+        FieldDef("national_coordinator", "National Coordinator", "string", ("eq", "contains"), lambda row: row.national_coordinator, column=Coordination.national_coordinator),
+        FieldDef("donor_full_name", "Donor Name", "string", ("eq", "contains"), lambda row: row.donor.full_name if row.donor else "", loads=(joinedload(Coordination.donor),)),
+        FieldDef("created_at", "Created At", "datetime", ("gte", "lte"), lambda row: row.created_at, column=Coordination.created_at),
     )
 
     joins: tuple[JoinDef, ...] = (
@@ -51,6 +60,11 @@ def build_coordination_source() -> SourceDef:
                     lambda row: row.donor.diagnosis.name_default if row.donor and row.donor.diagnosis else "",
                 ),
             ),
+            loads=(
+                joinedload(Coordination.donor).joinedload(CoordinationDonor.sex),
+                joinedload(Coordination.donor).joinedload(CoordinationDonor.blood_type),
+                joinedload(Coordination.donor).joinedload(CoordinationDonor.diagnosis),
+            ),
         ),
         JoinDef(
             key="COORDINATION_EPISODES",
@@ -92,6 +106,10 @@ def build_coordination_source() -> SourceDef:
                     lambda row: join_unique_text([link.tpl_date.isoformat() for link in (row.coordination_episodes or []) if link.tpl_date]),
                 ),
             ),
+            loads=(
+                selectinload(Coordination.coordination_episodes).joinedload(CoordinationEpisode.organ),
+                selectinload(Coordination.coordination_episodes).joinedload(CoordinationEpisode.episode),
+            ),
         ),
         JoinDef(
             key="EPISODE_PATIENT_VIA_COORDINATION_EPISODES",
@@ -133,21 +151,27 @@ def build_coordination_source() -> SourceDef:
                     ),
                 ),
             ),
+            loads=(
+                selectinload(Coordination.coordination_episodes).joinedload(CoordinationEpisode.episode).joinedload(Episode.patient),
+            ),
         ),
     )
 
-    def query(db: Session) -> list[Coordination]:
-        return (
-            db.query(Coordination)
-            .options(
-                joinedload(Coordination.status),
-                joinedload(Coordination.donor).joinedload(CoordinationDonor.sex),
-                joinedload(Coordination.donor).joinedload(CoordinationDonor.blood_type),
-                joinedload(Coordination.donor).joinedload(CoordinationDonor.diagnosis),
-                joinedload(Coordination.coordination_episodes).joinedload(CoordinationEpisode.organ),
-                joinedload(Coordination.coordination_episodes).joinedload(CoordinationEpisode.episode).joinedload(Episode.patient),
-            )
-            .all()
-        )
+    def query(db: Session) -> Query:
+        return db.query(Coordination)
 
-    return SourceDef("COORDINATION", "Coordinations", fields, joins, query)
+    return SourceDef(
+        "COORDINATION",
+        "Coordinations",
+        fields,
+        joins,
+        query,
+        tables=(
+            Coordination.__tablename__,
+            CoordinationDonor.__tablename__,
+            CoordinationEpisode.__tablename__,
+            Episode.__tablename__,
+            Patient.__tablename__,
+            Code.__tablename__,
+        ),
+    )
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
-from sqlalchemy.orm import Session, joinedload, selectinload
+from typing import Any
 
-from ....models import Episode, Patient
+from sqlalchemy import func, select
+from sqlalchemy.orm import Query, Session, joinedload, selectinload
+
+from ....models import Code, Episode, EpisodeOrgan, Patient
 from ..engine import join_unique_text
 from ..types import FieldDef, JoinDef, SourceDef
 
@@ -16,16 +19,25 @@ def _episode_organ_names(row: Episode) -> list[str]:
     return []
 
 
+def _patient_column(column: Any) -> Any:
+    # EPISODE.PATIENT_ID is mandatory, so the correlated lookup yields exactly the getter value.
+    return select(column).where(Patient.id == Episode.patient_id).scalar_subquery()
+
+
 def build_episode_source() -> SourceDef:
+    load_patient = joinedload(Episode.patient)
+    organ_loads = (selectinload(Episode.organs), joinedload(Episode.organ))
+
     fields: tuple[FieldDef, ...] = (
-        FieldDef("id", "ID", "number", ("eq", "gte", "lte"), lambda row: row.id),
-        FieldDef("patient_pid", "Patient PID", "string", ("eq", "contains"), lambda row: row.patient.pid if row.patient else ""),
+        FieldDef("id", "ID", "number", ("eq", "gte", "lte"), lambda row: row.id, column=Episode.id),
+        FieldDef("patient_pid", "Patient PID", "string", ("eq", "contains"), lambda row: row.patient.pid if row.patient else "", column=_patient_column(Patient.pid), loads=(load_patient,)),
         FieldDef(
             "patient_name",
             "Patient Name",
             "string",
             ("eq", "contains"),
             lambda row: f"{row.patient.first_name} {row.patient.name}".strip() if row.patient else "",
+            loads=(load_patient,),
         ),
         FieldDef(
             "organ_name",
@@ -33,6 +45,7 @@ def build_episode_source() -> SourceDef:
             "string",
             ("eq", "contains"),
             lambda row: _episode_organ_names(row)[0] if _episode_organ_names(row) else "",
+            loads=organ_loads,
         ),
         FieldDef(
             "organ_names",
@@ -40,6 +53,7 @@ def build_episode_source() -> SourceDef:
             "string",
             ("eq", "contains"),
             lambda row: join_unique_text(_episode_organ_names(row)),
+            loads=organ_loads,
         ),
         FieldDef(
             "organ_count",
@@ -47,12 +61,21 @@ def build_episode_source() -> SourceDef:
             "number",
             ("eq", "gte", "lte"),
             lambda row: len(_episode_organ_names(row)),
+            loads=organ_loads,
+        ),
+        FieldDef(
+            "status_name",
+            "Status",
+            "string",
+            ("eq", "contains"),
+            lambda row: row.status.name_default if row.status else "",
+            column=func.coalesce(select(Code.name_default).where(Code.id == Episode.status_id).scalar_subquery(), ""),
+            loads=(joinedload(Episode.status),),
         ),
-        FieldDef("status_name", "Status", "string", ("eq", "contains"), lambda row: row.status.name_default if row.status else ""),
-        FieldDef("start", "Start", "date", ("eq", "gte", "lte"), lambda row: row.start),
-        FieldDef("end", "End", "date", ("eq", "gte", "lte"), lambda row: row.end),
-        FieldDef("fall_nr", "Fall Nr", "string", ("eq", "contains"), lambda row: row.fall_nr),
-        FieldDef("closed", "Closed", "boolean", ("eq",), lambda row: row.closed),
+        FieldDef("start", "Start", "date", ("eq", "gte", "lte"), lambda row: row.start, column=Episode.start),
+        FieldDef("end", "End", "date", ("eq", "gte", "lte"), lambda row: row.end, column=Episode.end),
+        FieldDef("fall_nr", "Fall Nr", "string", ("eq", "contains"), lambda row: row.fall_nr, column=Episode.fall_nr),
+        FieldDef("closed", "Closed", "boolean", ("eq",), lambda row: row.closed, column=Episode.closed),
     )
 
     joins: tuple[JoinDef, ...] = (
@@ -60,8 +83,8 @@ def build_episode_source() -> SourceDef:
             key="PATIENT",
             label="Patient",
             fields=(
-                FieldDef("patient_ahv_nr", "Patient AHV Nr.", "string", ("eq", "contains"), lambda row: row.patient.ahv_nr if row.patient else ""),
-                FieldDef("patient_lang", "Patient Language", "string", ("eq", "contains"), lambda row: row.patient.lang if row.patient else ""),
+                FieldDef("patient_ahv_nr", "Patient AHV Nr.", "string", ("eq", "contains"), lambda row: row.patient.ahv_nr if row.patient else "", column=_patient_column(Patient.ahv_nr)),
+                FieldDef("patient_lang", "Patient Language", "string", ("eq", "contains"), lambda row: row.patient.lang if row.patient else "", column=_patient_column(Patient.lang)),
                 FieldDef("patient_translate", "Patient Translate", "boolean", ("eq",), lambda row: row.patient.translate if row.patient else False),
                 FieldDef(
                     "patient_sex_name",
@@ -69,21 +92,26 @@ def build_episode_source() -> SourceDef:
                     "string",
                     ("eq", "contains"),
                     lambda row: row.patient.sex.name_default if row.patient and row.patient.sex else "",
+                    loads=(joinedload(Episode.patient).joinedload(Patient.sex),),
                 ),
             ),
+            loads=(load_patient,),
         ),
     )
 
-    def query(db: Session) -> list[Episode]:
-        return (
-            db.query(Episode)
-            .options(
-                joinedload(Episode.patient).joinedload(Patient.sex),
-                joinedload(Episode.organ),
-                selectinload(Episode.organs),
-                joinedload(Episode.status),
-            )
-            .all()
-        )
+    def query(db: Session) -> Query:
+        return db.query(Episode)
 
-    return SourceDef("EPISODE", "Episodes", fields, joins, query)
+    return SourceDef(
+        "EPISODE",
+        "Episodes",
+        fields,
+        joins,
+        query,
+        tables=(
+            Episode.__tablename__,
+            Patient.__tablename__,
+            Code.__tablename__,
+            EpisodeOrgan.__tablename__,
+        ),
+    )
@@ -1,25 +1,49 @@
 from __future__ import annotations
 
-from sqlalchemy.orm import Session, joinedload
+from typing import Any
 
-from ....models import MedicalValue, MedicalValueGroup, MedicalValueTemplate
+from sqlalchemy import false, func, select
+from sqlalchemy.orm import Query, Session, joinedload
+
+from ....models import (
+    Code,
+    DatatypeDefinition,
+    MedicalValue,
+    MedicalValueGroup,
+    MedicalValueGroupTemplate,
+    MedicalValueTemplate,
+    Patient,
+)
 from ..types import FieldDef, JoinDef, SourceDef
 
 
+def _patient_column(column: Any) -> Any:
+    # MEDICAL_VALUE.PATIENT_ID is mandatory, so the correlated lookup yields exactly the getter value.
+    return select(column).where(Patient.id == MedicalValue.patient_id).scalar_subquery()
+
+
 def build_medical_value_source() -> SourceDef:
     fields: tuple[FieldDef, ...] = (
-        FieldDef("id", "ID", "number", ("eq", "gte", "lte"), lambda row: row.id),
-        FieldDef("patient_id", "Patient ID", "number", ("eq", "gte", "lte"), lambda row: row.patient_id),
-        FieldDef("name", "Name", "string", ("eq", "contains"), lambda row: row.name or ""),
-        FieldDef("value", "Value", "string", ("eq", "contains"), lambda row: row.value_canonical or row.value or ""),
-        FieldDef("value_input", "Value Input", "string", ("eq", "contains"), lambda row: row.value_input or ""),
-        FieldDef("unit_input_ucum", "Input Unit UCUM", "string", ("eq", "contains"), lambda row: row.unit_input_ucum or ""),
+        FieldDef("id", "ID", "number", ("eq", "gte", "lte"), lambda row: row.id, column=MedicalValue.id),
+        FieldDef("patient_id", "Patient ID", "number", ("eq", "gte", "lte"), lambda row: row.patient_id, column=MedicalValue.patient_id),
+        FieldDef("name", "Name", "string", ("eq", "contains"), lambda row: row.name or "", column=func.coalesce(MedicalValue.name, "")),
+        FieldDef(
+            "value",
+            "Value",
+            "string",
+            ("eq", "contains"),
+            lambda row: row.value_canonical or row.value or "",
+            column=func.coalesce(func.nullif(MedicalValue.value_canonical, ""), func.nullif(MedicalValue.value, ""), ""),
+        ),
+        FieldDef("value_input", "Value Input", "string", ("eq", "contains"), lambda row: row.value_input or "", column=func.coalesce(MedicalValue.value_input, "")),
+        FieldDef("unit_input_ucum", "Input Unit UCUM", "string", ("eq", "contains"), lambda row: row.unit_input_ucum or "", column=func.coalesce(MedicalValue.unit_input_ucum, "")),
         FieldDef(
             "unit_canonical_ucum",
             "Canonical Unit UCUM",
             "string",
             ("eq", "contains"),
             lambda row: row.unit_canonical_ucum or "",
+            column=func.coalesce(MedicalValue.unit_canonical_ucum, ""),
         ),
         FieldDef(
             "normalization_status",
@@ -27,13 +51,14 @@ def build_medical_value_source() -> SourceDef:
             "string",
             ("eq", "contains"),
             lambda row: row.normalization_status or "",
+            column=func.coalesce(MedicalValue.normalization_status, ""),
         ),
-        FieldDef("pos", "Position", "number", ("eq", "gte", "lte"), lambda row: row.pos or 0),
-        FieldDef("context_key", "Context Key", "string", ("eq", "contains"), lambda row: row.context_key or ""),
-        FieldDef("is_donor_context", "Donor Context", "boolean", ("eq",), lambda row: bool(row.is_donor_context)),
-        FieldDef("renew_date", "Renew Date", "date", ("eq", "gte", "lte"), lambda row: row.renew_date),
-        FieldDef("created_at", "Created At", "datetime", ("gte", "lte"), lambda row: row.created_at),
-        FieldDef("updated_at", "Updated At", "datetime", ("gte", "lte"), lambda row: row.updated_at),
+        FieldDef("pos", "Position", "number", ("eq", "gte", "lte"), lambda row: row.pos or 0, column=func.coalesce(MedicalValue.pos, 0)),
+        FieldDef("context_key", "Context Key", "string", ("eq", "contains"), lambda row: row.context_key or "", column=func.coalesce(MedicalValue.context_key, "")),
+        FieldDef("is_donor_context", "Donor Context", "boolean", ("eq",), lambda row: bool(row.is_donor_context), column=func.coalesce(MedicalValue.is_donor_context, false())),
+        FieldDef("renew_date", "Renew Date", "date", ("eq", "gte", "lte"), lambda row: row.renew_date, column=MedicalValue.renew_date),
+        FieldDef("created_at", "Created At", "datetime", ("gte", "lte"), lambda row: row.created_at, column=MedicalValue.created_at),
+        FieldDef("updated_at", "Updated At", "datetime", ("gte", "lte"), lambda row: row.updated_at, column=MedicalValue.updated_at),
     )
 
     joins: tuple[JoinDef, ...] = (
@@ -41,15 +66,24 @@ def build_medical_value_source() -> SourceDef:
             key="PATIENT",
             label="Patient",
             fields=(
-                FieldDef("patient_pid", "Patient PID", "string", ("eq", "contains"), lambda row: row.patient.pid if row.patient else ""),
+                FieldDef(
+                    "patient_pid",
+                    "Patient PID",
+                    "string",
+                    ("eq", "contains"),
+                    lambda row: row.patient.pid if row.patient else "",
+                    column=_patient_column(Patient.pid),
+                ),
                 FieldDef(
                     "patient_name",
                     "Patient Name",
                     "string",
                     ("eq", "contains"),
                     lambda row: f"{row.patient.first_name} {row.patient.name}".strip() if row.patient else "",
+                    column=_patient_column(func.trim(Patient.first_name + " " + Patient.name)),
                 ),
             ),
+            loads=(joinedload(MedicalValue.patient),),
         ),
         JoinDef(
             key="TEMPLATE",
@@ -91,6 +125,7 @@ def build_medical_value_source() -> SourceDef:
                     lambda row: bool(row.medical_value_template.is_main) if row.medical_value_template else False,
                 ),
             ),
+            loads=(joinedload(MedicalValue.medical_value_template),),
         ),
         JoinDef(
             key="GROUP",
@@ -137,6 +172,10 @@ def build_medical_value_source() -> SourceDef:
                     lambda row: row.medical_value_group.renew_date if row.medical_value_group else None,
                 ),
             ),
+            loads=(
+                joinedload(MedicalValue.medical_value_group).joinedload(MedicalValueGroup.medical_value_group_template),
+                joinedload(MedicalValue.medical_value_group_template),
+            ),
         ),
         JoinDef(
             key="DATATYPE",
@@ -157,6 +196,7 @@ def build_medical_value_source() -> SourceDef:
                     lambda row: row.datatype.name_default if row.datatype else "",
                 ),
             ),
+            loads=(joinedload(MedicalValue.datatype),),
         ),
         JoinDef(
             key="DATATYPE_DEFINITION",
@@ -185,36 +225,41 @@ def build_medical_value_source() -> SourceDef:
                     ),
                 ),
             ),
+            loads=(joinedload(MedicalValue.medical_value_template).joinedload(MedicalValueTemplate.datatype_definition),),
         ),
         JoinDef(
             key="ORGAN_CONTEXT",
             label="Organ Context",
             fields=(
-                FieldDef("organ_id", "Organ ID", "number", ("eq", "gte", "lte"), lambda row: row.organ_id),
+                FieldDef("organ_id", "Organ ID", "number", ("eq", "gte", "lte"), lambda row: row.organ_id, column=MedicalValue.organ_id),
                 FieldDef(
                     "organ_name",
                     "Organ Name",
                     "string",
                     ("eq", "contains"),
                     lambda row: row.organ.name_default if row.organ else "",
+                    loads=(joinedload(MedicalValue.organ),),
                 ),
             ),
         ),
     )
 
-    def query(db: Session) -> list[MedicalValue]:
-        return (
-            db.query(MedicalValue)
-            .options(
-                joinedload(MedicalValue.patient),
-                joinedload(MedicalValue.medical_value_template).joinedload(MedicalValueTemplate.medical_value_group_template),
-                joinedload(MedicalValue.medical_value_template).joinedload(MedicalValueTemplate.datatype_definition),
-                joinedload(MedicalValue.medical_value_group_template),
-                joinedload(MedicalValue.medical_value_group).joinedload(MedicalValueGroup.medical_value_group_template),
-                joinedload(MedicalValue.datatype),
-                joinedload(MedicalValue.organ),
-            )
-            .all()
-        )
+    def query(db: Session) -> Query:
+        return db.query(MedicalValue)
 
-    return SourceDef("MEDICAL_VALUE", "Medical Values", fields, joins, query)
+    return SourceDef(
+        "MEDICAL_VALUE",
+        "Medical Values",
+        fields,
+        joins,
+        query,
+        tables=(
+            MedicalValue.__tablename__,
+            Patient.__tablename__,
+            MedicalValueTemplate.__tablename__,
+            MedicalValueGroupTemplate.__tablename__,
+            MedicalValueGroup.__tablename__,
+            DatatypeDefinition.__tablename__,
+            Code.__tablename__,
+        ),
+    )
@@ -1,23 +1,34 @@
 from __future__ import annotations
 
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import func, select
+from sqlalchemy.orm import Query, Session, joinedload
 
-from ....models import Patient, User
+from ....models import Code, Patient, User
 from ..types import FieldDef, JoinDef, SourceDef
 
 
 def build_patient_source() -> SourceDef:
+    load_resp_coord = joinedload(Patient.resp_coord)
+
     fields: tuple[FieldDef, ...] = (
-        FieldDef("id", "ID", "number", ("eq", "gte", "lte"), lambda row: row.id),
-        FieldDef("pid", "PID", "string", ("eq", "contains"), lambda row: row.pid),
-        FieldDef("first_name", "First Name", "string", ("eq", "contains"), lambda row: row.first_name),
-        FieldDef("name", "Name", "string", ("eq", "contains"), lambda row: row.name),
-        FieldDef("date_of_birth", "Date of Birth", "date", ("eq", "gte", "lte"), lambda row: row.date_of_birth),
-        FieldDef("ahv_nr", "AHV Nr.", "string", ("eq", "contains"), lambda row: row.ahv_nr),
-        FieldDef("lang", "Language", "string", ("eq", "contains"), lambda row: row.lang),
-        FieldDef("translate", "Translate", "boolean", ("eq",), lambda row: row.translate),
-        FieldDef("resp_coord_name", "Responsible Coord.", "string", ("eq", "contains"), lambda row: row.resp_coord.name if row.resp_coord else ""),
-        FieldDef("created_at", "Created At", "datetime", ("gte", "lte"), lambda row: row.created_at),
+        FieldDef("id", "ID", "number", ("eq", "gte", "lte"), lambda row: row.id, column=Patient.id),
+        FieldDef("pid", "PID", "string", ("eq", "contains"), lambda row: row.pid, column=Patient.pid),
+        FieldDef("first_name", "First Name", "string", ("eq", "contains"), lambda row: row.first_name, column=Patient.first_name),
+        FieldDef("name", "Name", "string", ("eq", "contains"), lambda row: row.name, column=Patient.name),
+        FieldDef("date_of_birth", "Date of Birth", "date", ("eq", "gte", "lte"), lambda row: row.date_of_birth, column=Patient.date_of_birth),
+        FieldDef("ahv_nr", "AHV Nr.", "string", ("eq", "contains"), lambda row: row.ahv_nr, column=Patient.ahv_nr),
+        FieldDef("lang", "Language", "string", ("eq", "contains"), lambda row: row.lang, column=Patient.lang),
+        FieldDef("translate", "Translate", "boolean", ("eq",), lambda row: row.translate, column=Patient.translate),
+        FieldDef(
+            "resp_coord_name",
+            "Responsible Coord.",
+            "string",
+            ("eq", "contains"),
+            lambda row: row.resp_coord.name if row.resp_coord else "",
+            column=func.coalesce(select(User.name).where(User.id == Patient.resp_coord_id).scalar_subquery(), ""),
+            loads=(load_resp_coord,),
+        ),
+        FieldDef("created_at", "Created At", "datetime", ("gte", "lte"), lambda row: row.created_at, column=Patient.created_at),
     )
 
     joins: tuple[JoinDef, ...] = (
@@ -31,6 +42,8 @@ def build_patient_source() -> SourceDef:
                     "string",
                     ("eq", "contains"),
                     lambda row: row.resp_coord.ext_id if row.resp_coord else "",
+                    column=func.coalesce(select(User.ext_id).where(User.id == Patient.resp_coord_id).scalar_subquery(), ""),
+                    loads=(load_resp_coord,),
                 ),
                 FieldDef(
                     "resp_coord_role",
@@ -38,18 +51,24 @@ def build_patient_source() -> SourceDef:
                     "string",
                     ("eq", "contains"),
                     lambda row: row.resp_coord.role.name_default if row.resp_coord and row.resp_coord.role else "",
+                    loads=(joinedload(Patient.resp_coord).joinedload(User.role),),
                 ),
             ),
         ),
     )
 
-    def query(db: Session) -> list[Patient]:
-        return (
-            db.query(Patient)
-            .options(
-                joinedload(Patient.resp_coord).joinedload(User.role),
-            )
-            .all()
-        )
+    def query(db: Session) -> Query:
+        return db.query(Patient)
 
-    return SourceDef("PATIENT", "Patients", fields, joins, query)
+    return SourceDef(
+        "PATIENT",
+        "Patients",
+        fields,
+        joins,
+        query,
+        tables=(
+            Patient.__tablename__,
+            User.__tablename__,
+            Code.__tablename__,
+        ),
+    )
@@ -14,6 +14,10 @@ class FieldDef:
     value_type: ValueType
     operators: tuple[OperatorKey, ...]
     getter: Callable[[Any], Any]
+    # Optional SQL expression yielding the same value as `getter`; enables filter/sort push-down.
+    column: Any = None
+    # Loader options the getter relies on; applied only when the field is evaluated in Python.
+    loads: tuple[Any, ...] = ()
 
 
 @dataclass(frozen=True)
@@ -21,6 +25,8 @@ class JoinDef:
     key: str
     label: str
     fields: tuple[FieldDef, ...]
+    # Loader options shared by the join's field getters; applied when any of them is evaluated in Python.
+    loads: tuple[Any, ...] = ()
 
 
 @dataclass(frozen=True)
@@ -29,4 +35,7 @@ class SourceDef:
     label: str
     fields: tuple[FieldDef, ...]
     joins: tuple[JoinDef, ...]
-    query: Callable[[Any], list[Any]]
+    # Returns an unexecuted ORM query for the source entity; the engine adds loader options and WHERE/ORDER BY/LIMIT.
+    query: Callable[[Any], Any]
+    # Tables read by the query and getters; their data versions invalidate cached results.
+    tables: tuple[str, ...] = ()
@@ -1,5 +1,8 @@
+from .migration import migrate_scheduler_lease_fields
+from .retention import compact_scheduled_job_runs
 from .runtime import SchedulerRuntime
 from .service import (
+    list_scheduled_job_daily_stats,
     list_scheduled_job_runs,
     list_scheduled_jobs,
     set_scheduled_job_enabled,
@@ -8,8 +11,11 @@ from .service import (
 
 __all__ = [
     "SchedulerRuntime",
+    "compact_scheduled_job_runs",
+    "list_scheduled_job_daily_stats",
     "list_scheduled_jobs",
     "list_scheduled_job_runs",
+    "migrate_scheduler_lease_fields",
     "set_scheduled_job_enabled",
     "trigger_scheduled_job",
 ]
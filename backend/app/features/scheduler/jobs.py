@@ -6,6 +6,10 @@ from typing import Callable
 
 from sqlalchemy.orm import Session
 
+from ..coordination_procurement_flex import check_explantation_completeness
+from ..medical_values import renormalize_medical_values
+from .retention import RUN_HISTORY_FAILURE_DAYS, RUN_HISTORY_KEEP_LAST, compact_scheduled_job_runs
+
 
 @dataclass(frozen=True)
 class SchedulerJobDefinition:
@@ -27,10 +31,39 @@ class SchedulerJobResult:
 SchedulerJobHandler = Callable[[Session, datetime], SchedulerJobResult]
 
 
-def run_coordination_explantation_24h_completeness_check(_: Session, __: datetime) -> SchedulerJobResult:
+def run_coordination_explantation_24h_completeness_check(db: Session, now: datetime) -> SchedulerJobResult:
+    result = check_explantation_completeness(db=db, now=now)
     return SchedulerJobResult(
-        summary="24h completeness check is configured and ready for implementation.",
-        metrics={"checked_coordinations": 0, "created_tasks": 0},
+        summary=(
+            f"Checked {result.checked_coordinations} coordination(s) ({result.rows_scanned} procurement row(s)); "
+            f"{result.incomplete_organs} organ(s) incomplete, created {result.created_tasks} task(s) "
+            f"in {result.created_task_groups} group(s)."
+        ),
+        metrics=result.metrics(),
+    )
+
+
+def run_medical_value_renormalization(db: Session, now: datetime) -> SchedulerJobResult:
+    result = renormalize_medical_values(db=db, now=now)
+    if not result.definitions_pending:
+        summary = "All medical values are normalized against the current datatype rules."
+    else:
+        summary = (
+            f"Re-normalized {result.rows_scanned} medical value(s) of {result.definitions_pending} changed datatype(s); "
+            f"{result.definitions_completed} datatype(s) completed."
+        )
+    return SchedulerJobResult(summary=summary, metrics=result.metrics())
+
+
+def run_scheduler_run_history_retention(db: Session, now: datetime) -> SchedulerJobResult:
+    result = compact_scheduled_job_runs(db=db, now=now)
+    return SchedulerJobResult(
+        summary=(
+            f"Aggregated {result.runs_aggregated} run(s) into {result.days_aggregated} daily row(s); "
+            f"deleted {result.runs_deleted} run(s) beyond the last {RUN_HISTORY_KEEP_LAST} "
+            f"and failures older than {RUN_HISTORY_FAILURE_DAYS} days."
+        ),
+        metrics=result.metrics(),
     )
 
 
@@ -44,8 +77,24 @@ JOB_DEFINITIONS: tuple[SchedulerJobDefinition, ...] = (
         max_retries=1,
         retry_delay_seconds=60,
     ),
+    SchedulerJobDefinition(
+        job_key="medical_values.renormalization",
+        name="Medical Value Re-normalization",
+        description="Re-runs value normalization in resumable batches for medical values whose datatype rule (units, precision) changed.",
+        interval_seconds=300,
+        is_enabled_by_default=True,
+    ),
+    SchedulerJobDefinition(
+        job_key="scheduler.run_history_retention",
+        name="Scheduler Run History Retention",
+        description="Rolls completed days of scheduler run history into daily aggregates and prunes old runs.",
+        interval_seconds=86400,
+        is_enabled_by_default=True,
+    ),
 )
 
 JOB_HANDLERS: dict[str, SchedulerJobHandler] = {
     "coordination.explantation_24h_completeness_check": run_coordination_explantation_24h_completeness_check,
+    "medical_values.renormalization": run_medical_value_renormalization,
+    "scheduler.run_history_retention": run_scheduler_run_history_retention,
 }
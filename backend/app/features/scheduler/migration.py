@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from sqlalchemy import Engine, inspect, text
+
+
+@dataclass
+class SchedulerLeaseMigrationResult:
+    columns_added: int
+    leases_cleared: int
+
+
+def _quote_identifier(engine: Engine, identifier: str) -> str:
+    return engine.dialect.identifier_preparer.quote(identifier)
+
+
+def migrate_scheduler_lease_fields(*, engine: Engine) -> SchedulerLeaseMigrationResult:
+    """Add the job lease columns to `SCHEDULED_JOB` and clear leases left behind by stopped workers."""
+    columns_added = 0
+    leases_cleared = 0
+    wanted_columns = [
+        ("LEASE_OWNER", "VARCHAR(128)"),
+        ("LEASE_EXPIRES_AT", "DATETIME"),
+    ]
+
+    with engine.begin() as conn:
+        inspector = inspect(conn)
+        if "SCHEDULED_JOB" not in set(inspector.get_table_names()):
+            return SchedulerLeaseMigrationResult(columns_added=0, leases_cleared=0)
+        existing_cols = {str(col.get("name", "")).upper() for col in inspector.get_columns("SCHEDULED_JOB")}
+        table_ref = _quote_identifier(engine, "SCHEDULED_JOB")
+        for column_name, column_type in wanted_columns:
+            if column_name in existing_cols:
+                continue
+            column_ref = _quote_identifier(engine, column_name)
+            conn.execute(text(f"ALTER TABLE {table_ref} ADD COLUMN {column_ref} {column_type}"))
+            columns_added += 1
+
+        # The migration runs with the backend stopped, so every remaining lease is stale.
+        update_result = conn.execute(
+            text(
+                'UPDATE "SCHEDULED_JOB" SET "LEASE_OWNER" = NULL, "LEASE_EXPIRES_AT" = NULL '
+                'WHERE "LEASE_OWNER" IS NOT NULL OR "LEASE_EXPIRES_AT" IS NOT NULL'
+            )
+        )
+        if update_result.rowcount and update_result.rowcount > 0:
+            leases_cleared += int(update_result.rowcount)
+
+    return SchedulerLeaseMigrationResult(columns_added=columns_added, leases_cleared=leases_cleared)
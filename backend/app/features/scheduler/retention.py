@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import math
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, time, timedelta
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from ...models import ScheduledJob, ScheduledJobRun, ScheduledJobRunDaily
+
+RUN_HISTORY_KEEP_LAST = 100
+RUN_HISTORY_FAILURE_DAYS = 30
+
+
+@dataclass
+class RunHistoryRetentionResult:
+    jobs_checked: int = 0
+    days_aggregated: int = 0
+    runs_aggregated: int = 0
+    runs_deleted: int = 0
+
+    def metrics(self) -> dict[str, int]:
+        return dict(vars(self))
+
+
+def _percentile(sorted_values: list[int], fraction: float) -> int | None:
+    # Nearest-rank percentile; exact on the small per-day samples of a job.
+    if not sorted_values:
+        return None
+    return sorted_values[max(0, math.ceil(fraction * len(sorted_values)) - 1)]
+
+
+def _daily_row(job_id: int, run_date: date, runs: list[tuple[str, int | None]]) -> ScheduledJobRunDaily:
+    durations = sorted(duration for _, duration in runs if duration is not None)
+    success_count = sum(1 for status, _ in runs if status == "SUCCESS")
+    return ScheduledJobRunDaily(
+        job_id=job_id,
+        run_date=run_date,
+        run_count=len(runs),
+        success_count=success_count,
+        failed_count=sum(1 for status, _ in runs if status == "FAILED"),
+        success_rate=round(success_count / len(runs), 4),
+        duration_p50_ms=_percentile(durations, 0.5),
+        duration_p95_ms=_percentile(durations, 0.95),
+        duration_max_ms=durations[-1] if durations else None,
+    )
+
+
+def _aggregate_completed_days(*, job_id: int, today_start: datetime, db: Session) -> tuple[int, int]:
+    """Write one aggregate row per completed day after the job's last aggregated day."""
+    last_day = db.query(func.max(ScheduledJobRunDaily.run_date)).filter(ScheduledJobRunDaily.job_id == job_id).scalar()
+    query = db.query(ScheduledJobRun.started_at, ScheduledJobRun.status, ScheduledJobRun.duration_ms).filter(
+        ScheduledJobRun.job_id == job_id,
+        ScheduledJobRun.started_at < today_start,
+    )
+    if last_day is not None:
+        query = query.filter(ScheduledJobRun.started_at >= datetime.combine(last_day + timedelta(days=1), time.min, tzinfo=UTC))
+    runs_by_day: dict[date, list[tuple[str, int | None]]] = defaultdict(list)
+    for started_at, status, duration_ms in query.order_by(ScheduledJobRun.started_at.asc()).yield_per(1000):
+        runs_by_day[started_at.date()].append((status, duration_ms))
+    db.add_all(_daily_row(job_id, run_date, runs) for run_date, runs in sorted(runs_by_day.items()))
+    return len(runs_by_day), sum(len(runs) for runs in runs_by_day.values())
+
+
+def compact_scheduled_job_runs(
+    *,
+    db: Session,
+    now: datetime | None = None,
+    keep_last: int = RUN_HISTORY_KEEP_LAST,
+    failure_days: int = RUN_HISTORY_FAILURE_DAYS,
+) -> RunHistoryRetentionResult:
+    """Roll completed days of run history into daily aggregates and prune the detailed runs.
+
+    Per job the latest `keep_last` runs and failures younger than `failure_days` are kept. Runs of the
+    current (UTC) day are never pruned, so every deleted run is already counted in an aggregate row.
+    """
+    now = now or datetime.now(UTC)
+    today_start = datetime.combine(now.date(), time.min, tzinfo=UTC)
+    failure_cutoff = now - timedelta(days=failure_days)
+    result = RunHistoryRetentionResult()
+    for (job_id,) in db.query(ScheduledJob.id).order_by(ScheduledJob.id).all():
+        result.jobs_checked += 1
+        days, runs = _aggregate_completed_days(job_id=job_id, today_start=today_start, db=db)
+        result.days_aggregated += days
+        result.runs_aggregated += runs
+        kept_ids = [
+            run_id
+            for (run_id,) in db.query(ScheduledJobRun.id)
+            .filter(ScheduledJobRun.job_id == job_id)
+            .order_by(ScheduledJobRun.started_at.desc(), ScheduledJobRun.id.desc())
+            .limit(keep_last)
+        ]
+        prunable = db.query(ScheduledJobRun).filter(
+            ScheduledJobRun.job_id == job_id,
+            ScheduledJobRun.started_at < today_start,
+            ScheduledJobRun.id.notin_(kept_ids),
+            ~((ScheduledJobRun.status == "FAILED") & (ScheduledJobRun.started_at >= failure_cutoff)),
+        )
+        result.runs_deleted += prunable.delete(synchronize_session=False)
+        db.commit()
+    return result
+
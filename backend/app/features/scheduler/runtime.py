@@ -2,43 +2,152 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
 
 from ...database import SessionLocal
-from .service import run_due_jobs
+from .service import (
+    add_scheduler_wakeup_listener,
+    claim_due_jobs,
+    ensure_registered_jobs,
+    next_scheduled_wakeup,
+    remove_scheduler_wakeup_listener,
+    run_leased_job,
+    scheduler_lease_owner,
+)
 
 logger = logging.getLogger(__name__)
 
+_MIN_SLEEP_SECONDS = 1.0
+
 
 class SchedulerRuntime:
-    def __init__(self, poll_interval_seconds: int = 30):
-        self._poll_interval_seconds = max(5, poll_interval_seconds)
+    """Runs due jobs on a bounded thread pool, off the request-serving event loop.
+
+    Jobs are leased in the database before they run, so several backend workers can share the same
+    schedule while each due job still executes exactly once. Between runs the loop sleeps until the
+    next `next_run_at` and is woken early when jobs are enabled, triggered or finish.
+    """
+
+    def __init__(self, max_workers: int = 2, error_retry_seconds: int = 30):
+        self._max_workers = max(1, max_workers)
+        self._error_retry_seconds = max(5, error_retry_seconds)
+        self._owner = scheduler_lease_owner()
+        self._executor: ThreadPoolExecutor | None = None
+        self._running: dict[int, asyncio.Future[object]] = {}
+        self._wakeup = asyncio.Event()
+        self._event_loop: asyncio.AbstractEventLoop | None = None
         self._task: asyncio.Task[None] | None = None
 
     async def start(self) -> None:
         if self._task is not None and not self._task.done():
             return
+        self._event_loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="scheduler-job")
+        add_scheduler_wakeup_listener(self.wake)
         self._task = asyncio.create_task(self._loop(), name="scheduler-runtime-loop")
 
     async def stop(self) -> None:
         if self._task is None:
             return
+        remove_scheduler_wakeup_listener(self.wake)
         self._task.cancel()
         try:
             await self._task
         except asyncio.CancelledError:
             pass
         self._task = None
+        # Running jobs finish in their threads and release their leases; queued ones are dropped.
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._running.clear()
+        self._event_loop = None
+
+    def wake(self) -> None:
+        """Re-plan the schedule now; safe to call from any thread."""
+        event_loop = self._event_loop
+        if event_loop is not None and not event_loop.is_closed():
+            event_loop.call_soon_threadsafe(self._wakeup.set)
+
+    def _register_jobs(self) -> None:
+        db = SessionLocal()
+        try:
+            ensure_registered_jobs(db=db)
+        finally:
+            db.close()
+
+    def _claim(self, limit: int) -> list[int]:
+        db = SessionLocal()
+        try:
+            return claim_due_jobs(owner=self._owner, db=db, limit=limit)
+        finally:
+            db.close()
+
+    def _next_wakeup(self) -> datetime | None:
+        db = SessionLocal()
+        try:
+            return next_scheduled_wakeup(db=db)
+        finally:
+            db.close()
+
+    def _run(self, job_id: int) -> None:
+        db = SessionLocal()
+        try:
+            run_leased_job(job_id=job_id, owner=self._owner, db=db)
+        finally:
+            db.close()
+
+    def _finished(self, job_id: int, future: asyncio.Future[object]) -> None:
+        self._running.pop(job_id, None)
+        if not future.cancelled() and future.exception() is not None:
+            logger.error("Scheduled job %s failed outside its handler.", job_id, exc_info=future.exception())
+        # The job was rescheduled and a pool slot is free again.
+        self._wakeup.set()
+
+    async def _dispatch_due_jobs(self) -> int:
+        free_slots = self._max_workers - len(self._running)
+        if free_slots <= 0 or self._executor is None:
+            return 0
+        event_loop = asyncio.get_running_loop()
+        job_ids = await asyncio.to_thread(self._claim, free_slots)
+        for job_id in job_ids:
+            future = event_loop.run_in_executor(self._executor, self._run, job_id)
+            self._running[job_id] = future
+            future.add_done_callback(lambda done, job_id=job_id: self._finished(job_id, done))
+        return len(job_ids)
+
+    async def _seconds_until_next_run(self) -> float | None:
+        if len(self._running) >= self._max_workers:
+            # A finishing job wakes the loop; due jobs cannot be claimed before that.
+            return None
+        next_wakeup = await asyncio.to_thread(self._next_wakeup)
+        if next_wakeup is None:
+            return None
+        return max(_MIN_SLEEP_SECONDS, (next_wakeup - datetime.now(UTC)).total_seconds())
+
+    async def _sleep(self, seconds: float | None) -> None:
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=seconds)
+        except TimeoutError:
+            pass
 
     async def _loop(self) -> None:
+        # Job definitions only change with a deployment, so they are synchronized once per start.
+        try:
+            await asyncio.to_thread(self._register_jobs)
+        except Exception as exc:  # noqa: BLE001
+            logger.exception("Scheduler job registration failed: %s", exc)
         while True:
+            # Cleared before planning, so wakeups arriving meanwhile trigger another pass.
+            self._wakeup.clear()
             try:
-                db = SessionLocal()
-                try:
-                    executed = run_due_jobs(db=db)
-                    if executed > 0:
-                        logger.info("Scheduler executed %s due job(s).", executed)
-                finally:
-                    db.close()
+                dispatched = await self._dispatch_due_jobs()
+                if dispatched > 0:
+                    logger.info("Scheduler dispatched %s due job(s).", dispatched)
+                sleep_seconds = await self._seconds_until_next_run()
             except Exception as exc:  # noqa: BLE001
                 logger.exception("Scheduler runtime tick failed: %s", exc)
-            await asyncio.sleep(self._poll_interval_seconds)
+                sleep_seconds = self._error_retry_seconds
+            await self._sleep(sleep_seconds)
@@ -1,21 +1,165 @@
 from __future__ import annotations
 
 import json
+import logging
+import os
+import random
+import socket
+import threading
 import uuid
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from datetime import UTC, datetime, timedelta
 
 from fastapi import HTTPException
+from sqlalchemy import or_, update
 from sqlalchemy.orm import Session, joinedload
 
-from ...models import ScheduledJob, ScheduledJobRun
-from ...schemas import ScheduledJobResponse, ScheduledJobRunResponse
+from ...database import SessionLocal
+from ...models import ScheduledJob, ScheduledJobRun, ScheduledJobRunDaily
+from ...schemas import ScheduledJobResponse, ScheduledJobRunDailyResponse, ScheduledJobRunResponse
 from .jobs import JOB_DEFINITIONS, JOB_HANDLERS
 
+logger = logging.getLogger(__name__)
+
+SCHEDULER_LEASE_SECONDS = 120
+SCHEDULER_LEASE_RENEW_SECONDS = 40
+_SCHEDULED_TRIGGERS = ("SCHEDULED", "RETRY")
+
+_wakeup_listeners: list[Callable[[], None]] = []
+
 
 def _utc_now() -> datetime:
     return datetime.now(UTC)
 
 
+def _as_utc(value: datetime) -> datetime:
+    # SQLite hands timezone-aware columns back as naive UTC values.
+    return value if value.tzinfo else value.replace(tzinfo=UTC)
+
+
+def add_scheduler_wakeup_listener(listener: Callable[[], None]) -> None:
+    """Register a callback run after jobs were enabled, triggered or rescheduled; it must be thread-safe."""
+    _wakeup_listeners.append(listener)
+
+
+def remove_scheduler_wakeup_listener(listener: Callable[[], None]) -> None:
+    if listener in _wakeup_listeners:
+        _wakeup_listeners.remove(listener)
+
+
+def _notify_scheduler_wakeup() -> None:
+    for listener in list(_wakeup_listeners):
+        listener()
+
+
+def scheduler_lease_owner() -> str:
+    """Identify one scheduler process across hosts and workers."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+def _lease_free(now: datetime):
+    return or_(
+        ScheduledJob.lease_owner.is_(None),
+        ScheduledJob.lease_expires_at.is_(None),
+        ScheduledJob.lease_expires_at < now,
+    )
+
+
+def _set_lease(db: Session, *conditions, **values) -> bool:  # noqa: ANN002, ANN003
+    # Lease writes leave ROW_VERSION alone, so renewals never make the executing session's job row stale.
+    result = db.execute(
+        update(ScheduledJob).where(*conditions).values(**values).execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return result.rowcount == 1
+
+
+def claim_job_lease(*, job_id: int, owner: str, db: Session, due_only: bool = False, now: datetime | None = None) -> bool:
+    """Atomically take the lease of a job; only one owner can win while the lease is held and not expired."""
+    now = now or _utc_now()
+    conditions = [ScheduledJob.id == job_id, _lease_free(now)]
+    if due_only:
+        conditions += [
+            ScheduledJob.is_enabled.is_(True),
+            ScheduledJob.next_run_at.isnot(None),
+            ScheduledJob.next_run_at <= now,
+        ]
+    claimed = _set_lease(
+        db,
+        *conditions,
+        lease_owner=owner,
+        lease_expires_at=now + timedelta(seconds=SCHEDULER_LEASE_SECONDS),
+    )
+    if claimed:
+        _fail_abandoned_runs(job_id=job_id, now=now, db=db)
+    return claimed
+
+
+def renew_job_lease(*, job_id: int, owner: str, db: Session, now: datetime | None = None) -> bool:
+    now = now or _utc_now()
+    return _set_lease(
+        db,
+        ScheduledJob.id == job_id,
+        ScheduledJob.lease_owner == owner,
+        lease_expires_at=now + timedelta(seconds=SCHEDULER_LEASE_SECONDS),
+    )
+
+
+def release_job_lease(*, job_id: int, owner: str, db: Session) -> bool:
+    return _set_lease(
+        db,
+        ScheduledJob.id == job_id,
+        ScheduledJob.lease_owner == owner,
+        lease_owner=None,
+        lease_expires_at=None,
+    )
+
+
+def _fail_abandoned_runs(*, job_id: int, now: datetime, db: Session) -> int:
+    """Close runs left RUNNING by a worker whose lease expired; runs only start under a held lease."""
+    runs = (
+        db.query(ScheduledJobRun)
+        .filter(ScheduledJobRun.job_id == job_id, ScheduledJobRun.status == "RUNNING")
+        .all()
+    )
+    for run in runs:
+        run.status = "FAILED"
+        run.summary = "Scheduled job run abandoned."
+        run.error_text = "The worker lease expired before the run finished."
+        run.finished_at = now
+        run.duration_ms = max(0, int((now - _as_utc(run.started_at)).total_seconds() * 1000))
+    if runs:
+        db.commit()
+    return len(runs)
+
+
+@contextmanager
+def _lease_heartbeat(*, job_id: int, owner: str) -> Iterator[None]:
+    """Renew the lease in a background thread while the handler runs."""
+    stopped = threading.Event()
+
+    def _renew() -> None:
+        while not stopped.wait(SCHEDULER_LEASE_RENEW_SECONDS):
+            db = SessionLocal()
+            try:
+                if not renew_job_lease(job_id=job_id, owner=owner, db=db):
+                    logger.warning("Scheduler lease of job %s was lost by %s.", job_id, owner)
+                    return
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Scheduler lease renewal of job %s failed: %s", job_id, exc)
+            finally:
+                db.close()
+
+    thread = threading.Thread(target=_renew, name=f"scheduler-lease-{job_id}", daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stopped.set()
+        thread.join()
+
+
 def ensure_registered_jobs(*, db: Session) -> None:
     existing = {item.job_key: item for item in db.query(ScheduledJob).all()}
     changed = False
@@ -46,6 +190,7 @@ def ensure_registered_jobs(*, db: Session) -> None:
             row.retry_delay_seconds = definition.retry_delay_seconds
     if changed:
         db.commit()
+        _notify_scheduler_wakeup()
 
 
 def list_scheduled_jobs(*, db: Session) -> list[ScheduledJobResponse]:
@@ -75,6 +220,22 @@ def list_scheduled_job_runs(*, job_key: str, db: Session, limit: int = 50) -> li
     return [ScheduledJobRunResponse.model_validate(row, from_attributes=True) for row in rows]
 
 
+def list_scheduled_job_daily_stats(*, job_key: str, db: Session, days: int = 30) -> list[ScheduledJobRunDailyResponse]:
+    """Daily run aggregates of a job, newest first; they outlive the pruned run history."""
+    ensure_registered_jobs(db=db)
+    job = db.query(ScheduledJob).filter(ScheduledJob.job_key == job_key).first()
+    if job is None:
+        raise HTTPException(status_code=404, detail="Scheduled job not found")
+    since = _utc_now().date() - timedelta(days=max(1, min(days, 366)))
+    rows = (
+        db.query(ScheduledJobRunDaily)
+        .filter(ScheduledJobRunDaily.job_id == job.id, ScheduledJobRunDaily.run_date >= since)
+        .order_by(ScheduledJobRunDaily.run_date.desc())
+        .all()
+    )
+    return [ScheduledJobRunDailyResponse.model_validate(row, from_attributes=True) for row in rows]
+
+
 def set_scheduled_job_enabled(
     *,
     job_key: str,
@@ -94,6 +255,7 @@ def set_scheduled_job_enabled(
         job.next_run_at = None
     job.changed_by_id = changed_by_id
     db.commit()
+    _notify_scheduler_wakeup()
     refreshed = (
         db.query(ScheduledJob)
         .options(joinedload(ScheduledJob.changed_by_user))
@@ -103,6 +265,34 @@ def set_scheduled_job_enabled(
     return ScheduledJobResponse.model_validate(refreshed, from_attributes=True)
 
 
+def _pending_retry(*, job: ScheduledJob, db: Session) -> ScheduledJobRun | None:
+    """Return the failed scheduled attempt the next scheduled run retries, if retries are left.
+
+    Only the latest run of the job counts: any later run, manual or successful, supersedes the retry.
+    """
+    previous = (
+        db.query(ScheduledJobRun)
+        .filter(ScheduledJobRun.job_id == job.id)
+        .order_by(ScheduledJobRun.id.desc())
+        .first()
+    )
+    if (
+        previous is None
+        or previous.trigger_type not in _SCHEDULED_TRIGGERS
+        or previous.status != "FAILED"
+        or previous.attempt > job.max_retries
+    ):
+        return None
+    return previous
+
+
+def _retry_delay(*, job: ScheduledJob, attempt: int) -> timedelta:
+    """Exponential backoff from `retry_delay_seconds`, capped at the job interval, with equal jitter."""
+    backoff = min(max(1, job.retry_delay_seconds) * 2 ** (attempt - 1), max(1, job.interval_seconds))
+    # Jitter keeps workers and jobs that failed together on a shared dependency from retrying in lockstep.
+    return timedelta(seconds=backoff / 2 + random.uniform(0, backoff / 2))
+
+
 def _execute_job(
     *,
     job: ScheduledJob,
@@ -112,11 +302,18 @@ def _execute_job(
     correlation_id: str | None = None,
 ) -> ScheduledJobRun:
     started_at = _utc_now()
+    attempt = 1
+    retried = _pending_retry(job=job, db=db)
+    if trigger_type == "SCHEDULED":
+        if retried is not None:
+            trigger_type = "RETRY"
+            attempt = retried.attempt + 1
+            correlation_id = retried.correlation_id
     run = ScheduledJobRun(
         job_id=job.id,
         trigger_type=trigger_type,
         status="RUNNING",
-        attempt=1,
+        attempt=attempt,
         correlation_id=(correlation_id or str(uuid.uuid4())).strip(),
         summary="",
         error_text="",
@@ -140,7 +337,8 @@ def _execute_job(
         run.duration_ms = int((finished_at - started_at).total_seconds() * 1000)
         job.last_finished_at = finished_at
         job.last_status = "FAILED"
-        if trigger_type == "SCHEDULED" and job.is_enabled:
+        # Retrying cannot help while the handler is missing.
+        if (trigger_type in _SCHEDULED_TRIGGERS or retried is not None) and job.is_enabled:
             job.next_run_at = _utc_now() + timedelta(seconds=job.interval_seconds)
         db.commit()
         return run
@@ -163,7 +361,13 @@ def _execute_job(
         run.finished_at = finished_at
         run.duration_ms = int((finished_at - started_at).total_seconds() * 1000)
         job.last_finished_at = finished_at
-        if trigger_type == "SCHEDULED" and job.is_enabled:
+        if trigger_type in _SCHEDULED_TRIGGERS and job.is_enabled:
+            if run.status == "FAILED" and run.attempt <= job.max_retries:
+                job.next_run_at = _utc_now() + _retry_delay(job=job, attempt=run.attempt)
+            else:
+                job.next_run_at = _utc_now() + timedelta(seconds=job.interval_seconds)
+        elif retried is not None and job.is_enabled:
+            # A manual run supersedes the pending retry, so the job returns to its regular interval.
             job.next_run_at = _utc_now() + timedelta(seconds=job.interval_seconds)
         db.commit()
 
@@ -181,13 +385,19 @@ def trigger_scheduled_job(
     job = db.query(ScheduledJob).filter(ScheduledJob.job_key == job_key).first()
     if job is None:
         raise HTTPException(status_code=404, detail="Scheduled job not found")
-    run = _execute_job(
-        job=job,
+    owner = scheduler_lease_owner()
+    if not claim_job_lease(job_id=job.id, owner=owner, db=db):
+        raise HTTPException(status_code=409, detail="Scheduled job is already running")
+    run = run_leased_job(
+        job_id=job.id,
+        owner=owner,
         trigger_type="MANUAL",
         changed_by_id=changed_by_id,
         db=db,
         correlation_id=correlation_id,
     )
+    # The manual run may have held back a scheduled run of the same job.
+    _notify_scheduler_wakeup()
     refreshed = (
         db.query(ScheduledJobRun)
         .options(joinedload(ScheduledJobRun.changed_by_user))
@@ -197,26 +407,70 @@ def trigger_scheduled_job(
     return ScheduledJobRunResponse.model_validate(refreshed, from_attributes=True)
 
 
-def run_due_jobs(*, db: Session) -> int:
-    ensure_registered_jobs(db=db)
+def run_leased_job(
+    *,
+    job_id: int,
+    owner: str,
+    db: Session,
+    trigger_type: str = "SCHEDULED",
+    changed_by_id: int | None = None,
+    correlation_id: str | None = None,
+) -> ScheduledJobRun | None:
+    """Execute a job whose lease `owner` holds, renewing the lease meanwhile and releasing it afterwards."""
+    try:
+        job = db.get(ScheduledJob, job_id)
+        if job is None:
+            return None
+        with _lease_heartbeat(job_id=job_id, owner=owner):
+            return _execute_job(
+                job=job,
+                trigger_type=trigger_type,
+                changed_by_id=changed_by_id,
+                db=db,
+                correlation_id=correlation_id,
+            )
+    finally:
+        db.rollback()
+        release_job_lease(job_id=job_id, owner=owner, db=db)
+
+
+def claim_due_jobs(*, owner: str, db: Session, limit: int | None = None) -> list[int]:
+    """Lease up to `limit` (default: all) due jobs for `owner`; jobs leased by a live worker elsewhere are skipped."""
     now = _utc_now()
-    due_jobs = (
-        db.query(ScheduledJob)
+    candidate_ids = [
+        job_id
+        for (job_id,) in db.query(ScheduledJob.id)
         .filter(
             ScheduledJob.is_enabled.is_(True),
             ScheduledJob.next_run_at.isnot(None),
             ScheduledJob.next_run_at <= now,
+            _lease_free(now),
         )
         .order_by(ScheduledJob.next_run_at.asc(), ScheduledJob.id.asc())
+        .limit(limit)
         .all()
-    )
+    ]
+    db.commit()
+    return [job_id for job_id in candidate_ids if claim_job_lease(job_id=job_id, owner=owner, db=db, due_only=True, now=now)]
+
+
+def run_due_jobs(*, db: Session, owner: str | None = None) -> int:
+    """Claim and execute all due jobs in this thread, one after the other."""
+    ensure_registered_jobs(db=db)
+    owner = owner or scheduler_lease_owner()
     executed = 0
-    for job in due_jobs:
-        _execute_job(
-            job=job,
-            trigger_type="SCHEDULED",
-            changed_by_id=None,
-            db=db,
-        )
+    for job_id in claim_due_jobs(owner=owner, db=db):
+        run_leased_job(job_id=job_id, owner=owner, db=db)
         executed += 1
     return executed
+
+
+def next_scheduled_wakeup(*, db: Session) -> datetime | None:
+    """Earliest time an enabled job can be claimed: its `next_run_at`, or the expiry of a lease held on it."""
+    wakeups = [
+        max(_as_utc(next_run_at), _as_utc(lease_expires_at)) if lease_owner and lease_expires_at else _as_utc(next_run_at)
+        for next_run_at, lease_owner, lease_expires_at in db.query(
+            ScheduledJob.next_run_at, ScheduledJob.lease_owner, ScheduledJob.lease_expires_at
+        ).filter(ScheduledJob.is_enabled.is_(True), ScheduledJob.next_run_at.isnot(None))
+    ]
+    return min(wakeups, default=None)
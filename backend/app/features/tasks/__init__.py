@@ -25,12 +25,20 @@ from .template_instantiation_service import (
     validate_template_links,
 )
 from .coordination_protocol_instantiation_service import ensure_coordination_protocol_task_groups
+from .coordination_follow_up_service import (
+    CoordinationFollowUp,
+    CoordinationFollowUpResult,
+    create_coordination_follow_up_tasks,
+)
 
 __all__ = [
     "validate_task_group_links",
     "resolve_task_group_name",
     "validate_template_links",
     "ensure_coordination_protocol_task_groups",
+    "CoordinationFollowUp",
+    "CoordinationFollowUpResult",
+    "create_coordination_follow_up_tasks",
     "instantiate_task_group_template",
     "get_default_code_or_422",
     "list_task_templates",
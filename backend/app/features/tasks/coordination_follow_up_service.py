@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Session
+
+from ...enums import PriorityKey, TaskKindKey, TaskStatusKey
+from ...models import Task, TaskGroup
+from .template_instantiation_service import get_default_code_or_422
+
+
+@dataclass(frozen=True)
+class CoordinationFollowUp:
+    coordination_id: int
+    organ_id: int
+    descriptions: tuple[str, ...]
+    episode_id: int | None = None
+    patient_id: int | None = None
+
+
+@dataclass
+class CoordinationFollowUpResult:
+    created_groups: int = 0
+    created_tasks: int = 0
+    skipped_existing: int = 0
+    group_ids: list[int] = field(default_factory=list)
+
+
+def create_coordination_follow_up_tasks(
+    *,
+    follow_ups: list[CoordinationFollowUp],
+    group_name: str,
+    until: datetime,
+    db: Session,
+    changed_by_id: int | None = None,
+) -> CoordinationFollowUpResult:
+    """Create one task group per coordination organ with a pending task per description.
+
+    Organs that already have a task group named `group_name` are skipped, so repeated calls do not
+    duplicate follow-ups. All groups of the batch are flushed together and committed once.
+    """
+    result = CoordinationFollowUpResult()
+    follow_ups = [entry for entry in follow_ups if entry.descriptions]
+    if not follow_ups:
+        return result
+
+    existing = {
+        (coordination_id, organ_id)
+        for coordination_id, organ_id in db.query(TaskGroup.coordination_id, TaskGroup.organ_id)
+        .filter(
+            TaskGroup.name == group_name,
+            tuple_(TaskGroup.coordination_id, TaskGroup.organ_id).in_(
+                [(entry.coordination_id, entry.organ_id) for entry in follow_ups]
+            ),
+        )
+        .all()
+    }
+    pending_status = get_default_code_or_422(
+        db=db, code_type="TASK_STATUS", code_key=TaskStatusKey.PENDING.value, field_name="status_id"
+    )
+    default_priority = get_default_code_or_422(
+        db=db, code_type="PRIORITY", code_key=PriorityKey.NORMAL.value, field_name="priority_id"
+    )
+
+    pending: list[tuple[TaskGroup, CoordinationFollowUp]] = []
+    for entry in follow_ups:
+        if (entry.coordination_id, entry.organ_id) in existing:
+            result.skipped_existing += 1
+            continue
+        existing.add((entry.coordination_id, entry.organ_id))
+        pending.append(
+            (
+                TaskGroup(
+                    patient_id=entry.patient_id,
+                    task_group_template_id=None,
+                    name=group_name,
+                    episode_id=entry.episode_id,
+                    coordination_id=entry.coordination_id,
+                    organ_id=entry.organ_id,
+                    changed_by_id=changed_by_id,
+                ),
+                entry,
+            )
+        )
+    if not pending:
+        return result
+
+    db.add_all(group for group, _ in pending)
+    db.flush()
+    for group, entry in pending:
+        db.add_all(
+            Task(
+                task_group_id=group.id,
+                description=description,
+                kind_key=TaskKindKey.TASK.value,
+                priority_id=default_priority.id,
+                priority_key=default_priority.key,
+                assigned_to_id=None,
+                until=until,
+                event_time=None,
+                status_id=pending_status.id,
+                status_key=pending_status.key,
+                closed_at=None,
+                closed_by_id=None,
+                comment="",
+                changed_by_id=changed_by_id,
+            )
+            for description in entry.descriptions
+        )
+        result.created_groups += 1
+        result.created_tasks += len(entry.descriptions)
+        result.group_ids.append(group.id)
+    db.commit()
+    return result
@@ -7,7 +7,6 @@ from sqlalchemy.orm import Session, joinedload
 
 from ...enums import PriorityKey, TaskKindKey, TaskScopeKey, TaskStatusKey
 from ...models import (
-    Code,
     CoordinationEpisode,
     CoordinationProcurementProtocolTaskGroupSelection,
     Task,
@@ -15,10 +14,11 @@ from ...models import (
     TaskGroupTemplate,
     TaskTemplate,
 )
+from ..reference import CODE_REGISTRY, ReferenceEntry
 
 
-def _get_default_code(db: Session, *, code_type: str, code_key: str) -> Code | None:
-    return db.query(Code).filter(Code.type == code_type, Code.key == code_key).first()
+def _get_default_code(db: Session, *, code_type: str, code_key: str) -> ReferenceEntry | None:
+    return CODE_REGISTRY.code_by_key(db, code_type, code_key)
 
 
 def ensure_coordination_protocol_task_groups(
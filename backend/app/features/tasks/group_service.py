@@ -5,8 +5,9 @@ from sqlalchemy import or_
 from sqlalchemy.orm import Session, aliased, joinedload
 
 from ...enums import TaskScopeKey
-from ...models import Code, ColloqiumAgenda, Coordination, Episode, Patient, TaskGroup, TaskGroupTemplate
+from ...models import ColloqiumAgenda, Coordination, Episode, Patient, TaskGroup, TaskGroupTemplate
 from ...schemas import TaskGroupCreate, TaskGroupUpdate
+from ..reference import CODE_REGISTRY
 
 
 def get_patient_or_404(patient_id: int, db: Session) -> Patient:
@@ -76,7 +77,7 @@ def validate_task_group_links(
         if not coordination:
             raise HTTPException(status_code=422, detail="coordination_id references unknown COORDINATION")
     if organ_id is not None:
-        organ = db.query(Code).filter(Code.id == organ_id, Code.type == "ORGAN").first()
+        organ = CODE_REGISTRY.code(db, organ_id, "ORGAN")
         if not organ:
             raise HTTPException(status_code=422, detail="organ_id must reference CODE with type ORGAN")
     if tpl_phase_id is not None:
@@ -85,11 +86,7 @@ def validate_task_group_links(
                 status_code=422,
                 detail="tpl_phase_id can only be set if episode_id is set",
             )
-        phase = (
-            db.query(Code)
-            .filter(Code.id == tpl_phase_id, Code.type == "TPL_PHASE")
-            .first()
-        )
+        phase = CODE_REGISTRY.code(db, tpl_phase_id, "TPL_PHASE")
         if not phase:
             raise HTTPException(
                 status_code=422,
@@ -98,7 +95,7 @@ def validate_task_group_links(
     if template is None:
         return
 
-    template_scope = db.query(Code).filter(Code.id == template.scope_id, Code.type == "TASK_SCOPE").first()
+    template_scope = CODE_REGISTRY.code(db, template.scope_id, "TASK_SCOPE")
     if not template_scope:
         raise HTTPException(status_code=422, detail="Template scope_id must reference CODE with type TASK_SCOPE")
     if template_scope.key == TaskScopeKey.EPISODE.value and episode_id is None:
@@ -138,14 +135,14 @@ def resolve_task_group_name(
                 if organ_ids:
                     organ_names = [
                         code.name_default
-                        for code in db.query(Code).filter(Code.type == "ORGAN", Code.id.in_(organ_ids)).all()
+                        for code in (CODE_REGISTRY.code(db, organ_id, "ORGAN") for organ_id in organ_ids)
                         if code and code.name_default
                     ]
                     if organ_names:
                         organ_label = " + ".join(dict.fromkeys(organ_names))
         phase_label = "no phase"
         if tpl_phase_id is not None:
-            phase = db.query(Code).filter(Code.id == tpl_phase_id, Code.type == "TPL_PHASE").first()
+            phase = CODE_REGISTRY.code(db, tpl_phase_id, "TPL_PHASE")
             if phase:
                 phase_label = phase.name_default
         return f"Other tasks ({organ_label}, {phase_label})"
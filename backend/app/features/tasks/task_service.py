@@ -7,16 +7,17 @@ from sqlalchemy import or_
 from sqlalchemy.orm import Session, joinedload
 
 from ...enums import PriorityKey, TaskKindKey, TaskStatusKey
-from ...models import Code, CoordinationProtocolEventLog, Task, TaskGroup, User
+from ...models import CoordinationProtocolEventLog, Task, TaskGroup, User
 from ...schemas import TaskCreate, TaskUpdate
+from ..reference import CODE_REGISTRY, ReferenceEntry
 
 
 def _format_event_time_for_log(value: datetime) -> str:
     return value.astimezone().strftime("%d.%m.%Y/%H:%M")
 
 
-def _get_code_or_422(*, db: Session, code_id: int, code_type: str, field_name: str) -> Code:
-    code = db.query(Code).filter(Code.id == code_id, Code.type == code_type).first()
+def _get_code_or_422(*, db: Session, code_id: int, code_type: str, field_name: str) -> ReferenceEntry:
+    code = CODE_REGISTRY.code(db, code_id, code_type)
     if not code:
         raise HTTPException(
             status_code=422,
@@ -25,8 +26,8 @@ def _get_code_or_422(*, db: Session, code_id: int, code_type: str, field_name: s
     return code
 
 
-def _get_default_code_or_422(*, db: Session, code_type: str, code_key: str, field_name: str) -> Code:
-    code = db.query(Code).filter(Code.type == code_type, Code.key == code_key).first()
+def _get_default_code_or_422(*, db: Session, code_type: str, code_key: str, field_name: str) -> ReferenceEntry:
+    code = CODE_REGISTRY.code_by_key(db, code_type, code_key)
     if not code:
         raise HTTPException(
             status_code=422,
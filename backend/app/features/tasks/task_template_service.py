@@ -4,19 +4,20 @@ from fastapi import HTTPException
 from sqlalchemy.orm import Session, joinedload
 
 from ...enums import PriorityKey, TaskKindKey
-from ...models import Code, TaskGroupTemplate, TaskTemplate
+from ...models import TaskGroupTemplate, TaskTemplate
 from ...schemas import TaskTemplateCreate, TaskTemplateUpdate
+from ..reference import CODE_REGISTRY, ReferenceEntry
 
 
-def _get_code_or_422(*, db: Session, code_id: int, code_type: str, field_name: str) -> Code:
-    code = db.query(Code).filter(Code.id == code_id, Code.type == code_type).first()
+def _get_code_or_422(*, db: Session, code_id: int, code_type: str, field_name: str) -> ReferenceEntry:
+    code = CODE_REGISTRY.code(db, code_id, code_type)
     if not code:
         raise HTTPException(status_code=422, detail=f"{field_name} must reference CODE with type {code_type}")
     return code
 
 
-def _get_default_code_or_422(*, db: Session, code_type: str, code_key: str, field_name: str) -> Code:
-    code = db.query(Code).filter(Code.type == code_type, Code.key == code_key).first()
+def _get_default_code_or_422(*, db: Session, code_type: str, code_key: str, field_name: str) -> ReferenceEntry:
+    code = CODE_REGISTRY.code_by_key(db, code_type, code_key)
     if not code:
         raise HTTPException(status_code=422, detail=f"default {field_name} code not found: {code_type}.{code_key}")
     return code
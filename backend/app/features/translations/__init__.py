@@ -2,10 +2,12 @@ from .service import (
     get_translation_overrides,
     normalize_legacy_dev_forum_capture_label_overrides,
     replace_translation_overrides,
+    translation_overrides_etag,
 )
 
 __all__ = [
     "get_translation_overrides",
     "normalize_legacy_dev_forum_capture_label_overrides",
     "replace_translation_overrides",
+    "translation_overrides_etag",
 ]
@@ -4,6 +4,7 @@ import json
 
 from sqlalchemy.orm import Session
 
+from ...http_cache import table_version_etag
 from ...models import TranslationBundle
 from ...schemas import TranslationOverridesResponse, TranslationOverridesUpdate
 
@@ -45,6 +46,10 @@ def _normalize_legacy_dev_forum_capture_entries(entries: dict[str, str], *, loca
     return normalized_entries, True
 
 
+def translation_overrides_etag(*, locale: str) -> str:
+    return table_version_etag("translation-overrides", [TranslationBundle.__tablename__], _normalize_locale(locale))
+
+
 def get_translation_overrides(*, locale: str, db: Session) -> TranslationOverridesResponse:
     target_locale = _normalize_locale(locale)
     entries: dict[str, str] = {}
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+import uuid
+from collections.abc import Iterable
+
+from fastapi import Request, Response
+
+from .data_versions import get_table_versions
+
+# Table versions are per-process counters, so every ETag carries a token of the process that issued it.
+# The time bucket bounds staleness for writes made by other processes, like the TTLs of the in-process caches.
+HTTP_CACHE_VERSION_TTL_SECONDS = 300
+HTTP_CACHE_CONTROL = "private, no-cache"
+_PROCESS_TOKEN = uuid.uuid4().hex
+
+
+def _etag_from(parts: object) -> str:
+    digest = hashlib.sha256(json.dumps(parts, separators=(",", ":"), default=str).encode("utf-8")).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def table_version_etag(scope: str, table_names: Iterable[str], *params: object) -> str:
+    """Strong ETag for a response built only from the given tables and request parameters.
+
+    Versions are read before the response is built, so a write committed meanwhile yields a newer ETag
+    on the next request instead of pinning stale content.
+    """
+    return _etag_from(
+        [
+            scope,
+            _PROCESS_TOKEN,
+            int(time.time() // HTTP_CACHE_VERSION_TTL_SECONDS),
+            list(get_table_versions(table_names)),
+            list(params),
+        ]
+    )
+
+
+def content_etag(payload: str | bytes) -> str:
+    """Strong ETag of a serialized response body, for responses that do not depend on the database."""
+    data = payload.encode("utf-8") if isinstance(payload, str) else payload
+    return f'"{hashlib.sha256(data).hexdigest()[:32]}"'
+
+
+def _matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        # If-None-Match uses the weak comparison (RFC 9110 13.1.2).
+        if candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def revalidate(request: Request, response: Response, etag: str) -> Response | None:
+    """Return a 304 response when the client already holds `etag`; otherwise set the cache headers on `response`."""
+    headers = {"ETag": etag, "Cache-Control": HTTP_CACHE_CONTROL}
+    if _matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
@@ -11,14 +11,18 @@ from . import models
 from .audit_context import clear_current_changed_by_id
 from .audit_hooks import register_audit_hooks
 from .config import get_config
-from .database import Base, engine
+from .data_versions import register_data_version_hooks
+from .database import Base, SessionLocal, engine
 from .db_schema import SchemaRuntime, verify_schema_drift
 from .enums import CoordinationStatusKey, FavoriteTypeKey, PriorityKey, TaskScopeKey, TaskStatusKey
+from .features.patients import count_patients_missing_list_projection, register_patient_list_projection_hooks
+from .features.reference import warm_code_registry
 from .features.scheduler import SchedulerRuntime
+from .query_metrics import ROUTE_QUERY_METRICS, begin_request_metrics, end_request_metrics, register_query_metrics_hooks
 from .routers import register_routers
 
 logger = logging.getLogger(__name__)
-scheduler_runtime = SchedulerRuntime(poll_interval_seconds=30)
+scheduler_runtime = SchedulerRuntime(max_workers=get_config().scheduler_max_workers)
 
 
 def ensure_strong_enum_code_alignment() -> None:
@@ -81,13 +85,34 @@ def ensure_database_schema_compatible() -> None:
     )
 
 
+def ensure_patient_list_projection_complete() -> None:
+    with SessionLocal() as db:
+        missing = count_patients_missing_list_projection(db=db)
+    if missing:
+        raise RuntimeError(
+            f"PATIENT_LIST_PROJECTION has no row for {missing} patient(s), so the patient list would show "
+            "empty aggregates. Rebuild it explicitly "
+            "(`python -m app.db_schema --mode migrate --env <ENV>` or "
+            "`python -m app.db_data --mode rebuild-patient-list-projection --env <ENV>`)."
+        )
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     _ = models
     register_audit_hooks()
+    register_data_version_hooks()
+    register_patient_list_projection_hooks()
+    if get_config().query_metrics_enabled:
+        register_query_metrics_hooks()
     ensure_database_schema_compatible()
     ensure_strong_enum_code_alignment()
-    logger.info("Startup checks passed: schema compatibility and enum/code alignment verified.")
+    ensure_patient_list_projection_complete()
+    logger.info(
+        "Startup checks passed: schema compatibility, enum/code alignment and patient list projection verified."
+    )
+    with SessionLocal() as db:
+        warm_code_registry(db)
     await scheduler_runtime.start()
     yield
     await scheduler_runtime.stop()
@@ -115,6 +140,24 @@ async def reset_audit_user_context(request: Request, call_next):
         clear_current_changed_by_id()
 
 
+async def record_query_metrics(request: Request, call_next):
+    metrics, token = begin_request_metrics()
+    try:
+        response = await call_next(request)
+    finally:
+        end_request_metrics(token)
+    # Streamed bodies run after this point, so their statements are not included.
+    route = request.scope.get("route")
+    ROUTE_QUERY_METRICS.record(f"{request.method} {getattr(route, 'path', 'unmatched')}", metrics)
+    response.headers["Server-Timing"] = metrics.server_timing()
+    response.headers["X-DB-Query-Count"] = str(metrics.statement_count)
+    return response
+
+
+if get_config().query_metrics_enabled:
+    app.middleware("http")(record_query_metrics)
+
+
 @app.exception_handler(StaleDataError)
 async def handle_stale_data_error(_: Request, __: StaleDataError):
     return JSONResponse(
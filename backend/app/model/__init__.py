@@ -23,7 +23,7 @@ from .coordination_origin import CoordinationOrigin
 from .episode import Episode, EpisodeOrgan
 from .favorite import Favorite
 from .information import Information, InformationContext, InformationUser
-from .datatypes import DatatypeDefinition
+from .datatypes import DatatypeDefinition, MedicalValueRenormalizationState
 from .medical import (
     MedicalValue,
     MedicalValueGroup,
@@ -32,11 +32,11 @@ from .medical import (
     MedicalValueTemplate,
     MedicalValueTemplateContextTemplate,
 )
-from .patient import Absence, ContactInfo, Diagnosis, Patient
+from .patient import Absence, ContactInfo, Diagnosis, Patient, PatientListProjection
 from .person import Person, PersonTeam
 from .reference import Catalogue, Code, TranslationBundle
 from .rbac import AccessPermission
-from .scheduler import ScheduledJob, ScheduledJobRun
+from .scheduler import ScheduledJob, ScheduledJobRun, ScheduledJobRunDaily
 from .tasks import Task, TaskGroup, TaskGroupTemplate, TaskTemplate
 from .user import User
 
@@ -47,6 +47,7 @@ __all__ = [
     "AccessPermission",
     "User",
     "Patient",
+    "PatientListProjection",
     "Person",
     "PersonTeam",
     "Absence",
@@ -54,6 +55,7 @@ __all__ = [
     "ContactInfo",
     "MedicalValueTemplate",
     "DatatypeDefinition",
+    "MedicalValueRenormalizationState",
     "MedicalValueGroupTemplate",
     "MedicalValueGroupContextTemplate",
     "MedicalValueGroup",
@@ -96,4 +98,5 @@ __all__ = [
     "Task",
     "ScheduledJob",
     "ScheduledJobRun",
+    "ScheduledJobRunDaily",
 ]
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -9,6 +9,10 @@ class CoordinationTimeLog(Base):
     """User time log entries associated with a coordination case."""
 
     __tablename__ = "COORDINATION_TIME_LOG"
+    __table_args__ = (
+        # Active (still running) time logs are looked up per user on every clock-in/out.
+        Index("ix_coordination_time_log_user_end", "USER_ID", "END"),
+    )
 
     id = Column(
         "ID",
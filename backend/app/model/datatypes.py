@@ -30,3 +30,114 @@ class DatatypeDefinition(Base):
     code = relationship("Code")
     changed_by_user = relationship("User", foreign_keys=[changed_by_id])
     created_by_user = relationship("User", foreign_keys=[created_by_id])
+
+
+class MedicalValueRenormalizationState(Base):
+    """Checkpoint of the re-normalization of medical values after a datatype rule change."""
+
+    __tablename__ = "MEDICAL_VALUE_RENORMALIZATION"
+
+    datatype_def_id = Column(
+        "DATATYPE_DEF_ID",
+        Integer,
+        ForeignKey("MEDICAL_VALUE_DATATYPE.ID", ondelete="CASCADE"),
+        primary_key=True,
+        comment="Datatype definition whose medical values are re-normalized.",
+        info={"label": "Datatype Definition"},
+    )
+    rule_signature = Column(
+        "RULE_SIGNATURE",
+        String(2048),
+        nullable=False,
+        default="",
+        comment="JSON of the normalization-relevant datatype columns the stored values are normalized against.",
+        info={"label": "Rule Signature"},
+    )
+    status = Column(
+        "STATUS",
+        String(16),
+        nullable=False,
+        default="DONE",
+        comment="PENDING while affected values still need re-normalization, DONE otherwise.",
+        info={"label": "Status"},
+    )
+    last_medical_value_id = Column(
+        "LAST_MEDICAL_VALUE_ID",
+        Integer,
+        nullable=False,
+        default=0,
+        comment="Checkpoint: highest MEDICAL_VALUE.ID already re-normalized in the current pass.",
+        info={"label": "Last Medical Value ID"},
+    )
+    rows_scanned = Column(
+        "ROWS_SCANNED",
+        Integer,
+        nullable=False,
+        default=0,
+        comment="Medical values scanned in the current pass.",
+        info={"label": "Rows Scanned"},
+    )
+    rows_updated = Column(
+        "ROWS_UPDATED",
+        Integer,
+        nullable=False,
+        default=0,
+        comment="Medical values whose normalized fields changed in the current pass.",
+        info={"label": "Rows Updated"},
+    )
+    rows_failed = Column(
+        "ROWS_FAILED",
+        Integer,
+        nullable=False,
+        default=0,
+        comment="Medical values that no longer pass the datatype rule in the current pass.",
+        info={"label": "Rows Failed"},
+    )
+    started_at = Column(
+        "STARTED_AT",
+        DateTime(timezone=True),
+        nullable=True,
+        comment="Start of the current pass.",
+        info={"label": "Started At"},
+    )
+    completed_at = Column(
+        "COMPLETED_AT",
+        DateTime(timezone=True),
+        nullable=True,
+        comment="Completion of the last finished pass.",
+        info={"label": "Completed At"},
+    )
+    changed_by_id = Column(
+        "CHANGED_BY",
+        Integer,
+        ForeignKey("USER.ID"),
+        nullable=True,
+        comment="Last user who changed the checkpoint (unset; rows are maintained by the scheduler).",
+        info={"label": "Changed By"},
+    )
+    created_by_id = Column(
+        "CREATED_BY",
+        Integer,
+        ForeignKey("USER.ID"),
+        nullable=True,
+        comment="User who created the checkpoint (unset; rows are maintained by the scheduler).",
+        info={"label": "Created By"},
+    )
+    created_at = Column(
+        "CREATED_AT",
+        DateTime(timezone=True),
+        server_default=func.now(),
+        comment="Creation timestamp of the checkpoint.",
+        info={"label": "Created At"},
+    )
+    updated_at = Column(
+        "UPDATED_AT",
+        DateTime(timezone=True),
+        onupdate=func.now(),
+        comment="Timestamp of the last checkpoint update.",
+        info={"label": "Updated At"},
+    )
+
+    datatype_definition = relationship("DatatypeDefinition")
+    changed_by_user = relationship("User", foreign_keys=[changed_by_id])
+    created_by_user = relationship("User", foreign_keys=[created_by_id])
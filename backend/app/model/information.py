@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, Date, DateTime, ForeignKey, Integer, String
+from sqlalchemy import Boolean, Column, Date, DateTime, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -9,6 +9,10 @@ class Information(Base):
     """Contextual information message editable by users."""
 
     __tablename__ = "INFORMATION"
+    __table_args__ = (
+        # Newest-first keyset paging of the information feed.
+        Index("ix_information_date_id", "DATE", "ID"),
+    )
 
     id = Column(
         "ID",
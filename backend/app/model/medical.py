@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, Date, DateTime, ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy import Boolean, Column, Date, DateTime, ForeignKey, Index, Integer, String, UniqueConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -267,6 +267,10 @@ class MedicalValue(Base):
     """Patient-specific medical value instance created from template or custom input."""
 
     __tablename__ = "MEDICAL_VALUE"
+    __table_args__ = (
+        # Duplicate check on create/update: patient + context + template.
+        Index("ix_medical_value_patient_context_template", "PATIENT_ID", "IS_DONOR_CONTEXT", "MEDICAL_VALUE_TEMPLATE_ID"),
+    )
 
     id = Column(
         "ID",
@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, Date, DateTime, ForeignKey, Integer, String
+from sqlalchemy import Boolean, Column, Date, DateTime, ForeignKey, Index, Integer, String, Text, column
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -9,6 +9,14 @@ class Patient(Base):
     """Core patient entity with demographic, language, and linked clinical data."""
 
     __tablename__ = "PATIENT"
+    __table_args__ = (
+        Index("ix_patient_name_first_name", "NAME", "FIRST_NAME", "ID"),
+        Index("ix_patient_resp_coord", "RESP_COORD"),
+        # Case-insensitive prefix search seeks in these (see patients.service.search_patients).
+        Index("ix_patient_pid_nocase", column("PID").collate("NOCASE")),
+        Index("ix_patient_name_nocase", column("NAME").collate("NOCASE")),
+        Index("ix_patient_first_name_nocase", column("FIRST_NAME").collate("NOCASE")),
+    )
 
     id = Column(
         "ID",
@@ -389,3 +397,100 @@ class ContactInfo(Base):
     type = relationship("Code")
     changed_by_user = relationship("User", foreign_keys=[changed_by_id])
     created_by_user = relationship("User", foreign_keys=[created_by_id])
+
+
+class PatientListProjection(Base):
+    """Denormalized per-patient aggregates for the patient overview, maintained on every patient-related flush."""
+
+    __tablename__ = "PATIENT_LIST_PROJECTION"
+
+    patient_id = Column(
+        "PATIENT_ID",
+        Integer,
+        ForeignKey("PATIENT.ID", ondelete="CASCADE"),
+        primary_key=True,
+        comment="Patient this overview row summarizes.",
+        info={"label": "Patient"},
+    )
+    contact_info_count = Column(
+        "CONTACT_INFO_COUNT",
+        Integer,
+        nullable=False,
+        default=0,
+        comment="Number of contact info rows of the patient.",
+        info={"label": "Contact Info Count"},
+    )
+    open_episode_count = Column(
+        "OPEN_EPISODE_COUNT",
+        Integer,
+        nullable=False,
+        default=0,
+        comment="Number of episodes of the patient that are not closed.",
+        info={"label": "Open Episode Count"},
+    )
+    open_episode_indicators_json = Column(
+        "OPEN_EPISODE_INDICATORS_JSON",
+        Text,
+        nullable=False,
+        default="[]",
+        comment="JSON list of organ abbreviations per open episode, ordered by episode status position.",
+        info={"label": "Open Episode Indicators JSON"},
+    )
+    episode_organ_ids_json = Column(
+        "EPISODE_ORGAN_IDS_JSON",
+        Text,
+        nullable=False,
+        default="[]",
+        comment="JSON list of organ ids over all episodes of the patient.",
+        info={"label": "Episode Organ IDs JSON"},
+    )
+    open_episode_organ_ids_json = Column(
+        "OPEN_EPISODE_ORGAN_IDS_JSON",
+        Text,
+        nullable=False,
+        default="[]",
+        comment="JSON list of organ ids over the open episodes of the patient.",
+        info={"label": "Open Episode Organ IDs JSON"},
+    )
+    static_medical_values_json = Column(
+        "STATIC_MEDICAL_VALUES_JSON",
+        Text,
+        nullable=False,
+        default="[]",
+        comment="JSON list of static main medical values shown in the patient overview (blood type).",
+        info={"label": "Static Medical Values JSON"},
+    )
+    changed_by_id = Column(
+        "CHANGED_BY",
+        Integer,
+        ForeignKey("USER.ID"),
+        nullable=True,
+        comment="Last user who changed the projection row (unset; rows are maintained by the system).",
+        info={"label": "Changed By"},
+    )
+    created_by_id = Column(
+        "CREATED_BY",
+        Integer,
+        ForeignKey("USER.ID"),
+        nullable=True,
+        comment="User who created the projection row (unset; rows are maintained by the system).",
+        info={"label": "Created By"},
+    )
+    created_at = Column(
+        "CREATED_AT",
+        DateTime(timezone=True),
+        server_default=func.now(),
+        comment="Creation timestamp of the projection row.",
+        info={"label": "Created At"},
+    )
+    updated_at = Column(
+        "UPDATED_AT",
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        comment="Timestamp of the last projection refresh.",
+        info={"label": "Updated At"},
+    )
+
+    changed_by_user = relationship("User", foreign_keys=[changed_by_id])
+    created_by_user = relationship("User", foreign_keys=[created_by_id])
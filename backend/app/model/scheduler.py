@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy import Boolean, Column, Date, DateTime, Float, ForeignKey, Index, Integer, String, UniqueConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -21,6 +21,8 @@ class ScheduledJob(Base):
     last_started_at = Column("LAST_STARTED_AT", DateTime(timezone=True), nullable=True)
     last_finished_at = Column("LAST_FINISHED_AT", DateTime(timezone=True), nullable=True)
     last_status = Column("LAST_STATUS", String(32), nullable=True)
+    lease_owner = Column("LEASE_OWNER", String(128), nullable=True)
+    lease_expires_at = Column("LEASE_EXPIRES_AT", DateTime(timezone=True), nullable=True)
     changed_by_id = Column("CHANGED_BY", Integer, ForeignKey("USER.ID"), nullable=True)
     created_by_id = Column("CREATED_BY", Integer, ForeignKey("USER.ID"), nullable=True)
     created_at = Column("CREATED_AT", DateTime(timezone=True), server_default=func.now())
@@ -29,10 +31,12 @@ class ScheduledJob(Base):
     changed_by_user = relationship("User", foreign_keys=[changed_by_id])
     created_by_user = relationship("User", foreign_keys=[created_by_id])
     runs = relationship("ScheduledJobRun", back_populates="job", cascade="all, delete-orphan")
+    daily_stats = relationship("ScheduledJobRunDaily", back_populates="job", cascade="all, delete-orphan")
 
 
 class ScheduledJobRun(Base):
     __tablename__ = "SCHEDULED_JOB_RUN"
+    __table_args__ = (Index("ix_scheduled_job_run_job_started", "JOB_ID", "STARTED_AT"),)
 
     id = Column("ID", Integer, primary_key=True, index=True)
     job_id = Column("JOB_ID", Integer, ForeignKey("SCHEDULED_JOB.ID"), nullable=False, index=True)
@@ -54,3 +58,27 @@ class ScheduledJobRun(Base):
     job = relationship("ScheduledJob", back_populates="runs")
     changed_by_user = relationship("User", foreign_keys=[changed_by_id])
     created_by_user = relationship("User", foreign_keys=[created_by_id])
+
+
+class ScheduledJobRunDaily(Base):
+    __tablename__ = "SCHEDULED_JOB_RUN_DAILY"
+    __table_args__ = (UniqueConstraint("JOB_ID", "RUN_DATE"),)
+
+    id = Column("ID", Integer, primary_key=True, index=True)
+    job_id = Column("JOB_ID", Integer, ForeignKey("SCHEDULED_JOB.ID"), nullable=False)
+    run_date = Column("RUN_DATE", Date, nullable=False)
+    run_count = Column("RUN_COUNT", Integer, nullable=False, default=0)
+    success_count = Column("SUCCESS_COUNT", Integer, nullable=False, default=0)
+    failed_count = Column("FAILED_COUNT", Integer, nullable=False, default=0)
+    success_rate = Column("SUCCESS_RATE", Float, nullable=False, default=0.0)
+    duration_p50_ms = Column("DURATION_P50_MS", Integer, nullable=True)
+    duration_p95_ms = Column("DURATION_P95_MS", Integer, nullable=True)
+    duration_max_ms = Column("DURATION_MAX_MS", Integer, nullable=True)
+    changed_by_id = Column("CHANGED_BY", Integer, ForeignKey("USER.ID"), nullable=True)
+    created_by_id = Column("CREATED_BY", Integer, ForeignKey("USER.ID"), nullable=True)
+    created_at = Column("CREATED_AT", DateTime(timezone=True), server_default=func.now())
+    updated_at = Column("UPDATED_AT", DateTime(timezone=True), onupdate=func.now())
+
+    job = relationship("ScheduledJob", back_populates="daily_stats")
+    changed_by_user = relationship("User", foreign_keys=[changed_by_id])
+    created_by_user = relationship("User", foreign_keys=[created_by_id])
@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, DateTime, Enum as SqlEnum, ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy import Boolean, Column, DateTime, Enum as SqlEnum, ForeignKey, Index, Integer, String, UniqueConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -393,6 +393,10 @@ class Task(Base):
     """Task entry linked to a task group with ownership, timing, and closure state."""
 
     __tablename__ = "TASK"
+    __table_args__ = (
+        # Task group closure check counts open tasks per group.
+        Index("ix_task_group_status", "TASK_GROUP_ID", "STATUS_KEY"),
+    )
 
     id = Column(
         "ID",
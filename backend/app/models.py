@@ -44,16 +44,19 @@ from .model import (
     InformationUser,
     MedicalValue,
     DatatypeDefinition,
+    MedicalValueRenormalizationState,
     MedicalValueGroup,
     MedicalValueGroupContextTemplate,
     MedicalValueGroupTemplate,
     MedicalValueTemplate,
     MedicalValueTemplateContextTemplate,
     Patient,
+    PatientListProjection,
     Person,
     PersonTeam,
     ScheduledJob,
     ScheduledJobRun,
+    ScheduledJobRunDaily,
     Task,
     TaskGroup,
     TaskGroupTemplate,
@@ -98,6 +101,7 @@ __all__ = [
     "CoordinationOrigin",
     "User",
     "Patient",
+    "PatientListProjection",
     "Person",
     "PersonTeam",
     "Absence",
@@ -105,6 +109,7 @@ __all__ = [
     "ContactInfo",
     "MedicalValueTemplate",
     "DatatypeDefinition",
+    "MedicalValueRenormalizationState",
     "MedicalValueGroupTemplate",
     "MedicalValueGroupContextTemplate",
     "MedicalValueGroup",
@@ -123,6 +128,7 @@ __all__ = [
     "Task",
     "ScheduledJob",
     "ScheduledJobRun",
+    "ScheduledJobRunDaily",
 ]
 
 
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import time
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+SLOWEST_STATEMENT_LIMIT = 3
+_STATEMENT_PREVIEW_LENGTH = 500
+_START_TIMES_KEY = "query_metrics_start_times"
+
+_current_metrics: ContextVar[RequestQueryMetrics | None] = ContextVar("current_query_metrics", default=None)
+_hooks_registered = False
+
+
+@dataclass
+class RequestQueryMetrics:
+    """SQL statements issued while handling one request."""
+
+    statement_count: int = 0
+    db_time_ms: float = 0.0
+    slowest: list[tuple[float, str]] = field(default_factory=list)
+
+    def record(self, statement: str, duration_ms: float) -> None:
+        self.statement_count += 1
+        self.db_time_ms += duration_ms
+        _keep_slowest(self.slowest, duration_ms, statement)
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.db_time_ms:.1f};desc="{self.statement_count} queries"'
+
+
+def _keep_slowest(slowest: list[tuple[float, str]], duration_ms: float, statement: str) -> None:
+    if len(slowest) >= SLOWEST_STATEMENT_LIMIT and duration_ms <= slowest[-1][0]:
+        return
+    slowest.append((duration_ms, statement[:_STATEMENT_PREVIEW_LENGTH]))
+    slowest.sort(key=lambda item: item[0], reverse=True)
+    del slowest[SLOWEST_STATEMENT_LIMIT:]
+
+
+def begin_request_metrics() -> tuple[RequestQueryMetrics, Token]:
+    # The metrics object is shared by reference, so statements run in threadpool copies of the context count too.
+    metrics = RequestQueryMetrics()
+    return metrics, _current_metrics.set(metrics)
+
+
+def end_request_metrics(token: Token) -> None:
+    _current_metrics.reset(token)
+
+
+@dataclass
+class _RouteStats:
+    requests: int = 0
+    statements: int = 0
+    max_statements: int = 0
+    db_time_ms: float = 0.0
+    max_db_time_ms: float = 0.0
+    slowest: list[tuple[float, str]] = field(default_factory=list)
+
+
+class RouteQueryMetrics:
+    """Per-route aggregate of request query metrics, keyed by method and route template."""
+
+    def __init__(self) -> None:
+        self._routes: dict[str, _RouteStats] = {}
+        self._lock = Lock()
+
+    def record(self, route: str, metrics: RequestQueryMetrics) -> None:
+        with self._lock:
+            stats = self._routes.setdefault(route, _RouteStats())
+            stats.requests += 1
+            stats.statements += metrics.statement_count
+            stats.max_statements = max(stats.max_statements, metrics.statement_count)
+            stats.db_time_ms += metrics.db_time_ms
+            stats.max_db_time_ms = max(stats.max_db_time_ms, metrics.db_time_ms)
+            for duration_ms, statement in metrics.slowest:
+                _keep_slowest(stats.slowest, duration_ms, statement)
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        with self._lock:
+            rows = [
+                {
+                    "route": route,
+                    "requests": stats.requests,
+                    "statements": stats.statements,
+                    "avg_statements": stats.statements / stats.requests,
+                    "max_statements": stats.max_statements,
+                    "db_time_ms": round(stats.db_time_ms, 3),
+                    "avg_db_time_ms": round(stats.db_time_ms / stats.requests, 3),
+                    "max_db_time_ms": round(stats.max_db_time_ms, 3),
+                    "slowest_statements": [
+                        {"duration_ms": round(duration_ms, 3), "statement": statement}
+                        for duration_ms, statement in stats.slowest
+                    ],
+                }
+                for route, stats in self._routes.items()
+            ]
+        return sorted(rows, key=lambda row: row["db_time_ms"], reverse=True)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._routes.clear()
+
+
+ROUTE_QUERY_METRICS = RouteQueryMetrics()
+
+
+def register_query_metrics_hooks() -> None:
+    """Time every cursor execution of every engine while a request is being measured."""
+    global _hooks_registered
+    if _hooks_registered:
+        return
+
+    @event.listens_for(Engine, "before_cursor_execute")
+    def _start_statement_timer(conn, cursor, statement, parameters, context, executemany) -> None:  # noqa: ANN001, ARG001
+        if _current_metrics.get() is None:
+            return
+        conn.info.setdefault(_START_TIMES_KEY, []).append(time.perf_counter())
+
+    @event.listens_for(Engine, "after_cursor_execute")
+    def _record_statement(conn, cursor, statement, parameters, context, executemany) -> None:  # noqa: ANN001, ARG001
+        metrics = _current_metrics.get()
+        start_times = conn.info.get(_START_TIMES_KEY)
+        if metrics is None or not start_times:
+            return
+        metrics.record(statement, (time.perf_counter() - start_times.pop()) * 1000)
+
+    _hooks_registered = True
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.orm import Session
 
 from ..auth import require_admin
@@ -12,10 +12,12 @@ from ..features.coordination_procurement_admin import (
     delete_field_scope_template as delete_field_scope_template_service,
     delete_protocol_task_group_selection as delete_protocol_task_group_selection_service,
     get_procurement_admin_config as get_procurement_admin_config_service,
+    procurement_admin_config_etag,
     update_field_group_template as update_field_group_template_service,
     update_field_template as update_field_template_service,
     update_protocol_task_group_selection as update_protocol_task_group_selection_service,
 )
+from ..http_cache import revalidate
 from ..models import User
 from ..schemas import (
     CoordinationProcurementAdminConfigResponse,
@@ -37,9 +39,14 @@ router = APIRouter(prefix="/admin/procurement-config", tags=["admin_procurement_
 
 @router.get("/", response_model=CoordinationProcurementAdminConfigResponse)
 def get_procurement_admin_config(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     _: User = Depends(require_admin),
 ):
+    not_modified = revalidate(request, response, procurement_admin_config_etag())
+    if not_modified is not None:
+        return not_modified
     return get_procurement_admin_config_service(db=db)
 
 
@@ -0,0 +1,24 @@
+from fastapi import APIRouter, Depends
+
+from ..auth import require_admin
+from ..config import get_config
+from ..models import User
+from ..query_metrics import ROUTE_QUERY_METRICS
+from ..schemas import QueryMetricsResponse
+
+router = APIRouter(prefix="/admin/query-metrics", tags=["admin_query_metrics"])
+
+
+@router.get("", response_model=QueryMetricsResponse)
+def get_query_metrics(
+    _: User = Depends(require_admin),
+):
+    return QueryMetricsResponse(enabled=get_config().query_metrics_enabled, routes=ROUTE_QUERY_METRICS.snapshot())
+
+
+@router.delete("", response_model=QueryMetricsResponse)
+def clear_query_metrics(
+    _: User = Depends(require_admin),
+):
+    ROUTE_QUERY_METRICS.clear()
+    return QueryMetricsResponse(enabled=get_config().query_metrics_enabled, routes=[])
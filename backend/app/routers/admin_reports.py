@@ -0,0 +1,25 @@
+from fastapi import APIRouter, Depends
+
+from ..auth import require_admin
+from ..features.reports import (
+    clear_report_cache as clear_report_cache_service,
+    get_report_cache_stats as get_report_cache_stats_service,
+)
+from ..models import User
+from ..schemas import ReportCacheStatsResponse
+
+router = APIRouter(prefix="/admin/reports", tags=["admin_reports"])
+
+
+@router.get("/cache", response_model=ReportCacheStatsResponse)
+def get_report_cache_stats(
+    _: User = Depends(require_admin),
+):
+    return get_report_cache_stats_service()
+
+
+@router.delete("/cache", response_model=ReportCacheStatsResponse)
+def clear_report_cache(
+    _: User = Depends(require_admin),
+):
+    return clear_report_cache_service()
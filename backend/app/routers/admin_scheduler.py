@@ -4,6 +4,7 @@ from sqlalchemy.orm import Session
 from ..auth import require_admin
 from ..database import get_db
 from ..features.scheduler import (
+    list_scheduled_job_daily_stats as list_scheduled_job_daily_stats_service,
     list_scheduled_job_runs as list_scheduled_job_runs_service,
     list_scheduled_jobs as list_scheduled_jobs_service,
     set_scheduled_job_enabled as set_scheduled_job_enabled_service,
@@ -13,6 +14,7 @@ from ..models import User
 from ..schemas import (
     ScheduledJobEnabledUpdate,
     ScheduledJobResponse,
+    ScheduledJobRunDailyResponse,
     ScheduledJobRunResponse,
     TriggerScheduledJobRequest,
 )
@@ -38,6 +40,16 @@ def list_scheduled_job_runs(
     return list_scheduled_job_runs_service(job_key=job_key, limit=limit, db=db)
 
 
+@router.get("/jobs/{job_key}/daily-stats", response_model=list[ScheduledJobRunDailyResponse])
+def list_scheduled_job_daily_stats(
+    job_key: str,
+    days: int = Query(30, ge=1, le=366),
+    db: Session = Depends(get_db),
+    _: User = Depends(require_admin),
+):
+    return list_scheduled_job_daily_stats_service(job_key=job_key, days=days, db=db)
+
+
 @router.post("/jobs/{job_key}/trigger", response_model=ScheduledJobRunResponse)
 def trigger_scheduled_job(
     job_key: str,
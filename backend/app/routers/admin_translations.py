@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy.orm import Session
 
 from ..auth import require_admin
@@ -6,7 +6,9 @@ from ..database import get_db
 from ..features.translations import (
     get_translation_overrides as get_translation_overrides_service,
     replace_translation_overrides as replace_translation_overrides_service,
+    translation_overrides_etag,
 )
+from ..http_cache import revalidate
 from ..models import User
 from ..schemas import TranslationOverridesResponse, TranslationOverridesUpdate
 
@@ -15,10 +17,15 @@ router = APIRouter(prefix="/admin/translations", tags=["admin_translations"])
 
 @router.get("/", response_model=TranslationOverridesResponse)
 def get_admin_translation_overrides(
+    request: Request,
+    response: Response,
     locale: str = "de",
     db: Session = Depends(get_db),
     _: User = Depends(require_admin),
 ):
+    not_modified = revalidate(request, response, translation_overrides_etag(locale=locale))
+    if not_modified is not None:
+        return not_modified
     return get_translation_overrides_service(locale=locale, db=db)
 
 
@@ -1,8 +1,10 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
 from sqlalchemy.orm import Session
 
 from ..database import get_db
+from ..features.reference import catalogues_etag
 from ..features.reference import list_catalogues as list_catalogues_service
+from ..http_cache import revalidate
 from ..schemas import CatalogueResponse
 
 router = APIRouter(prefix="/catalogues", tags=["catalogues"])
@@ -10,7 +12,12 @@ router = APIRouter(prefix="/catalogues", tags=["catalogues"])
 
 @router.get("/", response_model=list[CatalogueResponse])
 def list_catalogues(
+    request: Request,
+    response: Response,
     type: str | None = Query(None),
     db: Session = Depends(get_db),
 ):
+    not_modified = revalidate(request, response, catalogues_etag(catalogue_type=type))
+    if not_modified is not None:
+        return not_modified
     return list_catalogues_service(catalogue_type=type, db=db)
@@ -1,8 +1,10 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
 from sqlalchemy.orm import Session
 
 from ..database import get_db
+from ..features.reference import codes_etag
 from ..features.reference import list_codes as list_codes_service
+from ..http_cache import revalidate
 from ..schemas import CodeResponse
 
 router = APIRouter(prefix="/codes", tags=["codes"])
@@ -10,7 +12,12 @@ router = APIRouter(prefix="/codes", tags=["codes"])
 
 @router.get("/", response_model=list[CodeResponse])
 def list_codes(
+    request: Request,
+    response: Response,
     type: str | None = Query(None),
     db: Session = Depends(get_db),
 ):
+    not_modified = revalidate(request, response, codes_etag(code_type=type))
+    if not_modified is not None:
+        return not_modified
     return list_codes_service(code_type=type, db=db)
@@ -1,17 +1,25 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
 from ..auth import get_user_permission_keys, require_permission
 from ..database import get_db
 from ..features.information import (
+    count_unread_information as count_unread_information_service,
     create_information as create_information_service,
     delete_information as delete_information_service,
     list_information as list_information_service,
+    list_information_feed as list_information_feed_service,
     mark_information_read as mark_information_read_service,
     update_information as update_information_service,
 )
 from ..models import User
-from ..schemas import InformationCreate, InformationResponse, InformationUpdate
+from ..schemas import (
+    InformationCreate,
+    InformationFeedPageResponse,
+    InformationResponse,
+    InformationUnreadCountResponse,
+    InformationUpdate,
+)
 
 router = APIRouter(prefix="/information", tags=["information"])
 
@@ -24,6 +32,42 @@ def list_information(
     return list_information_service(db=db, current_user_id=current_user.id)
 
 
+@router.get("/feed", response_model=InformationFeedPageResponse)
+def list_information_feed(
+    cursor: str | None = None,
+    limit: int = Query(50, ge=1, le=200),
+    include_future: bool = False,
+    include_withdrawn: bool = False,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_permission("view.information")),
+):
+    return list_information_feed_service(
+        db=db,
+        current_user_id=current_user.id,
+        cursor=cursor,
+        limit=limit,
+        include_future=include_future,
+        include_withdrawn=include_withdrawn,
+    )
+
+
+@router.get("/unread-count", response_model=InformationUnreadCountResponse)
+def count_unread_information(
+    include_future: bool = True,
+    include_withdrawn: bool = True,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_permission("view.information")),
+):
+    return InformationUnreadCountResponse(
+        unread_count=count_unread_information_service(
+            db=db,
+            current_user_id=current_user.id,
+            include_future=include_future,
+            include_withdrawn=include_withdrawn,
+        )
+    )
+
+
 @router.post("/", response_model=InformationResponse, status_code=201)
 def create_information(
     payload: InformationCreate,
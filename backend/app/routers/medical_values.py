@@ -1,14 +1,15 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
-from ..auth import require_permission
+from ..auth import require_admin, require_permission
 from ..database import get_db
 from ..features.medical_values import (
     get_medical_value_template_or_404,
+    instantiate_templates_for_patients,
     list_medical_value_templates as list_medical_value_templates_service,
 )
 from ..models import User
-from ..schemas import MedicalValueTemplateResponse
+from ..schemas import MedicalValueInstantiateRequest, MedicalValueInstantiateResponse, MedicalValueTemplateResponse
 
 router = APIRouter(prefix="/medical-value-templates", tags=["medical-value-templates"])
 
@@ -21,6 +22,20 @@ def list_medical_value_templates(
     return list_medical_value_templates_service(db)
 
 
+@router.post("/instantiate", response_model=MedicalValueInstantiateResponse)
+def instantiate_medical_value_templates(
+    payload: MedicalValueInstantiateRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_admin),
+):
+    return instantiate_templates_for_patients(
+        db,
+        payload.patient_ids,
+        include_donor_context=payload.include_donor_context,
+        changed_by_id=current_user.id,
+    )
+
+
 @router.get("/{template_id}", response_model=MedicalValueTemplateResponse)
 def get_medical_value_template(
     template_id: int,
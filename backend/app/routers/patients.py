@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
 from ..auth import require_permission
@@ -8,10 +8,11 @@ from ..features.patients import (
     delete_patient as delete_patient_service,
     get_patient_or_404,
     list_patients as list_patients_service,
+    search_patients as search_patients_service,
     update_patient as update_patient_service,
 )
 from ..models import User
-from ..schemas import PatientCreate, PatientListResponse, PatientResponse, PatientUpdate
+from ..schemas import PatientCreate, PatientListPageResponse, PatientListResponse, PatientResponse, PatientUpdate
 
 router = APIRouter(prefix="/patients", tags=["patients"])
 
@@ -26,6 +27,28 @@ def list_patients(
     return list_patients_service(skip=skip, limit=limit, db=db)
 
 
+@router.get("/page", response_model=PatientListPageResponse)
+def search_patients(
+    q: str | None = None,
+    organ_id: int | None = None,
+    has_open_episode: bool | None = None,
+    resp_coord_id: int | None = None,
+    cursor: str | None = None,
+    limit: int = Query(50, ge=1, le=500),
+    db: Session = Depends(get_db),
+    _: User = Depends(require_permission("view.patients")),
+):
+    return search_patients_service(
+        q=q,
+        organ_id=organ_id,
+        has_open_episode=has_open_episode,
+        resp_coord_id=resp_coord_id,
+        cursor=cursor,
+        limit=limit,
+        db=db,
+    )
+
+
 @router.get("/{patient_id}", response_model=PatientResponse)
 def get_patient(
     patient_id: int,
@@ -4,6 +4,8 @@ from . import (
     absences,
     admin_access,
     admin_catalogues,
+    admin_query_metrics,
+    admin_reports,
     admin_scheduler,
     admin_translations,
     admin_procurement_config,
@@ -53,6 +55,8 @@ def register_routers(app: FastAPI) -> None:
     app.include_router(auth.router, prefix="/api")
     app.include_router(admin_access.router, prefix="/api")
     app.include_router(admin_catalogues.router, prefix="/api")
+    app.include_router(admin_query_metrics.router, prefix="/api")
+    app.include_router(admin_reports.router, prefix="/api")
     app.include_router(admin_scheduler.router, prefix="/api")
     app.include_router(admin_translations.router, prefix="/api")
     app.include_router(admin_procurement_config.router, prefix="/api")
@@ -1,24 +1,33 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from ..auth import require_permission
 from ..database import get_db
 from ..features.reports.service import execute_report as execute_report_service
+from ..features.reports.service import export_report as export_report_service
 from ..features.reports.service import get_report_metadata as get_report_metadata_service
+from ..features.reports.service import report_metadata_etag
+from ..http_cache import revalidate
 from ..models import User
-from ..schemas import ReportExecuteRequest, ReportExecuteResponse, ReportMetadataResponse
+from ..schemas import ReportExecuteRequest, ReportExecuteResponse, ReportExportRequest, ReportMetadataResponse
 
 router = APIRouter(prefix="/reports", tags=["reports"])
 
 
 @router.get("/metadata", response_model=ReportMetadataResponse)
 def get_report_metadata(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_permission("view.reports")),
 ):
     _ = (db, current_user)
+    not_modified = revalidate(request, response, report_metadata_etag())
+    if not_modified is not None:
+        return not_modified
     return get_report_metadata_service(db=db)
 
 
@@ -30,3 +39,17 @@ def execute_report(
 ):
     _ = current_user
     return execute_report_service(payload=payload, db=db)
+
+
+@router.post("/export")
+def export_report(
+    payload: ReportExportRequest,
+    current_user: User = Depends(require_permission("view.reports")),
+):
+    _ = current_user
+    export = export_report_service(payload=payload)
+    return StreamingResponse(
+        export.chunks,
+        media_type=export.media_type,
+        headers={"Content-Disposition": f'attachment; filename="{export.filename}"'},
+    )
@@ -1,9 +1,11 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy.orm import Session
 
 from ..auth import get_current_user
 from ..database import get_db
 from ..features.translations import get_translation_overrides as get_translation_overrides_service
+from ..features.translations import translation_overrides_etag
+from ..http_cache import revalidate
 from ..models import User
 from ..schemas import TranslationOverridesResponse
 
@@ -12,8 +14,13 @@ router = APIRouter(prefix="/translations", tags=["translations"])
 
 @router.get("/overrides", response_model=TranslationOverridesResponse)
 def get_translation_overrides(
+    request: Request,
+    response: Response,
     locale: str = "de",
     db: Session = Depends(get_db),
     _: User = Depends(get_current_user),
 ):
+    not_modified = revalidate(request, response, translation_overrides_etag(locale=locale))
+    if not_modified is not None:
+        return not_modified
     return get_translation_overrides_service(locale=locale, db=db)
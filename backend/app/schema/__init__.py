@@ -37,6 +37,8 @@ from .clinical import (
     MedicalValueGroupTemplateUpdate,
     MedicalValueTemplateContextTemplateBase,
     MedicalValueTemplateContextTemplateResponse,
+    MedicalValueInstantiateRequest,
+    MedicalValueInstantiateResponse,
     MedicalValueResponse,
     MedicalValueTemplateBase,
     MedicalValueTemplateCreate,
@@ -132,7 +134,14 @@ from .dev_forum import (
     DevRequestResponse,
     DevRequestReviewRejectCreate,
 )
-from .information import InformationBase, InformationCreate, InformationResponse, InformationUpdate
+from .information import (
+    InformationBase,
+    InformationCreate,
+    InformationFeedPageResponse,
+    InformationResponse,
+    InformationUnreadCountResponse,
+    InformationUpdate,
+)
 from .e2e_tests import (
     E2ETestCaseResultResponse,
     E2ETestMetadataResponse,
@@ -141,7 +150,7 @@ from .e2e_tests import (
     E2ETestRunnerKey,
     E2ETestRunnerOption,
 )
-from .patient import PatientBase, PatientCreate, PatientListResponse, PatientResponse, PatientUpdate
+from .patient import PatientBase, PatientCreate, PatientListPageResponse, PatientListResponse, PatientResponse, PatientUpdate
 from .person import (
     PersonBase,
     PersonCreate,
@@ -155,14 +164,23 @@ from .person import (
     PersonTeamUpdate,
     PersonUpdate,
 )
+from .query_metrics import (
+    QueryMetricsResponse,
+    QueryMetricsStatementResponse,
+    RouteQueryMetricsResponse,
+)
 from .report import (
+    ReportAggregateInput,
+    ReportCacheStatsResponse,
     ReportColumnResponse,
     ReportExecuteRequest,
     ReportExecuteResponse,
+    ReportExportRequest,
     ReportFieldOption,
     ReportFilterInput,
     ReportJoinOption,
     ReportMetadataResponse,
+    ReportQueryRequest,
     ReportSourceOption,
     ReportSortInput,
 )
@@ -188,6 +206,7 @@ from .support_ticket import (
 from .scheduler import (
     ScheduledJobEnabledUpdate,
     ScheduledJobResponse,
+    ScheduledJobRunDailyResponse,
     ScheduledJobRunResponse,
     TriggerScheduledJobRequest,
 )
@@ -31,6 +31,8 @@ from .clinical_medical_values import (
     MedicalValueGroupTemplateBase,
     MedicalValueGroupTemplateResponse,
     MedicalValueGroupTemplateUpdate,
+    MedicalValueInstantiateRequest,
+    MedicalValueInstantiateResponse,
     MedicalValueResponse,
     MedicalValueTemplateBase,
     MedicalValueTemplateContextTemplateBase,
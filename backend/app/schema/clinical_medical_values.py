@@ -228,3 +228,17 @@ class MedicalValueResponse(MedicalValueBase):
     created_at: datetime
     changed_at: datetime | None = None
     updated_at: datetime | None = None
+
+
+class MedicalValueInstantiateRequest(BaseModel):
+    patient_ids: list[int] | None = None
+    include_donor_context: bool = False
+
+
+class MedicalValueInstantiateResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    patients: int
+    created_groups: int
+    created_values: int
+    created_values_by_patient: dict[int, int]
@@ -61,3 +61,13 @@ class InformationResponse(InformationBase):
     current_user_read_at: dt.datetime | None = None
     withdrawn: bool = False
     has_reads: bool = False
+
+
+class InformationFeedPageResponse(BaseModel):
+    items: list[InformationResponse]
+    next_cursor: str | None = None
+    unread_count: int = 0
+
+
+class InformationUnreadCountResponse(BaseModel):
+    unread_count: int
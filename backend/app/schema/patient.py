@@ -91,3 +91,8 @@ class PatientListResponse(BaseModel):
     episode_organ_ids: list[int] = []
     open_episode_organ_ids: list[int] = []
     static_medical_values: list[PatientListStaticMedicalValue] = []
+
+
+class PatientListPageResponse(BaseModel):
+    items: list[PatientListResponse]
+    next_cursor: str | None = None
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from pydantic import BaseModel
+
+
+class QueryMetricsStatementResponse(BaseModel):
+    duration_ms: float
+    statement: str
+
+
+class RouteQueryMetricsResponse(BaseModel):
+    route: str
+    requests: int
+    statements: int
+    avg_statements: float
+    max_statements: int
+    db_time_ms: float
+    avg_db_time_ms: float
+    max_db_time_ms: float
+    slowest_statements: list[QueryMetricsStatementResponse]
+
+
+class QueryMetricsResponse(BaseModel):
+    enabled: bool
+    routes: list[RouteQueryMetricsResponse]
@@ -4,10 +4,12 @@ from typing import Literal
 
 from pydantic import BaseModel
 
-ReportSourceKey = Literal["PATIENT", "EPISODE", "MEDICAL_VALUE", "COORDINATION"]
+ReportSourceKey = Literal["PATIENT", "EPISODE", "MEDICAL_VALUE", "COORDINATION", "COORDINATION_PROCUREMENT"]
 ReportValueType = Literal["string", "number", "date", "datetime", "boolean"]
 ReportOperatorKey = Literal["eq", "contains", "gte", "lte"]
 ReportSortDirection = Literal["asc", "desc"]
+ReportExportFormat = Literal["csv", "ndjson"]
+ReportAggregateFunction = Literal["count", "min", "max", "avg", "count_distinct"]
 
 
 class ReportFieldOption(BaseModel):
@@ -45,13 +47,30 @@ class ReportSortInput(BaseModel):
     direction: ReportSortDirection = "asc"
 
 
-class ReportExecuteRequest(BaseModel):
+class ReportAggregateInput(BaseModel):
+    function: ReportAggregateFunction
+    field: str | None = None
+
+
+class ReportQueryRequest(BaseModel):
     source: ReportSourceKey
     select: list[str]
     joins: list[str] = []
     filters: list[ReportFilterInput] = []
     sort: list[ReportSortInput] = []
+
+
+class ReportExecuteRequest(ReportQueryRequest):
     limit: int = 200
+    cursor: str | None = None
+    include_total: bool = False
+    group_by: list[str] = []
+    aggregates: list[ReportAggregateInput] = []
+
+
+class ReportExportRequest(ReportQueryRequest):
+    limit: int | None = None
+    format: ReportExportFormat = "csv"
 
 
 class ReportColumnResponse(BaseModel):
@@ -64,3 +83,15 @@ class ReportExecuteResponse(BaseModel):
     columns: list[ReportColumnResponse]
     rows: list[dict[str, str]]
     row_count: int
+    next_cursor: str | None = None
+    total_count: int | None = None
+
+
+class ReportCacheStatsResponse(BaseModel):
+    entries: int
+    max_entries: int
+    ttl_seconds: float
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime
 
 from pydantic import BaseModel, ConfigDict
 
@@ -22,6 +22,8 @@ class ScheduledJobResponse(BaseModel):
     last_started_at: datetime | None = None
     last_finished_at: datetime | None = None
     last_status: str | None = None
+    lease_owner: str | None = None
+    lease_expires_at: datetime | None = None
     changed_by_id: int | None = None
     changed_by_user: UserResponse | None = None
     created_by_id: int | None = None
@@ -55,6 +57,23 @@ class ScheduledJobRunResponse(BaseModel):
     updated_at: datetime | None = None
 
 
+class ScheduledJobRunDailyResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    job_id: int
+    run_date: date
+    run_count: int
+    success_count: int
+    failed_count: int
+    success_rate: float
+    duration_p50_ms: int | None = None
+    duration_p95_ms: int | None = None
+    duration_max_ms: int | None = None
+    created_at: datetime
+    updated_at: datetime | None = None
+
+
 class ScheduledJobEnabledUpdate(BaseModel):
     is_enabled: bool
 
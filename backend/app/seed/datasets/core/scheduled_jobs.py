@@ -8,4 +8,22 @@ RECORDS = [
         "max_retries": 1,
         "retry_delay_seconds": 60,
     },
+    {
+        "job_key": "medical_values.renormalization",
+        "name": "Medical Value Re-normalization",
+        "description": "Re-runs value normalization in resumable batches for medical values whose datatype rule (units, precision) changed.",
+        "is_enabled": True,
+        "interval_seconds": 300,
+        "max_retries": 0,
+        "retry_delay_seconds": 60,
+    },
+    {
+        "job_key": "scheduler.run_history_retention",
+        "name": "Scheduler Run History Retention",
+        "description": "Rolls completed days of scheduler run history into daily aggregates and prunes old runs.",
+        "is_enabled": True,
+        "interval_seconds": 86400,
+        "max_retries": 0,
+        "retry_delay_seconds": 60,
+    },
 ]
@@ -1,6 +1,6 @@
 from sqlalchemy.orm import Session
 
-from ....features.medical_values import instantiate_templates_for_patient
+from ....features.medical_values import instantiate_templates_for_patients
 from ....models import (
     Code,
     ContactInfo,
@@ -85,25 +85,25 @@ def sync_patients(db: Session) -> None:
     db.commit()
 
     # Ensure sample patients have instantiated medical value rows based on templates.
-    patients_by_pid = {row.pid: row for row in db.query(Patient).all()}
+    patient_ids_by_pid = {pid: patient_id for pid, patient_id in db.query(Patient.pid, Patient.id).all()}
     static_blood_type_template = (
         db.query(MedicalValueTemplate)
         .filter(MedicalValueTemplate.lab_key == "STATIC_BLOOD_TYPE")
         .first()
     )
-    for pid, patient in patients_by_pid.items():
-        instantiate_templates_for_patient(
-            db,
-            patient.id,
-            include_donor_context=False,
-            changed_by_id=SAMPLE_CHANGED_BY_ID,
-        )
+    instantiate_templates_for_patients(
+        db,
+        list(patient_ids_by_pid.values()),
+        include_donor_context=False,
+        changed_by_id=SAMPLE_CHANGED_BY_ID,
+    )
+    for pid, patient_id in patient_ids_by_pid.items():
         blood_type_key = patient_blood_types_by_pid.get(pid) or ""
         if static_blood_type_template and blood_type_key:
             row = (
                 db.query(MedicalValue)
                 .filter(
-                    MedicalValue.patient_id == patient.id,
+                    MedicalValue.patient_id == patient_id,
                     MedicalValue.medical_value_template_id == static_blood_type_template.id,
                     MedicalValue.context_key == "STATIC",
                 )
@@ -8,13 +8,21 @@ from sqlalchemy.orm import Session
 
 from app.audit_context import clear_current_changed_by_id
 from app.audit_hooks import register_audit_hooks
+from app.auth import invalidate_auth_caches
+from app.data_versions import register_data_version_hooks
 from app.database import Base, SessionLocal
+from app.features.coordination_procurement_flex import invalidate_procurement_template_catalog
+from app.features.medical_values import invalidate_normalization_rules
+from app.features.reference import invalidate_code_registry
+from app.features.patients import register_patient_list_projection_hooks
 from app.models import Person, User  # noqa: F401
 
 
 @pytest.fixture(scope="session", autouse=True)
 def _register_global_audit_hooks() -> None:
     register_audit_hooks()
+    register_data_version_hooks()
+    register_patient_list_projection_hooks()
 
 
 @pytest.fixture(autouse=True)
@@ -40,6 +48,11 @@ def db_session(tmp_path) -> Generator[Session, None, None]:
     old_bind = SessionLocal.kw.get("bind")
     SessionLocal.configure(bind=engine)
     Base.metadata.create_all(bind=engine)
+    # Process-wide caches must not carry rows over from the previous test database.
+    invalidate_auth_caches()
+    invalidate_normalization_rules()
+    invalidate_code_registry()
+    invalidate_procurement_template_catalog()
     session = SessionLocal()
 
     try:
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from collections.abc import Generator
+
+import pytest
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.auth import create_token, get_current_user, get_user_permission_keys, invalidate_auth_caches
+from app.features.admin_access.service import update_role_permissions
+from app.models import AccessPermission, Code
+from app.schemas import RolePermissionsUpdate
+
+
+@pytest.fixture(autouse=True)
+def _reset_auth_caches() -> Generator[None, None, None]:
+    invalidate_auth_caches()
+    yield
+    invalidate_auth_caches()
+
+
+def _count_statements(db_session: Session, action):  # noqa: ANN001, ANN202
+    statements: list[str] = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany) -> None:  # noqa: ANN001, ARG001
+        statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        result = action()
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+    return result, len(statements)
+
+
+def _seed_role(db_session: Session, user_factory) -> tuple[Code, int]:  # noqa: ANN001
+    role = Code(type="ROLE", key="COORDINATION", pos=1, name_default="Coordination")
+    role.permissions = [
+        AccessPermission(key="view.patients", name_default="View patients"),
+        AccessPermission(key="edit.patients", name_default="Edit patients"),
+    ]
+    db_session.add(role)
+    user = user_factory(ext_id="coord")
+    user.role_id = role.id
+    db_session.commit()
+    return role, user.id
+
+
+def test_authorization_is_query_free_on_warm_path(db_session: Session, user_factory) -> None:  # noqa: ANN001
+    """Resolving the token user and its permissions a second time should not hit the database."""
+    _, user_id = _seed_role(db_session, user_factory)
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=create_token("coord"))
+
+    def _authorize() -> list[str]:
+        user = get_current_user(credentials=credentials, db=db_session)
+        return get_user_permission_keys(db_session, user)
+
+    cold_keys, cold_statements = _count_statements(db_session, _authorize)
+    warm_keys, warm_statements = _count_statements(db_session, _authorize)
+
+    assert cold_keys == warm_keys == ["edit.patients", "view.patients"], (
+        "Cached permission keys should equal the freshly resolved ones."
+    )
+    assert cold_statements > 0 and warm_statements == 0, (
+        f"A warm authorization should run no queries (cold={cold_statements}, warm={warm_statements})."
+    )
+    assert get_current_user(credentials=credentials, db=db_session).id == user_id, (
+        "The cached user should resolve to the same account."
+    )
+
+
+def test_role_permission_update_invalidates_cached_permissions(db_session: Session, user_factory) -> None:  # noqa: ANN001
+    """Editing a role through the access admin service should take effect on the next permission check."""
+    _seed_role(db_session, user_factory)
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=create_token("coord"))
+    user = get_current_user(credentials=credentials, db=db_session)
+    assert "edit.patients" in get_user_permission_keys(db_session, user), "The seeded role should grant edit.patients."
+
+    update_role_permissions(
+        role_key="COORDINATION",
+        payload=RolePermissionsUpdate(permission_keys=["view.patients"]),
+        db=db_session,
+    )
+
+    user = get_current_user(credentials=credentials, db=db_session)
+    assert get_user_permission_keys(db_session, user) == ["view.patients"], (
+        "Permissions revoked from the role should no longer be served from the cache."
+    )
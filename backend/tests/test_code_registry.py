@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.features.reference import CODE_REGISTRY
+from app.models import Catalogue, Code
+
+
+def test_code_registry_serves_lookups_from_memory_and_reloads_on_code_writes(db_session: Session) -> None:
+    """Known codes should resolve without statements; writes to CODE should be visible on the next lookup."""
+    pending = Code(type="TASK_STATUS", key="PENDING", pos=1, name_default="Pending")
+    liver = Code(type="ORGAN", key="LIVER", pos=2, name_default="Liver")
+    heart = Code(type="ORGAN", key="HEART", pos=1, name_default="Heart")
+    hospital = Catalogue(type="HOSPITAL", key="USZ", pos=1, name_default="USZ")
+    db_session.add_all([pending, liver, heart, hospital])
+    db_session.commit()
+    pending_id, liver_id, heart_id, hospital_id = pending.id, liver.id, heart.id, hospital.id
+    CODE_REGISTRY.snapshot(db_session)
+    statements: list[str] = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany) -> None:  # noqa: ANN001, ARG001
+        statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        status = CODE_REGISTRY.code_by_key(db_session, "TASK_STATUS", "PENDING")
+        organ = CODE_REGISTRY.code(db_session, liver_id, "ORGAN")
+        wrong_type = CODE_REGISTRY.code(db_session, liver_id, "TASK_STATUS")
+        organs = CODE_REGISTRY.codes_of_type(db_session, "ORGAN")
+        catalogue = CODE_REGISTRY.catalogue(db_session, hospital_id, "HOSPITAL")
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+
+    assert statements == [], f"Registry hits should not touch the database, got {statements}."
+    assert (status.id, organ.key, wrong_type) == (pending_id, "LIVER", None), "Lookups should honour the code type."
+    assert [entry.id for entry in organs] == [heart_id, liver_id], "Codes of a type should be ordered by position."
+    assert catalogue is not None and catalogue.key == "USZ", "Catalogue entries should resolve by id and type."
+
+    db_session.query(Code).filter(Code.id == liver_id).update({"name_default": "Leber"})
+    db_session.commit()
+    assert CODE_REGISTRY.code(db_session, liver_id).name_default == "Leber", "A CODE write should reload the registry."
+
+    kidney = Code(type="ORGAN", key="KIDNEY", pos=3, name_default="Kidney")
+    db_session.add(kidney)
+    db_session.flush()
+    assert CODE_REGISTRY.code(db_session, kidney.id, "ORGAN") is not None, (
+        "Codes of the caller's open transaction should resolve through the session."
+    )
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from sqlalchemy import create_engine, text
+
+from app import models  # noqa: F401 - ensure model metadata is registered
+from app.database import Base
+from app.db_schema import SchemaRuntime, create_missing_indexes, verify_schema_drift
+
+COMPOSITE_INDEXES = {
+    "TASK.ix_task_group_status": "TASK(TASK_GROUP_ID, STATUS_KEY)",
+    "COORDINATION_TIME_LOG.ix_coordination_time_log_user_end": "COORDINATION_TIME_LOG(USER_ID, END)",
+    "MEDICAL_VALUE.ix_medical_value_patient_context_template": "MEDICAL_VALUE(PATIENT_ID, IS_DONOR_CONTEXT, MEDICAL_VALUE_TEMPLATE_ID)",
+}
+
+
+def test_migrate_creates_composite_indexes_missing_on_existing_tables(tmp_path) -> None:  # noqa: ANN001
+    """Drift verification should report dropped composite indexes and migrate should recreate them."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'schema.db'}")
+    runtime = SchemaRuntime(engine=engine, base=Base)
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        for qualified_name in COMPOSITE_INDEXES:
+            conn.execute(text(f'DROP INDEX "{qualified_name.split(".", 1)[1]}"'))
+
+    try:
+        drift = verify_schema_drift(runtime)
+        assert set(COMPOSITE_INDEXES.values()) <= set(drift.missing_indexes), (
+            f"Strict drift check should list the dropped composite indexes, got {drift.missing_indexes}."
+        )
+
+        created = create_missing_indexes(runtime)
+        assert sorted(created) == sorted(COMPOSITE_INDEXES), "Migrate should create exactly the missing indexes."
+        assert verify_schema_drift(runtime).missing_indexes == [], "No index drift should remain after migrate."
+        assert create_missing_indexes(runtime) == [], "A second migrate run should be a no-op."
+    finally:
+        engine.dispose()
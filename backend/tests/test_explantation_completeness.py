@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy.orm import Session
+
+from app.features.coordination_procurement_flex import check_explantation_completeness
+from app.features.coordination_procurement_flex.completeness_service import EXPLANTATION_FOLLOW_UP_TASK_GROUP_NAME
+from app.models import (
+    Code,
+    Coordination,
+    CoordinationProcurementFieldScopeTemplate,
+    CoordinationProcurementFieldTemplate,
+    CoordinationProcurementTypedData,
+    DatatypeDefinition,
+    Task,
+    TaskGroup,
+)
+
+
+def _seed_field(db: Session, *, key: str, name: str, datatype_id: int, organ_id: int | None) -> None:
+    field = CoordinationProcurementFieldTemplate(key=key, name_default=name, datatype_def_id=datatype_id)
+    db.add(field)
+    db.flush()
+    db.add(CoordinationProcurementFieldScopeTemplate(field_template_id=field.id, organ_id=organ_id, slot_key="MAIN"))
+
+
+def test_completeness_check_creates_one_follow_up_group_per_incomplete_organ(db_session: Session) -> None:
+    """Organs explanted over 24h ago should get a task per missing scoped field, exactly once."""
+    now = datetime.now(UTC)
+    heart = Code(type="ORGAN", key="HEART", pos=1, name_default="Heart")
+    open_status = Code(type="COORDINATION_STATUS", key="OPEN", pos=1, name_default="Open")
+    datatype_code = Code(type="DATATYPE", key="TEXT", pos=1, name_default="Text")
+    db_session.add_all(
+        [
+            heart,
+            open_status,
+            datatype_code,
+            Code(type="TASK_STATUS", key="PENDING", pos=1, name_default="Pending"),
+            Code(type="PRIORITY", key="NORMAL", pos=1, name_default="Normal"),
+        ]
+    )
+    db_session.flush()
+    datatype = DatatypeDefinition(code_id=datatype_code.id, primitive_kind="text")
+    db_session.add(datatype)
+    db_session.flush()
+    _seed_field(db_session, key="CROSS_CLAMP_TIME", name="Cross clamp time", datatype_id=datatype.id, organ_id=None)
+    _seed_field(db_session, key="NMP_USED", name="NMP used", datatype_id=datatype.id, organ_id=heart.id)
+    _seed_field(db_session, key="ON_SITE_COORDINATORS", name="On-site coordinators", datatype_id=datatype.id, organ_id=heart.id)
+
+    coordinations = {}
+    for label, explanted_hours_ago, confirmed in (("old", 30, False), ("recent", 2, False), ("confirmed", 30, True)):
+        coordination = Coordination(status_id=open_status.id, status_key="OPEN", completion_confirmed=confirmed)
+        db_session.add(coordination)
+        db_session.flush()
+        db_session.add(
+            CoordinationProcurementTypedData(
+                coordination_id=coordination.id,
+                organ_id=heart.id,
+                slot_key="MAIN",
+                cross_clamp_time=now - timedelta(hours=explanted_hours_ago),
+            )
+        )
+        coordinations[label] = coordination.id
+    db_session.commit()
+
+    result = check_explantation_completeness(db=db_session, now=now, batch_size=1)
+
+    assert (result.checked_coordinations, result.rows_scanned) == (1, 1), (
+        f"Only the unconfirmed coordination explanted over 24h ago should be scanned, got {result.metrics()}."
+    )
+    assert (result.incomplete_organs, result.created_task_groups, result.created_tasks) == (1, 1, 2), (
+        f"The heart should get one group with a task per missing field, got {result.metrics()}."
+    )
+    group = db_session.query(TaskGroup).one()
+    assert (group.coordination_id, group.organ_id, group.name) == (
+        coordinations["old"],
+        heart.id,
+        EXPLANTATION_FOLLOW_UP_TASK_GROUP_NAME,
+    ), "The follow-up group should be linked to the coordination organ."
+    descriptions = sorted(task.description for task in db_session.query(Task).filter(Task.task_group_id == group.id))
+    assert descriptions == ["Complete NMP used", "Complete On-site coordinators"], (
+        "Filled fields should not produce tasks."
+    )
+
+    again = check_explantation_completeness(db=db_session, now=now)
+    assert (again.incomplete_organs, again.created_tasks) == (1, 0), "A second run should not duplicate follow-ups."
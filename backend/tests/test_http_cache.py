@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import pytest
+from fastapi import Request, Response
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app import http_cache
+from app.models import Code
+from app.routers.codes import list_codes
+from app.routers.reports_router import get_report_metadata
+
+
+def _request(if_none_match: str | None = None) -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "method": "GET", "path": "/api/codes/", "headers": headers, "query_string": b""})
+
+
+def test_reference_endpoints_answer_revalidations_with_304_without_queries(
+    db_session: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Matching ETags should short-circuit to 304 without statements; CODE writes should change the ETag."""
+    # One time bucket for the whole test, so the ETag cannot roll over between requests.
+    monkeypatch.setattr(http_cache, "HTTP_CACHE_VERSION_TTL_SECONDS", 10**12)
+    db_session.add(Code(type="ORGAN", key="HEART", pos=1, name_default="Heart"))
+    db_session.commit()
+
+    first = Response()
+    codes = list_codes(_request(), first, type="ORGAN", db=db_session)
+    etag = first.headers["etag"]
+    assert [code.key for code in codes] == ["HEART"], "The first load should return the codes."
+    assert first.headers["cache-control"] == "private, no-cache", "Clients should revalidate on every use."
+
+    statements: list[str] = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany) -> None:  # noqa: ANN001, ARG001
+        statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        revalidated = list_codes(_request(f'W/{etag}, "other"'), Response(), type="ORGAN", db=db_session)
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+    assert isinstance(revalidated, Response) and revalidated.status_code == 304, "A matching ETag should yield 304."
+    assert revalidated.headers["etag"] == etag and not revalidated.body, "The 304 should repeat the ETag without a body."
+    assert statements == [], f"Revalidation should not touch the database, got {statements}."
+
+    other_type = Response()
+    list_codes(_request(), other_type, type="ROLE", db=db_session)
+    assert other_type.headers["etag"] != etag, "Query parameters should be part of the ETag."
+
+    db_session.add(Code(type="ORGAN", key="LIVER", pos=2, name_default="Liver"))
+    db_session.commit()
+    changed = Response()
+    codes = list_codes(_request(etag), changed, type="ORGAN", db=db_session)
+    assert [code.key for code in codes] == ["HEART", "LIVER"] and changed.headers["etag"] != etag, (
+        "A CODE write should invalidate the previous ETag."
+    )
+
+    metadata = Response()
+    get_report_metadata(_request(), metadata, db=db_session, current_user=None)
+    repeated = get_report_metadata(_request(metadata.headers["etag"]), Response(), db=db_session, current_user=None)
+    assert repeated.status_code == 304, "Report metadata should be revalidated by its content hash."
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.features.information import resolve_information_context_ids
+from app.models import Code
+
+
+def test_context_resolver_reads_codes_from_the_registry(db_session: Session) -> None:
+    """Known codes should resolve without queries, and code edits should reload the registry."""
+    general = Code(type="INFORMATION_AREA", key="GENERAL", pos=1, name_default="General")
+    organ_area = Code(type="INFORMATION_AREA", key="ORGAN", pos=2, name_default="Organ")
+    heart = Code(type="ORGAN", key="HEART", pos=1, name_default="Heart")
+    liver = Code(type="ORGAN", key="LIVER", pos=2, name_default="Liver")
+    status = Code(type="TASK_STATUS", key="PENDING", pos=1, name_default="Pending")
+    db_session.add_all([general, organ_area, heart, liver, status])
+    db_session.commit()
+
+    assert resolve_information_context_ids(db=db_session, context_id=None, context_ids=[]) == [general.id], (
+        "Information without contexts should fall back to the GENERAL area."
+    )
+    organ_area_id, heart_id, liver_id = organ_area.id, heart.id, liver.id
+    statements: list[str] = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany) -> None:  # noqa: ANN001, ARG001
+        statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        resolved = resolve_information_context_ids(
+            db=db_session,
+            context_id=organ_area_id,
+            context_ids=[heart_id, liver_id, heart_id],
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+    assert resolved == [organ_area_id, heart_id, liver_id], "Contexts should keep their order without duplicates."
+    assert statements == [], f"Known codes should resolve from memory, got {statements}."
+
+    with pytest.raises(HTTPException) as exc_info:
+        resolve_information_context_ids(db=db_session, context_id=None, context_ids=[heart.id])
+    assert exc_info.value.detail == "ORGAN contexts are only allowed for INFORMATION_AREA.ORGAN", (
+        "Organ contexts without the ORGAN area should be rejected."
+    )
+    with pytest.raises(HTTPException) as exc_info:
+        resolve_information_context_ids(db=db_session, context_id=None, context_ids=[status.id])
+    assert exc_info.value.status_code == 422, "Codes of other types should be rejected."
+
+    team_area = Code(type="INFORMATION_AREA", key="TEAM", pos=3, name_default="Team")
+    db_session.add(team_area)
+    db_session.commit()
+    assert resolve_information_context_ids(db=db_session, context_id=team_area.id, context_ids=None) == [team_area.id], (
+        "A new area code should be picked up after CODE changed."
+    )
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import datetime as dt
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from app.features.information import count_unread_information, list_information_feed
+from app.models import Information, InformationUser
+
+
+def test_information_feed_pages_filters_in_sql_and_counts_unread(db_session: Session, user_factory) -> None:  # noqa: ANN001
+    """The feed should page newest first, hide future and withdrawn rows and count the user's unread rows."""
+    reader = user_factory(ext_id="UT_INFO_READER")
+    author = user_factory(ext_id="UT_INFO_AUTHOR")
+    today = dt.date.today()
+
+    def _information(text: str, days_ago: int, *, valid_in_days: int = 0, withdrawn: bool = False) -> Information:
+        day = today - dt.timedelta(days=days_ago)
+        return Information(
+            text=text,
+            author_id=author.id,
+            date=day,
+            valid_from=today + dt.timedelta(days=valid_in_days) if valid_in_days else day,
+            withdrawn=withdrawn,
+        )
+
+    rows = [
+        _information("oldest", 5),
+        _information("read", 3),
+        _information("same day A", 1),
+        _information("same day B", 1),
+        _information("future", 0, valid_in_days=3),
+        _information("withdrawn", 0, withdrawn=True),
+    ]
+    db_session.add_all(rows)
+    db_session.flush()
+    db_session.add(InformationUser(information_id=rows[1].id, user_id=reader.id))
+    db_session.commit()
+
+    pages: list[list[str]] = []
+    unread_counts: list[int] = []
+    cursor = None
+    while True:
+        page = list_information_feed(db=db_session, current_user_id=reader.id, cursor=cursor, limit=2)
+        pages.append([item.text for item in page.items])
+        unread_counts.append(page.unread_count)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert pages == [["same day B", "same day A"], ["read", "oldest"]], (
+        f"Pages should be newest first without future or withdrawn rows, got {pages}."
+    )
+    assert unread_counts == [3, 3], "The unread count should cover the whole filtered feed on every page."
+    first_page = list_information_feed(db=db_session, current_user_id=reader.id, limit=10)
+    read_item = next(item for item in first_page.items if item.text == "read")
+    assert read_item.current_user_read_at is not None and read_item.has_reads, "The reader's marker should be returned."
+
+    assert count_unread_information(db=db_session, current_user_id=reader.id) == 5, (
+        "Without filters every row without a marker of the reader should count."
+    )
+    assert count_unread_information(db=db_session, current_user_id=author.id) == 1, (
+        "Authors have implicitly read their own rows unless they are withdrawn."
+    )
+    everything = list_information_feed(
+        db=db_session,
+        current_user_id=reader.id,
+        limit=10,
+        include_future=True,
+        include_withdrawn=True,
+    )
+    withdrawn = next(item for item in everything.items if item.text == "withdrawn")
+    assert len(everything.items) == 6 and not withdrawn.has_reads, "Withdrawn rows without markers have no reads."
+
+    with pytest.raises(HTTPException) as exc_info:
+        list_information_feed(db=db_session, current_user_id=reader.id, cursor="not-a-cursor", limit=2)
+    assert exc_info.value.status_code == 422, "A malformed cursor should be rejected as a validation error."
+
+
+def test_information_feed_shows_rows_valid_from_today(db_session: Session, user_factory) -> None:  # noqa: ANN001
+    """A row becomes visible and unread on its valid_from day, with feed and unread count on one `today`."""
+    reader = user_factory(ext_id="UT_INFO_TODAY_READER")
+    author = user_factory(ext_id="UT_INFO_TODAY_AUTHOR")
+    today = dt.date.today()
+    db_session.add(Information(text="starts today", author_id=author.id, date=today, valid_from=today, withdrawn=False))
+    db_session.commit()
+
+    page = list_information_feed(db=db_session, current_user_id=reader.id, limit=10)
+    assert [item.text for item in page.items] == ["starts today"], "A row valid from today should be in the feed."
+    assert page.unread_count == 1, "A row valid from today should count as unread."
+
+    yesterday = list_information_feed(
+        db=db_session, current_user_id=reader.id, limit=10, today=today - dt.timedelta(days=1)
+    )
+    assert yesterday.items == [] and yesterday.unread_count == 0, (
+        "Feed and unread count should both hide the row on the day before it becomes valid."
+    )
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from datetime import date
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.features.medical_values import instantiate_templates_for_patient, instantiate_templates_for_patients
+from app.models import (
+    Code,
+    Episode,
+    MedicalValue,
+    MedicalValueGroup,
+    MedicalValueGroupContextTemplate,
+    MedicalValueGroupTemplate,
+    MedicalValueTemplate,
+    MedicalValueTemplateContextTemplate,
+    Patient,
+)
+
+
+def _seed_catalog(db_session: Session) -> tuple[Code, MedicalValueTemplate, MedicalValueTemplate]:
+    datatype = Code(type="DATATYPE", key="TEXT", pos=1, name_default="Text")
+    liver = Code(type="ORGAN", key="LIVER", pos=1, name_default="Liver")
+    static_group = MedicalValueGroupTemplate(key="STATIC_PATIENT", name_default="Static", pos=1)
+    organ_group = MedicalValueGroupTemplate(key="ORGAN_WORKUP", name_default="Organ work-up", pos=2)
+    db_session.add_all([datatype, liver, static_group, organ_group])
+    db_session.flush()
+    static_template = MedicalValueTemplate(
+        lab_key="UT_STATIC", kis_key="UT_STATIC", datatype_id=datatype.id, name_default="Static", pos=1,
+        medical_value_group_id=static_group.id,
+    )
+    liver_template = MedicalValueTemplate(
+        lab_key="UT_LIVER", kis_key="UT_LIVER", datatype_id=datatype.id, name_default="Liver value", pos=2,
+        medical_value_group_id=organ_group.id,
+    )
+    db_session.add_all([static_template, liver_template])
+    db_session.flush()
+    db_session.add_all(
+        [
+            MedicalValueGroupContextTemplate(medical_value_group_id=static_group.id, context_kind="STATIC"),
+            MedicalValueGroupContextTemplate(medical_value_group_id=organ_group.id, context_kind="ORGAN", organ_id=liver.id),
+            MedicalValueGroupContextTemplate(medical_value_group_id=organ_group.id, context_kind="DONOR"),
+            MedicalValueTemplateContextTemplate(medical_value_template_id=static_template.id, context_kind="STATIC"),
+            MedicalValueTemplateContextTemplate(medical_value_template_id=liver_template.id, context_kind="ORGAN", organ_id=liver.id),
+            MedicalValueTemplateContextTemplate(medical_value_template_id=liver_template.id, context_kind="DONOR"),
+        ]
+    )
+    db_session.commit()
+    return liver, static_template, liver_template
+
+
+def test_bulk_instantiation_creates_missing_values_with_batched_inserts(db_session: Session) -> None:
+    """Bulk instantiation should add only missing (patient, template, context) rows, in one insert per table."""
+    liver, static_template, liver_template = _seed_catalog(db_session)
+    recipient = Patient(pid="UT-MV-1", first_name="A", name="Recipient", date_of_birth=date(1980, 1, 1))
+    plain = Patient(pid="UT-MV-2", first_name="B", name="Plain", date_of_birth=date(1980, 1, 1))
+    closed = Patient(pid="UT-MV-3", first_name="C", name="Closed", date_of_birth=date(1980, 1, 1))
+    db_session.add_all([recipient, plain, closed])
+    db_session.flush()
+    db_session.add_all(
+        [
+            Episode(patient_id=recipient.id, organ_id=liver.id, start=date(2026, 1, 1), closed=False),
+            Episode(patient_id=closed.id, organ_id=liver.id, start=date(2026, 1, 1), closed=True),
+        ]
+    )
+    db_session.commit()
+    assert instantiate_templates_for_patient(db_session, plain.id) == {"created_values": 1}, (
+        "Single-patient instantiation should create the static value of a patient without episodes."
+    )
+
+    inserts: list[str] = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany) -> None:  # noqa: ANN001, ARG001
+        if statement.lstrip().upper().startswith("INSERT"):
+            inserts.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        result = instantiate_templates_for_patients(db_session, include_donor_context=True)
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+
+    assert result.created_values_by_patient == {recipient.id: 3, plain.id: 1, closed.id: 2}, (
+        f"Each patient should get exactly its missing template contexts, got {result.created_values_by_patient}."
+    )
+    assert (result.patients, result.created_values) == (3, 6), "Totals should cover all patients and created values."
+    assert len(inserts) == 2, f"Groups and values should be written with one insert statement each, got {len(inserts)}."
+    keys = {
+        (row.patient_id, row.medical_value_template_id, row.context_key)
+        for row in db_session.query(MedicalValue).filter(MedicalValue.patient_id == recipient.id)
+    }
+    assert keys == {
+        (recipient.id, static_template.id, "STATIC"),
+        (recipient.id, liver_template.id, "STATIC"),
+        (recipient.id, liver_template.id, "DONOR"),
+    }, "An open liver episode should add the organ template in the recipient and donor contexts."
+    orphaned = (
+        db_session.query(MedicalValue)
+        .outerjoin(MedicalValueGroup, MedicalValueGroup.id == MedicalValue.medical_value_group_instance_id)
+        .filter(MedicalValueGroup.id.is_(None))
+        .count()
+    )
+    assert orphaned == 0, "Every created value should point at a group instance of its patient and context."
+    assert instantiate_templates_for_patients(db_session, include_donor_context=True).created_values == 0, (
+        "A second run should find nothing missing."
+    )
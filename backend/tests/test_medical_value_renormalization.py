@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import json
+from datetime import date
+
+from sqlalchemy.orm import Session
+
+from app.features.medical_values import create_medical_value_for_patient, renormalize_medical_values
+from app.features.scheduler import trigger_scheduled_job
+from app.models import Code, DatatypeDefinition, MedicalValue, MedicalValueGroupTemplate, MedicalValueRenormalizationState, Patient
+from app.schemas import MedicalValueCreate
+
+
+def _partial_last_id(db_session: Session, count: int) -> int:
+    return [row_id for (row_id,) in db_session.query(MedicalValue.id).order_by(MedicalValue.id).limit(count)][-1]
+
+
+def test_renormalization_resumes_from_checkpoint_after_rule_change(db_session: Session, user_factory) -> None:  # noqa: ANN001
+    """Changing a datatype precision should re-normalize its stored values in resumable batches."""
+    actor = user_factory(ext_id="MV_RENORM_ACTOR")
+    datatype_code = Code(type="DATATYPE", key="KG", pos=1, name_default="Kilogram")
+    group = MedicalValueGroupTemplate(key="USER_CAPTURED", name_default="User Captured", pos=1)
+    patient = Patient(pid="MVR-001", first_name="Renorm", name="Patient", date_of_birth=date(1990, 1, 1))
+    db_session.add_all([datatype_code, group, patient])
+    db_session.flush()
+    datatype_def = DatatypeDefinition(
+        code_id=datatype_code.id,
+        primitive_kind="number",
+        unit="kg",
+        canonical_unit_ucum="kg",
+        allowed_units_ucum_json='["kg","g"]',
+        conversion_group="mass",
+        precision=3,
+    )
+    db_session.add(datatype_def)
+    db_session.commit()
+    for name, raw, unit in (("Weight A", "2567", "g"), ("Weight B", "1.234", "kg"), ("Weight C", "80.05", "kg")):
+        create_medical_value_for_patient(
+            patient_id=patient.id,
+            payload=MedicalValueCreate(datatype_id=datatype_code.id, medical_value_group_id=group.id, name=name, value_input=raw, unit_input_ucum=unit),
+            changed_by_id=actor.id,
+            db=db_session,
+        )
+
+    baseline = renormalize_medical_values(db=db_session)
+    assert (baseline.definitions_pending, baseline.rows_scanned) == (0, 0), (
+        "A datatype seen for the first time should be taken as already normalized."
+    )
+
+    datatype_def.precision = 1
+    db_session.commit()
+    partial = renormalize_medical_values(db=db_session, batch_size=2, max_rows=2)
+    state = db_session.query(MedicalValueRenormalizationState).one()
+    assert (partial.rows_scanned, partial.rows_updated, state.status) == (2, 2, "PENDING"), (
+        "The run budget should stop the pass early and leave it pending."
+    )
+    assert state.last_medical_value_id == _partial_last_id(db_session, 2), "The checkpoint should point at the last written row."
+
+    run = trigger_scheduled_job(job_key="medical_values.renormalization", changed_by_id=actor.id, db=db_session)
+    metrics = json.loads(run.metrics_json)
+    assert run.status == "SUCCESS" and (metrics["rows_scanned"], metrics["definitions_completed"]) == (1, 1), (
+        f"The scheduler job should resume after the checkpoint and complete the pass, got {metrics}."
+    )
+    db_session.expire_all()
+    canonical = [row.value_canonical for row in db_session.query(MedicalValue).order_by(MedicalValue.id)]
+    assert canonical == ["2.6", "1.2", "80.1"], f"All values should use the new precision, got {canonical}."
+    assert db_session.query(MedicalValueRenormalizationState).one().status == "DONE", "The pass should be completed."
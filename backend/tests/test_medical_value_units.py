@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import date
 
+import pytest
+from sqlalchemy import event, text
 from sqlalchemy.orm import Session
 
+from app.features.medical_values import MedicalValueNormalizationInput, normalize_many
+from app.features.medical_values import normalization
 from app.features.medical_values.normalization import normalize_medical_value
 from app.features.medical_values.service import create_medical_value_for_patient, update_medical_value_for_patient
 from app.models import Code, DatatypeDefinition, MedicalValueGroupTemplate, Patient
@@ -111,3 +116,84 @@ def test_normalize_dimensionless_numeric_value_with_ucum_one() -> None:
     assert normalized.normalization_status == "NORMALIZED", (
         "Dimensionless normalization should still report successful normalization status."
     )
+
+
+def test_normalize_many_reuses_compiled_rules_until_datatype_changes(db_session: Session) -> None:
+    """Compiled rules should be reused across batches and recompiled after a datatype definition is edited."""
+    datatype_code = Code(type="DATATYPE", key="KG", pos=1, name_default="Kilogram")
+    db_session.add(datatype_code)
+    db_session.flush()
+    datatype_def = DatatypeDefinition(
+        code_id=datatype_code.id,
+        primitive_kind="number",
+        unit="kg",
+        canonical_unit_ucum="kg",
+        allowed_units_ucum_json='["kg","g"]',
+        conversion_group="mass",
+        precision=1,
+    )
+    db_session.add(datatype_def)
+    db_session.commit()
+    items = [
+        MedicalValueNormalizationInput(raw_value="2560", unit_input_ucum="g", datatype_id=datatype_code.id),
+        MedicalValueNormalizationInput(raw_value="70", unit_input_ucum="cm", datatype_id=datatype_code.id),
+        MedicalValueNormalizationInput(raw_value="abc", datatype_id=datatype_code.id),
+    ]
+
+    first = normalize_many(items, db=db_session)
+    assert [row.value_canonical for row in first] == ["2.6", "", ""], "Grams should convert to kilograms at precision 1."
+    assert [row.normalization_status for row in first] == ["NORMALIZED", "ERROR", "ERROR"], (
+        "Invalid rows should be flagged instead of aborting the batch."
+    )
+    assert "not allowed" in first[1].normalization_error, "The rejection reason should be kept on the row."
+
+    statements: list[str] = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany) -> None:  # noqa: ANN001, ARG001
+        statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        normalize_many(items, db=db_session)
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+    assert statements == [], "A warm rule registry should normalize without querying datatype definitions."
+
+    datatype_def.precision = 3
+    db_session.commit()
+    [converted, *_] = normalize_many(items, db=db_session)
+    assert converted.value_canonical == "2.56", "Editing the datatype definition should invalidate its compiled rule."
+
+
+def test_rule_registry_recompiles_datatype_edited_by_raw_sql(db_session: Session, monkeypatch: pytest.MonkeyPatch) -> None:
+    """After the TTL, a definition changed by direct SQL (no ROW_VERSION bump) should be recompiled."""
+    datatype_code = Code(type="DATATYPE", key="KG", pos=1, name_default="Kilogram")
+    db_session.add(datatype_code)
+    db_session.flush()
+    db_session.add(
+        DatatypeDefinition(
+            code_id=datatype_code.id,
+            primitive_kind="number",
+            unit="kg",
+            canonical_unit_ucum="kg",
+            allowed_units_ucum_json='["kg","g"]',
+            conversion_group="mass",
+            precision=1,
+        )
+    )
+    db_session.commit()
+    items = [MedicalValueNormalizationInput(raw_value="2560", unit_input_ucum="g", datatype_id=datatype_code.id)]
+    assert normalize_many(items, db=db_session)[0].value_canonical == "2.6", "The initial rule should use precision 1."
+
+    db_session.execute(
+        text('UPDATE "MEDICAL_VALUE_DATATYPE" SET "PRECISION" = 3 WHERE "CODE_ID" = :code_id'),
+        {"code_id": datatype_code.id},
+    )
+    db_session.commit()
+    registry = normalization.NORMALIZATION_RULES
+    monkeypatch.setattr(registry, "_snapshot", replace(registry._snapshot, expires_at=0.0))
+
+    assert normalize_many(items, db=db_session)[0].value_canonical == "2.56", (
+        "The TTL reload should recompile a rule whose columns changed without a ROW_VERSION bump."
+    )
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from datetime import date
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.database import Base
+from app.db_schema import SchemaRuntime, backfill_patient_list_projection
+from app.features.patients import count_patients_missing_list_projection, list_patients, rebuild_patient_list_projection
+from app.models import Code, ContactInfo, Episode, EpisodeOrgan, Patient, PatientListProjection
+
+
+def _seed(db_session: Session) -> tuple[Patient, dict[str, Code]]:
+    codes = {
+        "LIVER": Code(type="ORGAN", key="LIVER", pos=1, name_default="Liver"),
+        "KIDNEY": Code(type="ORGAN", key="KIDNEY", pos=2, name_default="Kidney"),
+        "PHONE": Code(type="CONTACT_INFO_TYPE", key="PHONE", pos=1, name_default="Phone"),
+    }
+    patient = Patient(pid="UT-PL-001", first_name="List", name="Patient", date_of_birth=date(1980, 1, 1))
+    db_session.add_all([*codes.values(), patient])
+    db_session.commit()
+    return patient, codes
+
+
+def test_projection_follows_episode_and_contact_changes(db_session: Session) -> None:
+    """Patient list aggregates should be refreshed on commit of related episode, organ and contact rows."""
+    patient, codes = _seed(db_session)
+    episode = Episode(patient_id=patient.id, organ_id=codes["LIVER"].id, start=date(2026, 1, 1))
+    db_session.add_all(
+        [
+            episode,
+            ContactInfo(patient_id=patient.id, type_id=codes["PHONE"].id, data="+41 00 000 00 00"),
+        ]
+    )
+    db_session.commit()
+
+    [row] = list_patients(skip=0, limit=10, db=db_session)
+    assert (row.contact_info_count, row.open_episode_count, row.open_episode_indicators) == (1, 1, ["Li"]), (
+        "A new open liver episode and a contact row should be reflected in the list aggregates."
+    )
+
+    db_session.add(EpisodeOrgan(episode_id=episode.id, organ_id=codes["KIDNEY"].id))
+    db_session.commit()
+    [row] = list_patients(skip=0, limit=10, db=db_session)
+    assert row.open_episode_organ_ids == [codes["KIDNEY"].id], (
+        "Adding an active organ link should replace the legacy single organ in the aggregates."
+    )
+
+    episode.closed = True
+    db_session.commit()
+    [row] = list_patients(skip=0, limit=10, db=db_session)
+    assert (row.open_episode_count, row.open_episode_organ_ids, row.episode_organ_ids) == (0, [], [codes["KIDNEY"].id]), (
+        "Closing the episode should remove it from the open-episode aggregates only."
+    )
+
+    db_session.delete(patient)
+    db_session.commit()
+    assert db_session.query(PatientListProjection).count() == 0, "Deleting the patient should drop its projection row."
+
+
+def test_list_patients_reads_projection_in_one_statement(db_session: Session) -> None:
+    """The patient overview should be served by a single query over patients and their projection rows."""
+    patient, codes = _seed(db_session)
+    db_session.add(Episode(patient_id=patient.id, organ_id=codes["LIVER"].id, start=date(2026, 1, 1)))
+    db_session.commit()
+    db_session.query(PatientListProjection).delete()
+    db_session.commit()
+    assert rebuild_patient_list_projection(db=db_session) == 1, "Rebuild should write one row per patient."
+    db_session.expire_all()
+    statements: list[str] = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany) -> None:  # noqa: ANN001, ARG001
+        statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        rows = list_patients(skip=0, limit=10, db=db_session)
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+
+    assert [row.open_episode_indicators for row in rows] == [["Li"]], "Rebuilt rows should carry the episode indicators."
+    assert len(statements) == 1, f"Listing patients should take one statement, got {len(statements)}."
+
+
+def test_schema_migrate_backfills_a_missing_projection(db_session: Session) -> None:
+    """Migrate should rebuild projection rows missing after an upgrade, and leave a complete table alone."""
+    patient, codes = _seed(db_session)
+    db_session.add(ContactInfo(patient_id=patient.id, type_id=codes["PHONE"].id, data="+41 00 000 00 00"))
+    db_session.commit()
+    db_session.query(PatientListProjection).delete()
+    db_session.commit()
+    runtime = SchemaRuntime(engine=db_session.get_bind(), base=Base)
+
+    assert count_patients_missing_list_projection(db=db_session) == 1, "The emptied projection should be detected."
+    assert backfill_patient_list_projection(runtime) == 1, "Migrate should rebuild the projection for the patient."
+    db_session.expire_all()
+    [row] = list_patients(skip=0, limit=10, db=db_session)
+    assert row.contact_info_count == 1, "The rebuilt projection should carry the patient's aggregates."
+    assert backfill_patient_list_projection(runtime) is None, "A complete projection should not be rebuilt again."
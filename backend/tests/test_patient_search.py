@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.features.patients import search_patients
+from app.models import Code, Episode, EpisodeOrgan, Patient
+
+
+def _patient(pid: str, name: str, first_name: str, **kwargs) -> Patient:  # noqa: ANN003
+    return Patient(pid=pid, name=name, first_name=first_name, date_of_birth=date(1980, 1, 1), **kwargs)
+
+
+def test_patient_search_pages_with_keyset_cursor_in_name_order(db_session: Session) -> None:
+    """Following `next_cursor` should walk all patients in name order, one bounded statement per page."""
+    db_session.add_all(
+        [
+            _patient("P-5", "Zeller", "Anna"),
+            _patient("P-1", "Meier", "Bruno"),
+            _patient("P-3", "Meier", "Anna"),
+            _patient("P-4", "Amrein", "Carla"),
+            _patient("P-2", "Meier", "Anna"),
+        ]
+    )
+    db_session.commit()
+    statements: list[str] = []
+    captured: list[object] = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany) -> None:  # noqa: ANN001, ARG001
+        statements.append(statement)
+        captured.append(parameters)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", _capture)
+    pages: list[list[str]] = []
+    cursor = None
+    try:
+        while True:
+            page = search_patients(cursor=cursor, limit=2, db=db_session)
+            pages.append([row.pid for row in page.items])
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+
+    assert pages == [["P-4", "P-3"], ["P-2", "P-1"], ["P-5"]], (
+        f"Pages should follow name, first name and id order without gaps or repeats, got {pages}."
+    )
+    assert len(statements) == len(pages), "Each page should be served by a single statement."
+    with engine.connect() as conn:
+        plan = " ".join(
+            str(row[-1]) for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statements[-1]}", captured[-1]).all()
+        )
+    assert "ix_patient_name_first_name" in plan, f"Continuation pages should seek in the name index, got plan {plan!r}."
+
+    with pytest.raises(HTTPException) as exc_info:
+        search_patients(cursor="not-a-cursor", limit=2, db=db_session)
+    assert exc_info.value.status_code == 422, "A malformed cursor should be rejected as a validation error."
+
+
+def test_patient_search_filters_by_prefix_organ_open_episode_and_coordinator(db_session: Session, user_factory) -> None:  # noqa: ANN001
+    """Search terms, organ, open-episode state and coordinator should narrow the page on the server."""
+    coordinator = user_factory(ext_id="UT_SEARCH_COORD")
+    liver = Code(type="ORGAN", key="LIVER", pos=1, name_default="Liver")
+    kidney = Code(type="ORGAN", key="KIDNEY", pos=2, name_default="Kidney")
+    muller = _patient("UT-100", "Müller", "Hans", resp_coord_id=coordinator.id)
+    huber = _patient("UT-200", "Huber", "Hanna")
+    keller = _patient("XY-300", "Keller", "Urs")
+    db_session.add_all([liver, kidney, muller, huber, keller])
+    db_session.commit()
+    open_liver = Episode(patient_id=muller.id, organ_id=liver.id, start=date(2026, 1, 1))
+    relinked = Episode(patient_id=huber.id, organ_id=liver.id, start=date(2026, 1, 1), closed=True)
+    db_session.add_all([open_liver, relinked, Episode(patient_id=keller.id, organ_id=kidney.id, start=date(2026, 1, 1))])
+    db_session.commit()
+    db_session.add(EpisodeOrgan(episode_id=relinked.id, organ_id=kidney.id))
+    db_session.commit()
+
+    def _pids(**filters) -> list[str]:  # noqa: ANN003
+        return [row.pid for row in search_patients(limit=50, db=db_session, **filters).items]
+
+    assert _pids(q="han") == ["UT-200", "UT-100"], "A term should prefix-match first names case-insensitively."
+    assert _pids(q="ut hu") == ["UT-200"], "All terms should match, each on PID, name or first name."
+    assert _pids(q="ut%") == [], "LIKE wildcards in the search term should be matched literally."
+    assert _pids(organ_id=liver.id) == ["UT-100"], "Active organ links should replace the legacy organ of an episode."
+    assert _pids(organ_id=kidney.id) == ["UT-200", "XY-300"], "Organ filtering should include closed episodes by default."
+    assert _pids(organ_id=kidney.id, has_open_episode=True) == ["XY-300"], (
+        "With the open-episode filter, the organ should be matched on open episodes only."
+    )
+    assert _pids(has_open_episode=False) == ["UT-200"], "Patients without open episodes should be selectable."
+    assert _pids(resp_coord_id=coordinator.id) == ["UT-100"], "The responsible coordinator filter should apply."
+    [row] = search_patients(q="UT-100", limit=50, db=db_session).items
+    assert row.open_episode_organ_ids == [liver.id], "Page rows should carry the patient list projection aggregates."
+
+
+def test_patient_search_terms_seek_in_nocase_indexes(db_session: Session) -> None:
+    """A `q` term should be answered by index range searches instead of scanning every patient."""
+    db_session.add_all([_patient(f"P-{index:03d}", f"Name{index:03d}", f"First{index:03d}") for index in range(50)])
+    db_session.add(_patient("UT-MIX", "muster", "Mia"))
+    db_session.commit()
+    statements: list[tuple[str, object]] = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany) -> None:  # noqa: ANN001, ARG001
+        statements.append((statement, parameters))
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        page = search_patients(q="MUS", limit=10, db=db_session)
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+
+    assert [row.pid for row in page.items] == ["UT-MIX"], "The term should prefix-match the name case-insensitively."
+    [(statement, parameters)] = statements
+    with engine.connect() as conn:
+        plan = [str(row[-1]) for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()]
+    patient_steps = [step for step in plan if " PATIENT " in f" {step} "]
+    assert patient_steps and not any(step.startswith("SCAN PATIENT") for step in patient_steps), (
+        f"The search should not scan PATIENT, got plan {plan!r}."
+    )
+    for index_name in ("ix_patient_pid_nocase", "ix_patient_name_nocase", "ix_patient_first_name_nocase"):
+        assert any(step.startswith(f"SEARCH PATIENT USING INDEX {index_name}") for step in plan), (
+            f"Each searched column should seek in {index_name}, got plan {plan!r}."
+        )
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.features.coordination_procurement_flex import get_procurement_flex
+from app.models import (
+    Code,
+    Coordination,
+    CoordinationProcurementFieldTemplate,
+    CoordinationProcurementOrganRejection,
+    CoordinationProcurementTypedData,
+    CoordinationProcurementTypedDataPersonList,
+    CoordinationProtocolEventLog,
+    DatatypeDefinition,
+    Person,
+)
+
+
+def test_procurement_flex_loads_a_coordination_in_few_round_trips(db_session: Session) -> None:
+    """Templates should come from the catalog and the coordination from a fixed number of queries."""
+    heart = Code(type="ORGAN", key="HEART", pos=1, name_default="Heart")
+    liver = Code(type="ORGAN", key="LIVER", pos=2, name_default="Liver")
+    open_status = Code(type="COORDINATION_STATUS", key="OPEN", pos=1, name_default="Open")
+    datatype_code = Code(type="DATATYPE", key="TEXT", pos=1, name_default="Text")
+    db_session.add_all([heart, liver, open_status, datatype_code])
+    db_session.flush()
+    datatype = DatatypeDefinition(code_id=datatype_code.id, primitive_kind="text")
+    db_session.add(datatype)
+    db_session.flush()
+    db_session.add_all(
+        [
+            CoordinationProcurementFieldTemplate(key="NMP_USED", name_default="NMP used", datatype_def_id=datatype.id, pos=1),
+            CoordinationProcurementFieldTemplate(
+                key="ON_SITE_COORDINATORS", name_default="On-site coordinators", datatype_def_id=datatype.id, pos=2
+            ),
+        ]
+    )
+    coordination = Coordination(status_id=open_status.id, status_key="OPEN")
+    people = [Person(first_name=f"Coordinator {index}", surname="Test") for index in range(4)]
+    db_session.add_all([coordination, *people])
+    db_session.flush()
+    row = CoordinationProcurementTypedData(coordination_id=coordination.id, organ_id=heart.id, slot_key="MAIN", nmp_used=True)
+    db_session.add(row)
+    db_session.flush()
+    db_session.add_all(
+        [
+            *(
+                CoordinationProcurementTypedDataPersonList(
+                    data_id=row.id, list_key="ON_SITE_COORDINATORS", person_id=person.id, pos=index
+                )
+                for index, person in enumerate(people)
+            ),
+            CoordinationProcurementOrganRejection(coordination_id=coordination.id, organ_id=liver.id, is_rejected=True),
+            CoordinationProtocolEventLog(
+                coordination_id=coordination.id,
+                organ_id=liver.id,
+                event="Organ workflow cleared after rejection",
+            ),
+        ]
+    )
+    db_session.commit()
+    coordination_id = coordination.id
+
+    get_procurement_flex(coordination_id=coordination_id, db=db_session)
+    db_session.expire_all()
+    statements: list[str] = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany) -> None:  # noqa: ANN001, ARG001
+        statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        response = get_procurement_flex(coordination_id=coordination_id, db=db_session)
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+
+    assert len(statements) == 5, f"Procurement, typed rows, both lists and rejections should be 5 queries, got {statements}."
+    assert [template.key for template in response.field_templates] == ["NMP_USED", "ON_SITE_COORDINATORS"], (
+        "Field templates should be served from the catalog in position order."
+    )
+    heart_organ, liver_organ = response.organs
+    values = {value.field_template.key: value for value in heart_organ.slots[0].values}
+    assert values["NMP_USED"].value == "true" and len(values["ON_SITE_COORDINATORS"].persons) == 4, (
+        f"Slot values should be built from the typed row and its person list, got {values}."
+    )
+    assert liver_organ.organ_rejected and liver_organ.organ_workflow_cleared, (
+        "The cleared-workflow marker should be resolved together with the rejection."
+    )
+
+    db_session.add(
+        CoordinationProcurementFieldTemplate(key="NMP_TYPE", name_default="NMP type", datatype_def_id=datatype.id, pos=3)
+    )
+    db_session.commit()
+    response = get_procurement_flex(coordination_id=coordination_id, db=db_session)
+    assert [template.key for template in response.field_templates][-1] == "NMP_TYPE", (
+        "A template write should rebuild the catalog."
+    )
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import anyio
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.main import record_query_metrics
+from app.query_metrics import ROUTE_QUERY_METRICS, register_query_metrics_hooks
+
+
+def _request(method: str, route_path: str) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": method,
+            "path": "/api/patients/1",
+            "headers": [],
+            "route": SimpleNamespace(path=route_path),
+        }
+    )
+
+
+def test_query_metrics_middleware_counts_statements_per_request_and_route(db_session: Session) -> None:
+    """Statements from threadpool handlers should be counted in headers and aggregated by route template."""
+    register_query_metrics_hooks()
+    ROUTE_QUERY_METRICS.clear()
+
+    def _handler_queries(count: int) -> None:
+        for _ in range(count):
+            db_session.execute(text("SELECT 1"))
+
+    async def _run(count: int) -> Response:
+        async def _call_next(_: Request) -> Response:
+            await anyio.to_thread.run_sync(_handler_queries, count)
+            return Response("ok")
+
+        return await record_query_metrics(_request("GET", "/api/patients/{patient_id}"), _call_next)
+
+    first = asyncio.run(_run(3))
+    second = asyncio.run(_run(1))
+    db_session.execute(text("SELECT 1"))  # outside any request: must not be attributed
+
+    assert first.headers["X-DB-Query-Count"] == "3" and second.headers["X-DB-Query-Count"] == "1", (
+        "Each response should report the number of statements issued while handling it."
+    )
+    assert first.headers["Server-Timing"].startswith("db;dur=") and 'desc="3 queries"' in first.headers["Server-Timing"], (
+        "The Server-Timing header should carry DB time and statement count."
+    )
+    routes = {row["route"]: row for row in ROUTE_QUERY_METRICS.snapshot()}
+    stats = routes["GET /api/patients/{patient_id}"]
+    assert (stats["requests"], stats["statements"], stats["max_statements"]) == (2, 4, 3), (
+        f"Route aggregates should sum requests and statements by route template, got {stats}."
+    )
+    assert stats["slowest_statements"] and stats["slowest_statements"][0]["statement"] == "SELECT 1", (
+        "The slowest statements of the route should be retained."
+    )
+    ROUTE_QUERY_METRICS.clear()
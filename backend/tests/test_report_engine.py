@@ -0,0 +1,494 @@
+from __future__ import annotations
+
+import json
+from dataclasses import replace
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.features.reports.aggregation import execute_report_aggregation
+from app.features.reports.engine import active_field_map, apply_sort, execute_report_request, filter_rows, split_filters
+from app.features.reports.service import REPORT_CACHE, execute_report, export_report
+from app.features.reports.sources.medical_value import build_medical_value_source
+from app.features.reports.sources.patient import build_patient_source
+from app.features.reports.types import FieldDef
+from app.models import MedicalValue, Patient
+from app.schemas import (
+    ReportAggregateInput,
+    ReportExecuteRequest,
+    ReportExportRequest,
+    ReportFilterInput,
+    ReportSortInput,
+)
+
+
+def _seed_patients(db_session: Session) -> None:
+    db_session.add_all(
+        [
+            Patient(pid="P-001", first_name="Anna", name="Muster", date_of_birth=date(1980, 1, 1), lang="de"),
+            Patient(pid="P-002", first_name="Bruno", name="Beispiel", date_of_birth=date(1975, 6, 1), lang="fr"),
+            Patient(pid="P-003", first_name="Clara", name="Muster", date_of_birth=date(1990, 3, 1), lang="de"),
+            Patient(pid="P-004", first_name="Dora", name="Test_Muster", date_of_birth=date(1960, 9, 1), lang="it"),
+        ]
+    )
+    db_session.commit()
+
+
+def _run(db_session: Session, payload: ReportExecuteRequest) -> list[dict[str, str]]:
+    source = build_patient_source()
+    field_map = active_field_map(source, payload.joins)
+    return execute_report_request(payload, source, field_map, db_session).rows
+
+
+def test_report_filters_sort_and_limit_compile_into_sql(db_session: Session) -> None:
+    """Column-backed filters, sort keys and the limit should be applied by the database."""
+    _seed_patients(db_session)
+    statements: list[str] = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany) -> None:  # noqa: ANN001, ARG001
+        statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        rows = _run(
+            db_session,
+            ReportExecuteRequest(
+                source="PATIENT",
+                select=["pid", "first_name"],
+                filters=[
+                    ReportFilterInput(field="name", operator="contains", value="MUSTER"),
+                    ReportFilterInput(field="date_of_birth", operator="gte", value="1970-01-01"),
+                ],
+                sort=[ReportSortInput(field="date_of_birth", direction="desc")],
+                limit=1,
+            ),
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+
+    assert rows == [{"pid": "P-003", "first_name": "Clara"}], (
+        "The youngest matching 'Muster' patient should be returned when sorting by birth date descending with limit 1."
+    )
+    patient_selects = [sql for sql in statements if 'FROM "PATIENT"' in sql]
+    assert patient_selects and all("WHERE" in sql and "ORDER BY" in sql and "LIMIT" in sql for sql in patient_selects), (
+        "Filters, sort and limit on column-backed fields should be compiled into the SQL statement."
+    )
+
+
+def test_report_contains_filter_escapes_like_wildcards(db_session: Session) -> None:
+    """SQL `contains` push-down should treat '_' and '%' literally like the Python matcher."""
+    _seed_patients(db_session)
+
+    rows = _run(
+        db_session,
+        ReportExecuteRequest(
+            source="PATIENT",
+            select=["pid"],
+            filters=[ReportFilterInput(field="name", operator="contains", value="t_m")],
+        ),
+    )
+
+    assert rows == [{"pid": "P-004"}], "Only the name containing a literal underscore should match 't_m'."
+
+
+def test_report_sql_push_down_matches_python_getter_semantics(db_session: Session) -> None:
+    """Pushed-down and getter-only evaluation should return identical rows for the same request."""
+    _seed_patients(db_session)
+    sql_source = build_patient_source()
+    python_source = replace(sql_source, fields=tuple(replace(field, column=None) for field in sql_source.fields))
+    payload = ReportExecuteRequest(
+        source="PATIENT",
+        select=["pid", "name"],
+        filters=[
+            ReportFilterInput(field="lang", operator="eq", value=" DE "),
+            ReportFilterInput(field="date_of_birth", operator="lte", value="1990-03-01"),
+        ],
+        sort=[ReportSortInput(field="name"), ReportSortInput(field="first_name", direction="desc")],
+    )
+
+    sql_rows = execute_report_request(payload, sql_source, active_field_map(sql_source, []), db_session).rows
+    python_rows = execute_report_request(payload, python_source, active_field_map(python_source, []), db_session).rows
+
+    assert sql_rows == [{"pid": "P-003", "name": "Muster"}, {"pid": "P-001", "name": "Muster"}], (
+        "String equality should ignore case/whitespace and multi-key sort should order ties by the second key."
+    )
+    assert sql_rows == python_rows, "SQL push-down must not change report results compared to getter-based evaluation."
+
+
+def test_report_datetime_filters_match_server_defaulted_timestamps(db_session: Session) -> None:
+    """`eq`/`gte` on CURRENT_TIMESTAMP columns should match the exact second like the getter predicate."""
+    _seed_patients(db_session)
+    sql_source = build_patient_source()
+    sql_source = replace(
+        sql_source,
+        fields=tuple(
+            replace(field, operators=("eq", "gte", "lte")) if field.key == "created_at" else field
+            for field in sql_source.fields
+        ),
+    )
+    python_source = replace(sql_source, fields=tuple(replace(field, column=None) for field in sql_source.fields))
+    created_at = db_session.query(Patient.created_at).order_by(Patient.id).first()[0]
+    assert created_at.microsecond == 0, "The server default should store whole seconds."
+
+    for operator in ("eq", "gte", "lte"):
+        payload = ReportExecuteRequest(
+            source="PATIENT",
+            select=["pid"],
+            filters=[ReportFilterInput(field="created_at", operator=operator, value=created_at.isoformat())],
+            sort=[ReportSortInput(field="pid")],
+        )
+        sql_rows = execute_report_request(payload, sql_source, active_field_map(sql_source, []), db_session).rows
+        python_rows = execute_report_request(payload, python_source, active_field_map(python_source, []), db_session).rows
+        assert sql_rows and sql_rows == python_rows, f"'{operator}' on the stored second should match like the getter path."
+
+
+def test_report_string_filters_fold_non_ascii_case_like_python(db_session: Session) -> None:
+    """Needles with umlauts should match case-insensitively, as SQLite lower() only folds ASCII."""
+    db_session.add_all(
+        [
+            Patient(pid="P-101", first_name="Jörg", name="MÜLLER", date_of_birth=date(1970, 1, 1)),
+            Patient(pid="P-102", first_name="Anna", name="Mueller", date_of_birth=date(1971, 1, 1)),
+        ]
+    )
+    db_session.commit()
+
+    for operator, value in (("eq", "müller"), ("contains", "ül")):
+        rows = _run(
+            db_session,
+            ReportExecuteRequest(
+                source="PATIENT",
+                select=["pid"],
+                filters=[ReportFilterInput(field="name", operator=operator, value=value)],
+            ),
+        )
+        assert rows == [{"pid": "P-101"}], f"'{operator}' with '{value}' should match 'MÜLLER' ignoring case."
+
+
+def test_medical_value_patient_join_fields_compile_into_sql(db_session: Session) -> None:
+    """Filters and sort on PATIENT join fields of MEDICAL_VALUE should run in SQL with getter semantics."""
+    _seed_patients(db_session)
+    patients = {patient.pid: patient.id for patient in db_session.query(Patient)}
+    db_session.add_all(
+        [
+            MedicalValue(patient_id=patients[pid], name=f"Value {pid}", value="1")
+            for pid in ("P-001", "P-002", "P-003", "P-004")
+        ]
+    )
+    db_session.commit()
+    sql_source = build_medical_value_source()
+    python_source = replace(
+        sql_source,
+        joins=tuple(replace(join, fields=tuple(replace(field, column=None) for field in join.fields)) for join in sql_source.joins),
+    )
+    payload = ReportExecuteRequest(
+        source="MEDICAL_VALUE",
+        select=["name", "patient_pid"],
+        joins=["PATIENT"],
+        filters=[ReportFilterInput(field="patient_name", operator="contains", value="a MUSTER")],
+        sort=[ReportSortInput(field="patient_pid", direction="desc")],
+        limit=10,
+    )
+    statements: list[str] = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany) -> None:  # noqa: ANN001, ARG001
+        statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        sql_rows = execute_report_request(payload, sql_source, active_field_map(sql_source, payload.joins), db_session).rows
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+    python_rows = execute_report_request(payload, python_source, active_field_map(python_source, payload.joins), db_session).rows
+
+    assert sql_rows == [
+        {"name": "Value P-003", "patient_pid": "P-003"},
+        {"name": "Value P-001", "patient_pid": "P-001"},
+    ], f"Patient name filter and PID sort should select and order the values, got {sql_rows}."
+    assert sql_rows == python_rows, "Patient join columns must yield the same rows as the getters."
+    value_selects = [sql for sql in statements if 'FROM "MEDICAL_VALUE"' in sql]
+    assert value_selects and all("WHERE" in sql and "ORDER BY" in sql for sql in value_selects), (
+        "Patient join fields should be filtered and sorted in the SQL statement."
+    )
+
+
+def test_report_export_streams_all_rows_as_csv(db_session: Session) -> None:
+    """CSV export should stream every matching row beyond the execute cap, with a label header."""
+    _seed_patients(db_session)
+
+    export = export_report(
+        payload=ReportExportRequest(
+            source="PATIENT",
+            select=["pid", "name"],
+            sort=[ReportSortInput(field="pid")],
+            format="csv",
+        )
+    )
+    lines = "".join(export.chunks).splitlines()
+
+    assert export.media_type.startswith("text/csv"), "CSV exports should be served with a text/csv media type."
+    assert lines[0] == "PID,Name", "The CSV header should use the selected field labels."
+    assert lines[1:] == ["P-001,Muster", "P-002,Beispiel", "P-003,Muster", "P-004,Test_Muster"], (
+        "Without an explicit limit the export should contain every row in the requested order."
+    )
+
+
+def test_report_export_ndjson_applies_filters_and_limit(db_session: Session) -> None:
+    """NDJSON export should emit one JSON object per filtered row and honour an explicit limit."""
+    _seed_patients(db_session)
+
+    export = export_report(
+        payload=ReportExportRequest(
+            source="PATIENT",
+            select=["pid"],
+            filters=[ReportFilterInput(field="name", operator="contains", value="muster")],
+            sort=[ReportSortInput(field="pid", direction="desc")],
+            limit=2,
+            format="ndjson",
+        )
+    )
+    records = [json.loads(line) for line in "".join(export.chunks).splitlines()]
+
+    assert records == [{"pid": "P-004"}, {"pid": "P-003"}], (
+        "NDJSON export should stream the first two matching rows in descending PID order."
+    )
+
+
+def test_report_keyset_pages_cover_result_exactly_once(db_session: Session) -> None:
+    """Following next_cursor should visit every row once, in the same order as a single full query."""
+    _seed_patients(db_session)
+    db_session.add(Patient(pid="P-005", first_name="Emil", name="Beispiel", date_of_birth=date(1975, 6, 1)))
+    db_session.commit()
+    base = {
+        "source": "PATIENT",
+        "select": ["pid"],
+        "sort": [ReportSortInput(field="created_at"), ReportSortInput(field="date_of_birth", direction="desc")],
+    }
+
+    full = _run(db_session, ReportExecuteRequest(**base, limit=100))
+    paged: list[dict[str, str]] = []
+    cursor: str | None = None
+    for _ in range(10):
+        source = build_patient_source()
+        response = execute_report_request(
+            ReportExecuteRequest(**base, limit=2, cursor=cursor, include_total=True),
+            source,
+            active_field_map(source, []),
+            db_session,
+        )
+        paged.extend(response.rows)
+        assert response.total_count == 5, "total_count should count the whole filtered result, not the page."
+        cursor = response.next_cursor
+        if cursor is None:
+            break
+
+    assert paged == full, (
+        "Keyset pages must concatenate to the full ordered result, including rows tied on created_at."
+    )
+
+
+def test_report_keyset_pages_through_boolean_sort_keys(db_session: Session) -> None:
+    """Boolean sort keys with ties should page to the end in both directions without losing rows."""
+    _seed_patients(db_session)
+    for patient in db_session.query(Patient):
+        patient.translate = patient.pid in {"P-002", "P-004"}
+    db_session.commit()
+
+    for direction in ("asc", "desc"):
+        base = {"source": "PATIENT", "select": ["pid"], "sort": [ReportSortInput(field="translate", direction=direction)]}
+        full = _run(db_session, ReportExecuteRequest(**base, limit=100))
+        paged: list[dict[str, str]] = []
+        cursor: str | None = None
+        for _ in range(10):
+            source = build_patient_source()
+            response = execute_report_request(
+                ReportExecuteRequest(**base, limit=1, cursor=cursor), source, active_field_map(source, []), db_session
+            )
+            paged.extend(response.rows)
+            cursor = response.next_cursor
+            if cursor is None:
+                break
+
+        assert len(full) == 4 and paged == full, f"Paging by '{direction}' boolean key should return every row once."
+
+
+def test_report_cursor_rejected_for_different_sort(db_session: Session) -> None:
+    """A continuation token must only be accepted for the source and sort it was issued for."""
+    _seed_patients(db_session)
+    source = build_patient_source()
+    field_map = active_field_map(source, [])
+    first = execute_report_request(
+        ReportExecuteRequest(source="PATIENT", select=["pid"], sort=[ReportSortInput(field="pid")], limit=1),
+        source,
+        field_map,
+        db_session,
+    )
+    assert first.next_cursor, "A page smaller than the result should return a continuation token."
+
+    with pytest.raises(HTTPException, match="does not match source and sort"):
+        execute_report_request(
+            ReportExecuteRequest(
+                source="PATIENT",
+                select=["pid"],
+                sort=[ReportSortInput(field="name")],
+                limit=1,
+                cursor=first.next_cursor,
+            ),
+            source,
+            field_map,
+            db_session,
+        )
+
+
+def test_compiled_filters_and_sort_call_each_getter_once_per_row() -> None:
+    """Python-side filtering and sorting should evaluate each field getter once per row."""
+    calls: list[str] = []
+
+    def counting(key: str):
+        def getter(row: SimpleNamespace):
+            calls.append(key)
+            return getattr(row, key)
+
+        return getter
+
+    name_field = FieldDef("name", "Name", "string", ("eq", "contains"), counting("name"))
+    score_field = FieldDef("score", "Score", "number", ("eq", "gte", "lte"), counting("score"))
+    field_map = {"name": name_field, "score": score_field}
+    rows = [
+        SimpleNamespace(name="Alpha", score=3),
+        SimpleNamespace(name="beta", score=None),
+        SimpleNamespace(name="ALPINE", score=1),
+    ]
+
+    _, row_filters = split_filters(field_map, [ReportFilterInput(field="name", operator="contains", value=" AL ")])
+    kept = filter_rows(rows, row_filters)
+    assert [row.name for row in kept] == ["Alpha", "ALPINE"], "Contains should match case-insensitively on the trimmed needle."
+    assert calls.count("name") == len(rows), "The filter getter should run exactly once per row."
+
+    calls.clear()
+    ordered = apply_sort(rows, field_map, [ReportSortInput(field="score", direction="desc")])
+    assert [row.name for row in ordered] == ["beta", "Alpha", "ALPINE"], (
+        "Descending sort should place missing values first, matching the SQL NULLS FIRST ordering."
+    )
+    assert calls.count("score") == len(rows), "Sort keys should be computed once per row, not per comparison."
+
+
+def test_report_aggregation_sql_and_streamed_paths_agree(db_session: Session) -> None:
+    """Group-by aggregates should give identical results in SQL and in the streaming hash fallback."""
+    _seed_patients(db_session)
+    sql_source = build_patient_source()
+    python_source = replace(sql_source, fields=tuple(replace(field, column=None) for field in sql_source.fields))
+    payload = ReportExecuteRequest(
+        source="PATIENT",
+        select=[],
+        group_by=["lang"],
+        aggregates=[
+            ReportAggregateInput(function="count"),
+            ReportAggregateInput(function="min", field="date_of_birth"),
+            ReportAggregateInput(function="count_distinct", field="name"),
+        ],
+        sort=[ReportSortInput(field="count", direction="desc")],
+        filters=[ReportFilterInput(field="date_of_birth", operator="gte", value="1970-01-01")],
+    )
+
+    sql_result = execute_report_aggregation(payload, sql_source, active_field_map(sql_source, []), db_session)
+    python_result = execute_report_aggregation(payload, python_source, active_field_map(python_source, []), db_session)
+
+    assert [column.key for column in sql_result.columns] == ["lang", "count", "min_date_of_birth", "count_distinct_name"], (
+        "Aggregated responses should list group columns first, followed by one column per aggregate."
+    )
+    assert sql_result.rows == [
+        {"lang": "de", "count": "2", "min_date_of_birth": "1980-01-01", "count_distinct_name": "1"},
+        {"lang": "fr", "count": "1", "min_date_of_birth": "1975-06-01", "count_distinct_name": "1"},
+    ], "Groups should be counted per language after filtering and ordered by count descending."
+    assert python_result.rows == sql_result.rows, (
+        "The streaming hash aggregation fallback must match the SQL GROUP BY results."
+    )
+
+
+def test_report_aggregation_rejects_avg_on_non_numeric_field(db_session: Session) -> None:
+    """Average is only meaningful for numeric fields and should be rejected otherwise."""
+    source = build_patient_source()
+    payload = ReportExecuteRequest(
+        source="PATIENT",
+        select=[],
+        aggregates=[ReportAggregateInput(function="avg", field="name")],
+    )
+
+    with pytest.raises(HTTPException, match="requires a numeric field"):
+        execute_report_aggregation(payload, source, active_field_map(source, []), db_session)
+
+
+def test_report_cache_hits_until_source_table_changes(db_session: Session) -> None:
+    """Identical executions should be served from cache until a flush touches a source table."""
+    _seed_patients(db_session)
+    REPORT_CACHE.clear()
+    before = REPORT_CACHE.stats()
+    payload = ReportExecuteRequest(source="PATIENT", select=["pid", "name"], sort=[ReportSortInput(field="pid")], limit=1)
+
+    first = execute_report(payload=payload, db=db_session)
+    second = execute_report(payload=payload, db=db_session)
+    after_repeat = REPORT_CACHE.stats()
+    assert second == first, "A cache hit should return the same report result."
+    assert after_repeat["hits"] - before["hits"] == 1, "The repeated identical request should be a cache hit."
+
+    patient = db_session.query(Patient).filter(Patient.pid == "P-001").one()
+    patient.name = "Renamed"
+    db_session.commit()
+
+    third = execute_report(payload=payload, db=db_session)
+    after_write = REPORT_CACHE.stats()
+    assert third.rows == [{"pid": "P-001", "name": "Renamed"}], (
+        "After a committed change to PATIENT the report must be recomputed from current data."
+    )
+    assert after_write["invalidations"] - after_repeat["invalidations"] == 1, (
+        "The stale entry should be counted as invalidated by the PATIENT data version bump."
+    )
+
+
+def test_report_loads_only_relationships_of_selected_fields(db_session: Session, user_factory) -> None:  # noqa: ANN001
+    """Selected join fields should be eager-loaded in the main query, and unused joins not loaded at all."""
+    _seed_patients(db_session)
+    coordinators = [user_factory(ext_id=f"coord-{index}") for index in range(3)]
+    for patient, coordinator in zip(db_session.query(Patient).order_by(Patient.pid).all(), coordinators):
+        patient.resp_coord_id = coordinator.id
+    db_session.commit()
+    db_session.expire_all()
+    statements: list[str] = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany) -> None:  # noqa: ANN001, ARG001
+        statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        joined_rows = _run(
+            db_session,
+            ReportExecuteRequest(
+                source="PATIENT",
+                select=["pid", "resp_coord_name", "resp_coord_ext_id"],
+                joins=["RESP_COORD"],
+                sort=[ReportSortInput(field="pid", direction="asc")],
+            ),
+        )
+        joined_statements = list(statements)
+        statements.clear()
+        _run(db_session, ReportExecuteRequest(source="PATIENT", select=["pid", "name"]))
+        plain_statements = list(statements)
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+
+    assert [row["resp_coord_ext_id"] for row in joined_rows] == ["coord-0", "coord-1", "coord-2", ""], (
+        "Join fields should render the responsible coordinator of each patient."
+    )
+    assert len(joined_statements) == 1 and 'JOIN "USER"' in joined_statements[0], (
+        "Coordinator fields should be loaded by the report query itself instead of one lazy load per row."
+    )
+    assert len(plain_statements) == 1 and 'JOIN "USER"' not in plain_statements[0], (
+        "A report without coordinator fields should not join the USER table."
+    )
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy.orm import Session
+
+from app.features.scheduler.service import (
+    SCHEDULER_LEASE_SECONDS,
+    claim_due_jobs,
+    claim_job_lease,
+    ensure_registered_jobs,
+    run_due_jobs,
+)
+from app.models import ScheduledJob, ScheduledJobRun
+
+_JOB_KEY = "medical_values.renormalization"
+
+
+def _due_job(db_session: Session) -> ScheduledJob:
+    ensure_registered_jobs(db=db_session)
+    job = db_session.query(ScheduledJob).filter(ScheduledJob.job_key == _JOB_KEY).one()
+    job.is_enabled = True
+    job.next_run_at = datetime.now(UTC) - timedelta(seconds=1)
+    db_session.query(ScheduledJob).filter(ScheduledJob.job_key != _JOB_KEY).update({"is_enabled": False})
+    db_session.commit()
+    return job
+
+
+def test_due_job_lease_is_exclusive_and_recovered_after_expiry(db_session: Session) -> None:
+    """Only one worker should win a due job; an expired lease can be reclaimed and its run closed."""
+    job = _due_job(db_session)
+    row_version = job.row_version
+
+    assert claim_due_jobs(owner="worker-a", db=db_session) == [job.id], "The first worker should lease the due job."
+    assert claim_due_jobs(owner="worker-b", db=db_session) == [], "A held lease should keep other workers away."
+    db_session.refresh(job)
+    assert job.row_version == row_version, "Lease writes should not move ROW_VERSION."
+
+    db_session.add(ScheduledJobRun(job_id=job.id, trigger_type="SCHEDULED", status="RUNNING", started_at=datetime.now(UTC)))
+    db_session.commit()
+    later = datetime.now(UTC) + timedelta(seconds=SCHEDULER_LEASE_SECONDS + 1)
+    assert claim_job_lease(job_id=job.id, owner="worker-b", db=db_session, due_only=True, now=later), (
+        "An expired lease should be claimable by another worker."
+    )
+    db_session.refresh(job)
+    [run] = db_session.query(ScheduledJobRun).filter(ScheduledJobRun.job_id == job.id).all()
+    assert (job.lease_owner, run.status) == ("worker-b", "FAILED"), (
+        "The new owner should hold the lease and close the run abandoned by the expired worker."
+    )
+
+
+def test_run_due_jobs_executes_under_lease_and_releases_it(db_session: Session) -> None:
+    """A claimed job should run once, reschedule itself and leave no lease behind."""
+    job = _due_job(db_session)
+
+    assert run_due_jobs(db=db_session, owner="worker-a") == 1, "The due job should be executed."
+    assert run_due_jobs(db=db_session, owner="worker-b") == 0, "A rescheduled job should not run again right away."
+    db_session.refresh(job)
+    runs = db_session.query(ScheduledJobRun).filter(ScheduledJobRun.job_id == job.id).all()
+    assert [run.status for run in runs] == ["SUCCESS"], "Exactly one successful run should be recorded."
+    assert (job.lease_owner, job.lease_expires_at) == (None, None), "The lease should be released after the run."
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.features.scheduler import service as scheduler_service
+from app.features.scheduler.jobs import SchedulerJobResult
+from app.features.scheduler.service import ensure_registered_jobs, run_due_jobs, trigger_scheduled_job
+from app.models import ScheduledJob, ScheduledJobRun
+
+_JOB_KEY = "medical_values.renormalization"
+
+
+def _failing_handler(_: Session, __: datetime):  # noqa: ANN202
+    raise RuntimeError("dependency unavailable")
+
+
+def _succeeding_handler(_: Session, __: datetime) -> SchedulerJobResult:
+    return SchedulerJobResult(summary="ok", metrics={})
+
+
+def _run_now(db_session: Session, job: ScheduledJob) -> timedelta:
+    job.next_run_at = datetime.now(UTC) - timedelta(seconds=1)
+    db_session.commit()
+    assert run_due_jobs(db=db_session) == 1, "The due job should be executed."
+    db_session.refresh(job)
+    next_run_at = job.next_run_at if job.next_run_at.tzinfo else job.next_run_at.replace(tzinfo=UTC)
+    return next_run_at - datetime.now(UTC)
+
+
+def _only_job(db_session: Session) -> ScheduledJob:
+    ensure_registered_jobs(db=db_session)
+    db_session.query(ScheduledJob).filter(ScheduledJob.job_key != _JOB_KEY).update({"is_enabled": False})
+    job = db_session.query(ScheduledJob).filter(ScheduledJob.job_key == _JOB_KEY).one()
+    job.is_enabled = True
+    job.max_retries = 2
+    job.retry_delay_seconds = 20
+    job.interval_seconds = 600
+    return job
+
+
+def test_failed_scheduled_runs_retry_with_backoff_under_one_correlation(
+    db_session: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Failures should be retried after a jittered, doubling delay until `max_retries` is used up."""
+    monkeypatch.setitem(scheduler_service.JOB_HANDLERS, _JOB_KEY, _failing_handler)
+    job = _only_job(db_session)
+
+    delays = [_run_now(db_session, job) for _ in range(4)]
+
+    runs = db_session.query(ScheduledJobRun).filter(ScheduledJobRun.job_id == job.id).order_by(ScheduledJobRun.id).all()
+    assert [(run.trigger_type, run.attempt) for run in runs] == [
+        ("SCHEDULED", 1),
+        ("RETRY", 2),
+        ("RETRY", 3),
+        ("SCHEDULED", 1),
+    ], "Retries should count attempts and the run after the last retry should start over."
+    assert runs[0].correlation_id == runs[1].correlation_id == runs[2].correlation_id != runs[3].correlation_id, (
+        "Retry attempts should share the correlation id of the run they retry."
+    )
+    assert timedelta(seconds=9) <= delays[0] <= timedelta(seconds=20), f"First retry should wait 10-20s, got {delays[0]}."
+    assert timedelta(seconds=19) <= delays[1] <= timedelta(seconds=40), f"Second retry should wait 20-40s, got {delays[1]}."
+    assert delays[2] > timedelta(seconds=590), "After the last retry the job should wait its regular interval."
+
+
+def test_manual_run_supersedes_pending_retry(db_session: Session, monkeypatch: pytest.MonkeyPatch, user_factory) -> None:  # noqa: ANN001
+    """A manual run after a failure should drop the pending retry and put the job back on its regular interval."""
+    actor = user_factory(ext_id="SCHEDULER_ADMIN")
+    monkeypatch.setitem(scheduler_service.JOB_HANDLERS, _JOB_KEY, _failing_handler)
+    job = _only_job(db_session)
+    retry_delay = _run_now(db_session, job)
+    assert retry_delay <= timedelta(seconds=20), "The failed scheduled run should schedule a retry."
+
+    monkeypatch.setitem(scheduler_service.JOB_HANDLERS, _JOB_KEY, _succeeding_handler)
+    manual = trigger_scheduled_job(job_key=_JOB_KEY, changed_by_id=actor.id, db=db_session)
+    assert manual.status == "SUCCESS", "The manual run should succeed."
+    db_session.refresh(job)
+    next_run_at = job.next_run_at if job.next_run_at.tzinfo else job.next_run_at.replace(tzinfo=UTC)
+    assert next_run_at - datetime.now(UTC) > timedelta(seconds=590), "The manual run should cancel the pending retry."
+
+    _run_now(db_session, job)
+    runs = db_session.query(ScheduledJobRun).filter(ScheduledJobRun.job_id == job.id).order_by(ScheduledJobRun.id).all()
+    assert [(run.trigger_type, run.attempt) for run in runs] == [
+        ("SCHEDULED", 1),
+        ("MANUAL", 1),
+        ("SCHEDULED", 1),
+    ], "The next scheduled run should start a new correlation instead of retrying the superseded failure."
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy.orm import Session
+
+from app.features.scheduler import compact_scheduled_job_runs, list_scheduled_job_daily_stats
+from app.models import ScheduledJob, ScheduledJobRun, ScheduledJobRunDaily
+
+
+def _run(job: ScheduledJob, started_at: datetime, *, status: str = "SUCCESS", duration_ms: int = 100) -> ScheduledJobRun:
+    return ScheduledJobRun(
+        job_id=job.id,
+        trigger_type="SCHEDULED",
+        status=status,
+        started_at=started_at,
+        finished_at=started_at + timedelta(milliseconds=duration_ms),
+        duration_ms=duration_ms,
+    )
+
+
+def test_retention_aggregates_completed_days_and_keeps_recent_runs_and_failures(db_session: Session) -> None:
+    """Old runs should be rolled into daily rows; the latest runs, recent failures and today stay detailed."""
+    now = datetime.now(UTC).replace(hour=12, minute=0, second=0, microsecond=0)
+    job = ScheduledJob(job_key="ut.retention", name="Retention", interval_seconds=900)
+    db_session.add(job)
+    db_session.commit()
+    old_day = (now - timedelta(days=60)).replace(hour=8)
+    db_session.add_all(
+        [_run(job, old_day + timedelta(minutes=index), duration_ms=(index + 1) * 10) for index in range(19)]
+        + [_run(job, old_day + timedelta(minutes=30), status="FAILED", duration_ms=1000)]
+        + [_run(job, now - timedelta(days=2), status="FAILED")]
+        + [_run(job, now - timedelta(days=1, minutes=index)) for index in range(3)]
+        + [_run(job, now - timedelta(hours=1))]
+    )
+    db_session.commit()
+
+    result = compact_scheduled_job_runs(db=db_session, now=now, keep_last=3, failure_days=30)
+
+    assert (result.days_aggregated, result.runs_aggregated, result.runs_deleted) == (3, 24, 21), (
+        f"Three completed days should be aggregated and the older runs pruned, got {result.metrics()}."
+    )
+    daily = {row.run_date: row for row in db_session.query(ScheduledJobRunDaily).all()}
+    old = daily[old_day.date()]
+    assert (old.run_count, old.success_count, old.failed_count, old.success_rate) == (20, 19, 1, 0.95), (
+        "The daily row should count runs and outcomes."
+    )
+    assert (old.duration_p50_ms, old.duration_p95_ms, old.duration_max_ms) == (100, 190, 1000), (
+        "Duration percentiles should use the nearest rank over the day's runs."
+    )
+    remaining = db_session.query(ScheduledJobRun).filter(ScheduledJobRun.job_id == job.id).count()
+    assert remaining == 4, "Today's run, the latest runs and the recent failure should be kept."
+
+    again = compact_scheduled_job_runs(db=db_session, now=now, keep_last=3, failure_days=30)
+    assert (again.days_aggregated, again.runs_deleted) == (0, 0), "A second pass should not aggregate a day twice."
+    stats = list_scheduled_job_daily_stats(job_key=job.job_key, db=db_session, days=90)
+    assert [row.run_date for row in stats] == sorted(daily, reverse=True), "Aggregates should be listed newest first."
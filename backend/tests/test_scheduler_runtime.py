@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import anyio
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.features.scheduler import SchedulerRuntime, set_scheduled_job_enabled
+from app.features.scheduler.service import ensure_registered_jobs
+from app.models import ScheduledJob, ScheduledJobRun
+
+_JOB_KEY = "medical_values.renormalization"
+
+
+def test_idle_runtime_sleeps_until_woken_by_enabling_a_job(db_session: Session, user_factory) -> None:  # noqa: ANN001
+    """Without enabled jobs the runtime should issue no queries, and enabling a job should wake it."""
+    admin = user_factory(ext_id="UT_SCHEDULER_ADMIN")
+    ensure_registered_jobs(db=db_session)
+    db_session.query(ScheduledJob).update({"is_enabled": False, "next_run_at": None})
+    # Kept when the job is enabled again, so it is due right away.
+    db_session.query(ScheduledJob).filter(ScheduledJob.job_key == _JOB_KEY).update(
+        {"next_run_at": datetime.now(UTC) - timedelta(seconds=1)}
+    )
+    db_session.commit()
+    statements: list[str] = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany) -> None:  # noqa: ANN001, ARG001
+        statements.append(statement)
+
+    async def _run() -> int:
+        runtime = SchedulerRuntime(max_workers=1)
+        await runtime.start()
+        try:
+            await asyncio.sleep(0.5)
+            engine = db_session.get_bind()
+            event.listen(engine, "before_cursor_execute", _capture)
+            try:
+                await asyncio.sleep(1.5)
+            finally:
+                event.remove(engine, "before_cursor_execute", _capture)
+            idle_statements = len(statements)
+
+            await anyio.to_thread.run_sync(
+                lambda: set_scheduled_job_enabled(job_key=_JOB_KEY, is_enabled=True, changed_by_id=admin.id, db=db_session)
+            )
+            for _ in range(50):
+                await asyncio.sleep(0.1)
+                if db_session.query(ScheduledJobRun).filter(ScheduledJobRun.status != "RUNNING").count():
+                    break
+            return idle_statements
+        finally:
+            await runtime.stop()
+
+    idle_statements = asyncio.run(_run())
+
+    assert idle_statements == 0, f"An idle runtime should not poll the database, got {idle_statements} statement(s)."
+    assert [run.status for run in db_session.query(ScheduledJobRun).all()] == ["SUCCESS"], (
+        "Enabling a due job should wake the runtime and run it once."
+    )
@@ -262,12 +262,29 @@ export interface ScheduledJob {
   last_started_at: string | null;
   last_finished_at: string | null;
   last_status: string | null;
+  lease_owner: string | null;
+  lease_expires_at: string | null;
   changed_by_id: number | null;
   changed_by_user: AppUser | null;
   created_at: string;
   updated_at: string | null;
 }
 
+export interface ScheduledJobRunDaily {
+  id: number;
+  job_id: number;
+  run_date: string;
+  run_count: number;
+  success_count: number;
+  failed_count: number;
+  success_rate: number;
+  duration_p50_ms: number | null;
+  duration_p95_ms: number | null;
+  duration_max_ms: number | null;
+  created_at: string;
+  updated_at: string | null;
+}
+
 export interface ScheduledJobRun {
   id: number;
   job_id: number;
@@ -537,6 +554,8 @@ export const adminSchedulerApi = {
     request<ScheduledJob[]>('/admin/scheduler/jobs'),
   listScheduledJobRuns: (jobKey: string, limit = 50) =>
     request<ScheduledJobRun[]>(`/admin/scheduler/jobs/${encodeURIComponent(jobKey)}/runs?limit=${limit}`),
+  listScheduledJobDailyStats: (jobKey: string, days = 30) =>
+    request<ScheduledJobRunDaily[]>(`/admin/scheduler/jobs/${encodeURIComponent(jobKey)}/daily-stats?days=${days}`),
   triggerScheduledJob: (jobKey: string, correlationId?: string) =>
     request<ScheduledJobRun>(`/admin/scheduler/jobs/${encodeURIComponent(jobKey)}/trigger`, {
       method: 'POST',
@@ -101,7 +101,7 @@ export type {
 export { favoritesApi } from './favorites';
 export type { Favorite, FavoriteCreate, FavoriteTypeKey } from './favorites';
 export { informationApi } from './information';
-export type { Information, InformationCreate, InformationUpdate } from './information';
+export type { Information, InformationCreate, InformationFeedPage, InformationFeedParams, InformationUpdate } from './information';
 export { reportsApi } from './reports';
 export type {
   ReportSourceKey,
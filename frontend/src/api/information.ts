@@ -16,6 +16,19 @@ export interface Information {
   current_user_read_at: string | null;
 }
 
+export interface InformationFeedPage {
+  items: Information[];
+  next_cursor: string | null;
+  unread_count: number;
+}
+
+export interface InformationFeedParams {
+  cursor?: string | null;
+  limit?: number;
+  include_future?: boolean;
+  include_withdrawn?: boolean;
+}
+
 export interface InformationCreate {
   context_id?: number | null;
   context_ids?: number[];
@@ -36,6 +49,16 @@ export interface InformationUpdate {
 
 export const informationApi = {
   listInformation: () => request<Information[]>('/information/'),
+  listInformationFeed: (params: InformationFeedParams = {}) => {
+    const query = new URLSearchParams();
+    if (params.cursor) query.set('cursor', params.cursor);
+    if (params.limit !== undefined) query.set('limit', String(params.limit));
+    if (params.include_future !== undefined) query.set('include_future', String(params.include_future));
+    if (params.include_withdrawn !== undefined) query.set('include_withdrawn', String(params.include_withdrawn));
+    const suffix = query.toString();
+    return request<InformationFeedPage>(`/information/feed${suffix ? `?${suffix}` : ''}`);
+  },
+  getInformationUnreadCount: () => request<{ unread_count: number }>('/information/unread-count'),
   createInformation: (payload: InformationCreate) =>
     request<Information>('/information/', {
       method: 'POST',
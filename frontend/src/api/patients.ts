@@ -371,6 +371,20 @@ export interface PatientListItem {
   }[];
 }
 
+export interface PatientListParams {
+  q?: string;
+  organ_id?: number;
+  has_open_episode?: boolean;
+  resp_coord_id?: number;
+  cursor?: string | null;
+  limit?: number;
+}
+
+export interface PatientListPage {
+  items: PatientListItem[];
+  next_cursor: string | null;
+}
+
 export interface PatientCreate {
   pid: string;
   first_name: string;
@@ -398,6 +412,16 @@ export interface PatientUpdate {
 
 export const patientsApi = {
   listPatients: () => request<PatientListItem[]>('/patients/'),
+  searchPatients: (params?: PatientListParams) => {
+    const query = new URLSearchParams();
+    if (params?.q) query.set('q', params.q);
+    if (params?.organ_id !== undefined) query.set('organ_id', String(params.organ_id));
+    if (params?.has_open_episode !== undefined) query.set('has_open_episode', params.has_open_episode ? 'true' : 'false');
+    if (params?.resp_coord_id !== undefined) query.set('resp_coord_id', String(params.resp_coord_id));
+    if (params?.cursor) query.set('cursor', params.cursor);
+    if (params?.limit !== undefined) query.set('limit', String(params.limit));
+    return request<PatientListPage>(`/patients/page${query.toString() ? `?${query.toString()}` : ''}`);
+  },
   getPatient: (id: number) => request<Patient>(`/patients/${id}`),
   createPatient: (data: PatientCreate) =>
     request<Patient>('/patients/', { method: 'POST', body: JSON.stringify(data) }),
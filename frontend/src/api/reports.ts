@@ -1,9 +1,10 @@
 import { request } from './core';
 
-export type ReportSourceKey = 'PATIENT' | 'EPISODE' | 'MEDICAL_VALUE' | 'COORDINATION';
+export type ReportSourceKey = 'PATIENT' | 'EPISODE' | 'MEDICAL_VALUE' | 'COORDINATION' | 'COORDINATION_PROCUREMENT';
 export type ReportValueType = 'string' | 'number' | 'date' | 'datetime' | 'boolean';
 export type ReportOperatorKey = 'eq' | 'contains' | 'gte' | 'lte';
 export type ReportSortDirection = 'asc' | 'desc';
+export type ReportAggregateFunction = 'count' | 'min' | 'max' | 'avg' | 'count_distinct';
 
 export interface ReportFieldOption {
   key: string;
@@ -40,6 +41,11 @@ export interface ReportSortInput {
   direction: ReportSortDirection;
 }
 
+export interface ReportAggregateInput {
+  function: ReportAggregateFunction;
+  field?: string | null;
+}
+
 export interface ReportExecuteRequest {
   source: ReportSourceKey;
   select: string[];
@@ -47,6 +53,10 @@ export interface ReportExecuteRequest {
   filters: ReportFilterInput[];
   sort: ReportSortInput[];
   limit: number;
+  cursor?: string | null;
+  include_total?: boolean;
+  group_by?: string[];
+  aggregates?: ReportAggregateInput[];
 }
 
 export interface ReportColumn {
@@ -59,6 +69,8 @@ export interface ReportExecuteResponse {
   columns: ReportColumn[];
   rows: Record<string, string>[];
   row_count: number;
+  next_cursor: string | null;
+  total_count: number | null;
 }
 
 export const reportsApi = {
@@ -12,8 +12,8 @@ export function useInformationUnreadCount(enabled: boolean) {
       return;
     }
     try {
-      const rows = await api.listInformation();
-      setUnreadCount(rows.filter((row) => !row.current_user_read_at).length);
+      const { unread_count: count } = await api.getInformationUnreadCount();
+      setUnreadCount(count);
     } catch {
       setUnreadCount(0);
     }
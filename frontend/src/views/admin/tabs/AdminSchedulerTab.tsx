@@ -162,7 +162,7 @@ export default function AdminSchedulerTab({
                     <td>{formatDateTimeDdMmYyyy(run.started_at)}</td>
                     <td>{formatDateTimeDdMmYyyy(run.finished_at)}</td>
                     <td>{run.status}</td>
-                    <td>{run.trigger_type}</td>
+                    <td>{run.attempt > 1 ? `${run.trigger_type} #${run.attempt}` : run.trigger_type}</td>
                     <td>{run.duration_ms ?? t('common.emptySymbol', '–')}</td>
                     <td>{run.summary || t('common.emptySymbol', '–')}</td>
                     <td><code>{parseMetrics(run.metrics_json)}</code></td>